@@ -34,6 +34,15 @@ GOOGLE_OAUTH_CLIENT_ID = os.getenv("GOOGLE_OAUTH_CLIENT_ID")
 GOOGLE_OAUTH_CLIENT_SECRET = os.getenv("GOOGLE_OAUTH_CLIENT_SECRET")
 GOOGLE_OAUTH_REDIRECT_URI = os.getenv("GOOGLE_OAUTH_REDIRECT_URI")
 
+# -----------------------------
+# Transaction archive
+# -----------------------------
+
+# Transactions posted more than this many days ago may be moved to the archive
+# table by `manage.py archive_transactions`. Only ever raise it after moving
+# archived rows back: reads skip the archive for ranges newer than the horizon.
+TRANSACTION_ARCHIVE_AFTER_DAYS = int(os.getenv("TRANSACTION_ARCHIVE_AFTER_DAYS", 730))
+
 
 
 # Quick-start development settings - unsuitable for production
@@ -56,6 +65,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'django.contrib.postgres',
     'django_cotton.apps.SimpleAppConfig',
     'django.contrib.staticfiles',
     'django_htmx',
@@ -125,6 +135,23 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "fragments": {
+        "BACKEND": os.getenv("FRAGMENT_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("FRAGMENT_CACHE_LOCATION", "homemanage-fragments"),
+    },
+}
+
+# Cache alias holding rendered account and bill-pay table rows (financial/fragments.py).
+FRAGMENT_CACHE_ALIAS = os.getenv("FRAGMENT_CACHE_ALIAS", "fragments")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -1,14 +1,36 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import Transaction, Account, MonthlyBillPaymentCalendarLink
+from .models import Transaction, Account, ArchivedTransaction, CategorizationRule, MonthlyBillPaymentCalendarLink, RecurringTransaction
 @admin.register(Transaction)
 class TransactionAdmin(admin.ModelAdmin):
     list_display = ('id', 'account', 'amount', 'transaction_type', 'description')
 
+@admin.register(ArchivedTransaction)
+class ArchivedTransactionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'account', 'posted_on', 'amount', 'transaction_type', 'description', 'archived_at')
+
+    # Archived rows still count towards ledgers and rollups, which admin edits would bypass.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 @admin.register(Account)
 class AccountAdmin(admin.ModelAdmin):
-    list_display = ('id', 'user', 'household', 'name', 'institution', 'account_type', 'status', 'current_balance')
+    list_display = ('id', 'user', 'household', 'name', 'institution', 'account_type', 'status', 'current_balance', 'ledger_balance')
+
+@admin.register(RecurringTransaction)
+class RecurringTransactionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'account', 'description', 'transaction_type', 'amount', 'frequency', 'interval', 'next_occurrence', 'is_active')
+
+@admin.register(CategorizationRule)
+class CategorizationRuleAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'category', 'match_type', 'pattern', 'min_amount', 'max_amount', 'priority')
 
 @admin.register(MonthlyBillPaymentCalendarLink)
 class MonthlyBillPaymentCalendarLinkAdmin(admin.ModelAdmin):
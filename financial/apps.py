@@ -1,5 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _ensure_search_index(sender, using="default", **kwargs):
+    from financial.services.search import ensure_sqlite_search_index
+
+    ensure_sqlite_search_index(using)
 
 
 class FinancialConfig(AppConfig):
     name = 'financial'
+
+    def ready(self):
+        post_migrate.connect(_ensure_search_index, sender=self)
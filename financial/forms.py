@@ -3,6 +3,7 @@ from decimal import Decimal
 from django import forms
 
 from financial.models import Account, AccountStatus, Category, MonthlyBillPayment, Transaction, TransactionType
+from financial.services.categorization import rules_matcher_for_user
 
 
 class AccountImportForm(forms.Form):
@@ -31,6 +32,27 @@ class AccountImportForm(forms.Form):
         return uploaded_file
 
 
+class TransactionImportForm(forms.Form):
+    """Bank statement CSV upload for a single account."""
+
+    MAX_FILE_SIZE_BYTES = 20 * 1024 * 1024
+
+    import_file = forms.FileField(
+        label="Statement CSV",
+        widget=forms.ClearableFileInput(attrs={"accept": ".csv", "class": "file-input file-input-bordered w-full"}),
+    )
+
+    def clean_import_file(self):
+        uploaded_file = self.cleaned_data.get("import_file")
+        if uploaded_file is None:
+            return uploaded_file
+        if uploaded_file.size > self.MAX_FILE_SIZE_BYTES:
+            raise forms.ValidationError("Statement file must be 20 MB or smaller.")
+        if not uploaded_file.name.lower().endswith(".csv"):
+            raise forms.ValidationError("Upload a CSV file.")
+        return uploaded_file
+
+
 class AccountForm(forms.ModelForm):
     """Model-backed form used for create/edit flows."""
 
@@ -232,6 +254,19 @@ class TransactionForm(forms.ModelForm):
             raise forms.ValidationError("Amount must be greater than 0.")
         return amount
 
+    def clean(self):
+        cleaned_data = super().clean()
+        if (
+            self._user is not None
+            and self.instance._state.adding
+            and cleaned_data.get("category") is None
+            and cleaned_data.get("description")
+        ):
+            category_id = rules_matcher_for_user(self._user.pk).match(cleaned_data["description"], cleaned_data.get("amount"))
+            if category_id is not None:
+                cleaned_data["category"] = self.fields["category"].queryset.filter(pk=category_id).first()
+        return cleaned_data
+
 
 class BillPayRowForm(forms.ModelForm):
     class Meta:
@@ -315,3 +350,103 @@ class CategoryForm(forms.ModelForm):
         if conflict_qs.exists():
             raise forms.ValidationError("You already have a category with this name.")
         return name
+
+
+BULK_ENTRY_DEFAULT_ROWS = 10
+BULK_ENTRY_MAX_ROWS = 200
+
+
+class BulkTransactionRowForm(forms.Form):
+    """One grid row; choices are precomputed once per request and shared by every row."""
+
+    posted_on = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    description = forms.CharField(max_length=255, error_messages={"required": "Enter a description."})
+    transaction_type = forms.ChoiceField()
+    amount = forms.DecimalField(max_digits=10, decimal_places=2)
+    category = forms.ChoiceField(required=False)
+
+    def __init__(self, *args, transaction_type_choices=(), category_choices=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["transaction_type"].choices = transaction_type_choices
+        self.fields["category"].choices = [("", "Uncategorized"), *category_choices]
+        for field in self.fields.values():
+            if isinstance(field, forms.ChoiceField):
+                css_class = "select select-bordered select-sm w-full"
+            else:
+                css_class = "input input-bordered input-sm w-full"
+            field.widget.attrs.update({"class": css_class, "aria-label": field.label})
+        self.fields["amount"].widget.attrs.update({"min": "0.01", "step": "0.01"})
+
+    def clean_description(self):
+        description = (self.cleaned_data.get("description") or "").strip()
+        if not description:
+            raise forms.ValidationError("Enter a description.")
+        return description
+
+    def clean_amount(self):
+        amount = self.cleaned_data.get("amount")
+        if amount is None:
+            return amount
+        if amount <= Decimal("0"):
+            raise forms.ValidationError("Amount must be greater than 0.")
+        return amount
+
+
+BulkTransactionFormSet = forms.formset_factory(
+    BulkTransactionRowForm,
+    extra=BULK_ENTRY_DEFAULT_ROWS - 1,
+    min_num=1,
+    validate_min=True,
+    max_num=BULK_ENTRY_MAX_ROWS,
+    validate_max=True,
+    absolute_max=BULK_ENTRY_MAX_ROWS,
+)
+
+
+class TransferForm(forms.Form):
+    """Move money from the current account into another account in its household."""
+
+    to_account = forms.ModelChoiceField(queryset=Account.objects.none(), label="To account", empty_label="Select an account")
+    posted_on = forms.DateField(label="Posted on", widget=forms.DateInput(attrs={"type": "date"}))
+    amount = forms.DecimalField(max_digits=10, decimal_places=2)
+    description = forms.CharField(max_length=255, required=False)
+
+    def __init__(self, *args, from_account, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["to_account"].queryset = (
+            Account.objects.filter(household_id=from_account.household_id)
+            .exclude(pk=from_account.pk)
+            .exclude(status=AccountStatus.CLOSED)
+            .order_by("name")
+        )
+        for name, field in self.fields.items():
+            css_class = "select select-bordered w-full" if name == "to_account" else "input input-bordered w-full"
+            field.widget.attrs.update({"class": css_class})
+        self.fields["amount"].widget.attrs.update({"min": "0.01", "step": "0.01"})
+        self.fields["description"].widget.attrs.update({"placeholder": "Transfer"})
+
+    def clean_description(self):
+        return (self.cleaned_data.get("description") or "").strip()
+
+    def clean_amount(self):
+        amount = self.cleaned_data.get("amount")
+        if amount is None:
+            return amount
+        if amount <= Decimal("0"):
+            raise forms.ValidationError("Amount must be greater than 0.")
+        return amount
+
+
+def bulk_transaction_formset(account, user, data=None) -> BulkTransactionFormSet:
+    category_choices = [
+        (str(pk), name)
+        for pk, name in Category.objects.filter(user=user).order_by("name").values_list("pk", "name")
+    ]
+    return BulkTransactionFormSet(
+        data,
+        prefix="rows",
+        form_kwargs={
+            "transaction_type_choices": TransactionType.allowed_for_account(account.account_type),
+            "category_choices": category_choices,
+        },
+    )
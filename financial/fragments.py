@@ -0,0 +1,100 @@
+"""Cache for rendered table-row fragments.
+
+Rows are cached under a key built from the row kind, the object id and a
+version string (normally the object's ``updated_at``), so an edit makes the old
+entry unreachable; saves and deletes also drop it explicitly. Entries live in
+the ``settings.FRAGMENT_CACHE_ALIAS`` cache. Hit and miss counters are kept in
+the same cache, so a shared backend reports totals for every process.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable, TypeVar
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+ACCOUNT_ROW_FRAGMENT = "account-row"
+BILL_PAY_ROW_FRAGMENT = "bill-pay-row"
+FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+_HITS_KEY = "financial:fragments:hits"
+_MISSES_KEY = "financial:fragments:misses"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class FragmentCacheStats:
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def fragment_cache():
+    return caches[getattr(settings, "FRAGMENT_CACHE_ALIAS", "default")]
+
+
+def fragment_version(value) -> str:
+    """Key-safe form of a version value; datetimes become ISO 8601 (no spaces, unlike ``str()``)."""
+
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def fragment_key(kind: str, object_id, version) -> str:
+    return f"financial:fragment:{kind}:{object_id}:{fragment_version(version)}"
+
+
+def cached_fragments(items: Iterable[T], *, key: Callable[[T], str], render: Callable[[T], R]) -> list[R]:
+    """``render(item)`` for every item, reading and filling the cache in one round trip each."""
+
+    items = list(items)
+    keys = [key(item) for item in items]
+    cache = fragment_cache()
+    found = cache.get_many(keys)
+    missing: dict[str, R] = {}
+    fragments = []
+    for item, item_key in zip(items, keys):
+        fragment = found.get(item_key)
+        if fragment is None:
+            fragment = missing[item_key] = render(item)
+        fragments.append(fragment)
+    if missing:
+        cache.set_many(missing, FRAGMENT_CACHE_TIMEOUT)
+    _count(_HITS_KEY, len(keys) - len(missing))
+    _count(_MISSES_KEY, len(missing))
+    return fragments
+
+
+def invalidate_fragment(kind: str, object_id, version) -> None:
+    fragment_cache().delete(fragment_key(kind, object_id, version))
+
+
+def _count(counter_key: str, amount: int) -> None:
+    if not amount:
+        return
+    cache = fragment_cache()
+    try:
+        cache.incr(counter_key, amount)
+    except ValueError:
+        # First lookup since the counters were reset; another process may race us to it.
+        cache.add(counter_key, 0, None)
+        cache.incr(counter_key, amount)
+
+
+def fragment_cache_stats() -> FragmentCacheStats:
+    counters = fragment_cache().get_many([_HITS_KEY, _MISSES_KEY])
+    return FragmentCacheStats(hits=counters.get(_HITS_KEY, 0), misses=counters.get(_MISSES_KEY, 0))
+
+
+def reset_fragment_cache_stats() -> None:
+    fragment_cache().delete_many([_HITS_KEY, _MISSES_KEY])
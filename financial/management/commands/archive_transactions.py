@@ -0,0 +1,41 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from financial.services.archive import ARCHIVE_BATCH_SIZE, archive_transactions
+
+
+class Command(BaseCommand):
+    help = "Move transactions posted before the archive horizon into the archive table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            help="Archive transactions posted before this date (YYYY-MM-DD). Defaults to the archive horizon.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="Transactions moved per atomic batch.",
+        )
+
+    def handle(self, *args, **options):
+        before = None
+        if options["before"]:
+            try:
+                before = date.fromisoformat(options["before"])
+            except ValueError as exc:
+                raise CommandError("--before must be a date in YYYY-MM-DD format.") from exc
+
+        try:
+            result = archive_transactions(before=before, batch_size=options["batch_size"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {result.transactions} transactions posted before {result.before.isoformat()} "
+                f"in {result.batches} batches."
+            )
+        )
@@ -0,0 +1,100 @@
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+
+from financial.ids import uuid7
+
+
+TABLE = "financial_benchmark_primary_keys"
+PK_INDEX = f"{TABLE}_pkey"
+ACCOUNT_INDEX = f"{TABLE}_acct_posted_created_id"
+KEY_FACTORIES = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+def _index_bytes(index_name: str) -> int | None:
+    """On-disk size of ``index_name``, or ``None`` when the backend can't report it."""
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT pg_relation_size(%s::regclass)", [index_name])
+            return cursor.fetchone()[0]
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s", [index_name])
+            except Exception:
+                return None
+            return cursor.fetchone()[0]
+    return None
+
+
+def _megabytes(size: int | None) -> str:
+    return "n/a" if size is None else f"{size / 1_048_576:.1f}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare insert throughput and index size of uuid4 and uuid7 primary keys on a scratch table "
+        "shaped like financial_transaction's (account, posted_on, created_at, id) index"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--accounts", type=int, default=50, help="Distinct accounts the rows are spread over.")
+
+    def handle(self, *args, **options):
+        uuid_type = models.UUIDField().db_type(connection)
+        self.stdout.write(
+            f"{'keys':>6}  {'rows':>9}  {'seconds':>8}  {'rows/s':>9}  {'pkey MB':>8}  {'account index MB':>16}"
+        )
+        for name, key_factory in KEY_FACTORIES.items():
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+                cursor.execute(
+                    f"CREATE TABLE {TABLE} ("
+                    f"id {uuid_type} NOT NULL CONSTRAINT {PK_INDEX} PRIMARY KEY, "
+                    f"account_id {uuid_type} NOT NULL, posted_on date NOT NULL, "
+                    f"created_at timestamp NOT NULL, amount bigint NOT NULL)"
+                )
+                cursor.execute(f"CREATE INDEX {ACCOUNT_INDEX} ON {TABLE} (account_id, posted_on, created_at, id)")
+            try:
+                seconds = self._fill(key_factory, options["rows"], options["batch_size"], options["accounts"])
+                # SQLite names the primary key's implicit index itself.
+                pk_index = PK_INDEX if connection.vendor == "postgresql" else f"sqlite_autoindex_{TABLE}_1"
+                pk_bytes, account_bytes = _index_bytes(pk_index), _index_bytes(ACCOUNT_INDEX)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE {TABLE}")
+            self.stdout.write(
+                f"{name:>6}  {options['rows']:>9}  {seconds:>8.2f}  {options['rows'] / seconds:>9.0f}  "
+                f"{_megabytes(pk_bytes):>8}  {_megabytes(account_bytes):>16}"
+            )
+
+    def _fill(self, key_factory, rows: int, batch_size: int, accounts: int) -> float:
+        uuid_field = models.UUIDField()
+        account_ids = [uuid_field.get_db_prep_value(uuid.uuid4(), connection) for _ in range(accounts)]
+        first_day = date(2000, 1, 1)
+        started_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        insert = f"INSERT INTO {TABLE} (id, account_id, posted_on, created_at, amount) VALUES (%s, %s, %s, %s, %s)"
+
+        elapsed = 0.0
+        for batch_start in range(0, rows, batch_size):
+            batch = [
+                (
+                    uuid_field.get_db_prep_value(key_factory(), connection),
+                    account_ids[idx % accounts],
+                    first_day + timedelta(days=idx // 2_000),
+                    started_at + timedelta(seconds=idx),
+                    -1234,
+                )
+                for idx in range(batch_start, min(batch_start + batch_size, rows))
+            ]
+            started = time.perf_counter()
+            # One commit per batch, like bulk_create.
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(insert, batch)
+            elapsed += time.perf_counter() - started
+        return elapsed
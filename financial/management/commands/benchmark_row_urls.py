@@ -0,0 +1,94 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from financial.services.routes import route_template
+
+
+ACCOUNT_ROW_ROUTES = (
+    "financial:accounts-preview",
+    "financial:accounts-detail",
+    "financial:accounts-edit",
+    "financial:accounts-delete-confirm",
+)
+TRANSACTION_ROW_ROUTE = "financial:account-transactions-edit"
+BILL_PAY_ROW_ROUTE = "financial:bill-pay-row"
+
+
+def _account_urls_reverse(ids):
+    for account_id, _ in ids:
+        for route in ACCOUNT_ROW_ROUTES:
+            reverse(route, args=[account_id])
+
+
+def _account_urls_template(ids):
+    templates = [route_template(route, 1) for route in ACCOUNT_ROW_ROUTES]
+    for account_id, _ in ids:
+        for template in templates:
+            template.format(account_id)
+
+
+def _transaction_urls_reverse(ids):
+    for account_id, transaction_id in ids:
+        reverse(TRANSACTION_ROW_ROUTE, args=[str(account_id), str(transaction_id)])
+
+
+def _transaction_urls_template(ids):
+    template = route_template(TRANSACTION_ROW_ROUTE, 2)
+    for account_id, transaction_id in ids:
+        template.format(account_id, transaction_id)
+
+
+def _bill_pay_urls_reverse(ids):
+    # The serializer used to reverse the same route for both the edit and save URLs.
+    for account_id, _ in ids:
+        f"{reverse(BILL_PAY_ROW_ROUTE, args=[account_id])}?month=2026-01"
+        f"{reverse(BILL_PAY_ROW_ROUTE, args=[account_id])}?month=2026-01"
+
+
+def _bill_pay_urls_template(ids):
+    template = route_template(BILL_PAY_ROW_ROUTE, 1)
+    for account_id, _ in ids:
+        f"{template.format(account_id)}?month=2026-01"
+
+
+SERIALIZERS = (
+    ("account rows", _account_urls_reverse, _account_urls_template),
+    ("transaction rows", _transaction_urls_reverse, _transaction_urls_template),
+    ("bill-pay rows", _bill_pay_urls_reverse, _bill_pay_urls_template),
+)
+
+
+def _best_of(repeat: int, build, ids) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(ids)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = "Compare per-row reverse() with precompiled route templates for the row serializers' URLs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000, help="Rows per serializer.")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is reported.")
+
+    def handle(self, *args, **options):
+        ids = [(uuid.uuid4(), uuid.uuid4()) for _ in range(options["rows"])]
+        # Warm both paths so the first measurement doesn't pay for building the resolver.
+        for _, with_reverse, with_template in SERIALIZERS:
+            with_reverse(ids[:1])
+            with_template(ids[:1])
+
+        self.stdout.write(f"{'serializer':<18}  {'rows':>8}  {'reverse() (s)':>14}  {'templates (s)':>14}  {'speedup':>8}")
+        for label, with_reverse, with_template in SERIALIZERS:
+            reverse_seconds = _best_of(options["repeat"], with_reverse, ids)
+            template_seconds = _best_of(options["repeat"], with_template, ids)
+            self.stdout.write(
+                f"{label:<18}  {len(ids):>8}  {reverse_seconds:>14.3f}  {template_seconds:>14.3f}  "
+                f"{reverse_seconds / template_seconds:>7.1f}x"
+            )
@@ -0,0 +1,108 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from financial.models import Account, AccountType, Category, Transaction, TransactionType
+from financial.services.transactions import (
+    serialize_transaction_rows,
+    serialize_transaction_values,
+    transaction_row_values,
+)
+from households.models import Household
+
+
+class _Rollback(Exception):
+    pass
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _timed(serialize) -> tuple[float, int]:
+    counter = _QueryCounter()
+    with connection.execute_wrapper(counter):
+        started = time.perf_counter()
+        serialize()
+        elapsed = time.perf_counter() - started
+    return elapsed, counter.count
+
+
+class Command(BaseCommand):
+    help = "Compare model-instance and values() transaction row serialization (data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Row counts to benchmark, in ascending order.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        row_counts = sorted(options["rows"])
+        try:
+            with transaction.atomic():
+                self._run(row_counts, options["batch_size"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, row_counts: list[int], batch_size: int) -> None:
+        user = get_user_model().objects.create_user(username="benchmark-transaction-rows")
+        household = Household.objects.create(name="Benchmark Household", slug="benchmark-transaction-rows", created_by=user)
+        account = Account.objects.create(
+            user=user,
+            household=household,
+            name="Benchmark Checking",
+            account_type=AccountType.CHECKING,
+        )
+        categories = Category.objects.bulk_create(
+            [Category(user=user, name=f"Benchmark Category {idx}") for idx in range(12)]
+        )
+
+        self.stdout.write(f"{'rows':>8}  {'instances (s)':>14}  {'queries':>8}  {'values() (s)':>13}  {'queries':>8}  {'speedup':>8}")
+        created = 0
+        for row_count in row_counts:
+            created = self._fill(account, household, categories, start=created, stop=row_count, batch_size=batch_size)
+            queryset = Transaction.objects.for_account(account).ordered()
+
+            instance_seconds, instance_queries = _timed(lambda: serialize_transaction_rows(queryset.all()))
+            values_seconds, values_queries = _timed(
+                lambda: serialize_transaction_values(transaction_row_values(queryset.all()))
+            )
+
+            self.stdout.write(
+                f"{row_count:>8}  {instance_seconds:>14.3f}  {instance_queries:>8}  "
+                f"{values_seconds:>13.3f}  {values_queries:>8}  {instance_seconds / values_seconds:>7.1f}x"
+            )
+
+    def _fill(self, account, household, categories, *, start: int, stop: int, batch_size: int) -> int:
+        first_day = date(2000, 1, 1)
+        for batch_start in range(start, stop, batch_size):
+            Transaction.objects.bulk_create(
+                [
+                    Transaction(
+                        account=account,
+                        household=household,
+                        posted_on=first_day + timedelta(days=idx // 20),
+                        description=f"Benchmark row {idx}",
+                        transaction_type=TransactionType.EXPENSE,
+                        amount=Decimal("-12.34"),
+                        category=categories[idx % len(categories)] if idx % 3 else None,
+                    )
+                    for idx in range(batch_start, min(batch_start + batch_size, stop))
+                ]
+            )
+        return stop
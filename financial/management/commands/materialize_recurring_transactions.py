@@ -0,0 +1,38 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from financial.services.recurring import materialize_recurring_transactions
+
+
+class Command(BaseCommand):
+    help = "Create transactions for every recurring schedule occurrence due on or before a date"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--through",
+            help="Last date to materialize (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Schedules materialized per bulk insert.",
+        )
+
+    def handle(self, *args, **options):
+        through = timezone.localdate()
+        if options["through"]:
+            try:
+                through = date.fromisoformat(options["through"])
+            except ValueError as exc:
+                raise CommandError("--through must be a date in YYYY-MM-DD format.") from exc
+
+        result = materialize_recurring_transactions(through=through, chunk_size=options["chunk_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Materialized {result.transactions} transactions from {result.schedules} recurring schedules."
+            )
+        )
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from financial.models import Account
+from financial.services.balances import rebuild_balance_snapshots
+
+
+class Command(BaseCommand):
+    help = "Rebuild monthly account balance snapshots from transactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Accounts rebuilt per aggregate query.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        accounts = Account.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+        rebuilt_accounts = 0
+        rebuilt_snapshots = 0
+        chunk: list = []
+        for account_id in accounts:
+            chunk.append(account_id)
+            if len(chunk) >= chunk_size:
+                rebuilt_snapshots += rebuild_balance_snapshots(chunk)
+                rebuilt_accounts += len(chunk)
+                chunk = []
+        if chunk:
+            rebuilt_snapshots += rebuild_balance_snapshots(chunk)
+            rebuilt_accounts += len(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rebuilt_snapshots} monthly snapshots for {rebuilt_accounts} accounts.")
+        )
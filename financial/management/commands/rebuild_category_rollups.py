@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from households.models import Household
+from financial.services.rollups import rebuild_category_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-category monthly rollups from transactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=50,
+            help="Households rebuilt per aggregate query.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        households = Household.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+        rebuilt_households = 0
+        rebuilt_rollups = 0
+        chunk: list = []
+        for household_id in households:
+            chunk.append(household_id)
+            if len(chunk) >= chunk_size:
+                rebuilt_rollups += rebuild_category_rollups(chunk)
+                rebuilt_households += len(chunk)
+                chunk = []
+        if chunk:
+            rebuilt_rollups += rebuild_category_rollups(chunk)
+            rebuilt_households += len(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rebuilt_rollups} category rollups for {rebuilt_households} households.")
+        )
@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from financial.models import CategorizationRule
+from financial.services.categorization import recategorize_history
+
+
+class Command(BaseCommand):
+    help = "Apply categorization rules to existing transactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Only re-categorize this username's transactions.",
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Also replace categories on rows that already have one when a rule matches.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Transactions updated per transaction block.",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = CategorizationRule.objects.order_by("user_id").values_list("user_id", flat=True).distinct()
+        if options["user"]:
+            user = get_user_model().objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"Unknown user {options['user']!r}.")
+            user_ids = user_ids.filter(user_id=user.pk)
+
+        users = 0
+        changed = 0
+        for user_id in list(user_ids):
+            changed += recategorize_history(user_id, overwrite=options["overwrite"], chunk_size=options["chunk_size"])
+            users += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Re-categorized {changed} transactions for {users} users."))
@@ -0,0 +1,91 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from financial.models import Account, ArchivedTransaction, Transaction, mark_households_changed
+
+
+class Command(BaseCommand):
+    help = "Recompute account ledger balances from transactions and report drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Overwrite drifted ledger balances with the recomputed value.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Accounts checked per aggregate query.",
+        )
+
+    def handle(self, *args, **options):
+        fix = options["fix"]
+        chunk_size = options["chunk_size"]
+        checked = 0
+        drifted = 0
+        households: set = set()
+
+        accounts = Account.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+        chunk: list = []
+        for account_id in accounts:
+            chunk.append(account_id)
+            if len(chunk) >= chunk_size:
+                chunk_checked, chunk_drifted = self._check_chunk(chunk, fix=fix, households=households)
+                checked += chunk_checked
+                drifted += chunk_drifted
+                chunk = []
+        if chunk:
+            chunk_checked, chunk_drifted = self._check_chunk(chunk, fix=fix, households=households)
+            checked += chunk_checked
+            drifted += chunk_drifted
+
+        summary = f"Checked {checked} accounts across {len(households)} households; {drifted} drifted."
+        if drifted and not fix:
+            self.stdout.write(self.style.WARNING(f"{summary} Re-run with --fix to repair."))
+        elif drifted:
+            self.stdout.write(self.style.SUCCESS(f"{summary} Repaired."))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
+
+    def _check_chunk(self, account_ids: list, *, fix: bool, households: set) -> tuple[int, int]:
+        drifted = 0
+        with transaction.atomic():
+            accounts = Account.objects.filter(pk__in=account_ids).order_by("pk")
+            if fix:
+                accounts = accounts.select_for_update()
+            stored = {
+                pk: (household_id, name, ledger_balance)
+                for pk, household_id, name, ledger_balance in accounts.values_list(
+                    "pk", "household_id", "name", "ledger_balance"
+                )
+            }
+            totals: dict = defaultdict(Decimal)
+            for model in (Transaction, ArchivedTransaction):
+                for account_id, total in (
+                    model.objects.filter(account_id__in=account_ids)
+                    .order_by()
+                    .values("account_id")
+                    .annotate(total=Sum("amount"))
+                    .values_list("account_id", "total")
+                ):
+                    totals[account_id] += total
+            for account_id, (household_id, name, ledger_balance) in stored.items():
+                households.add(household_id)
+                expected = totals.get(account_id) or Decimal("0.00")
+                if expected == ledger_balance:
+                    continue
+                drifted += 1
+                self.stdout.write(
+                    f"{household_id} / {name} ({account_id}): stored {ledger_balance}, "
+                    f"recomputed {expected}, drift {ledger_balance - expected}"
+                )
+                if fix:
+                    Account.objects.filter(pk=account_id).update(ledger_balance=expected)
+                    mark_households_changed([household_id])
+        return len(stored), drifted
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.2 on 2026-10-18 01:20
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_ledger_balance(apps, schema_editor):
+    Account = apps.get_model("financial", "Account")
+    Transaction = apps.get_model("financial", "Transaction")
+    totals = (
+        Transaction.objects.filter(account=OuterRef("pk"))
+        .order_by()
+        .values("account")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    Account.objects.update(
+        ledger_balance=Coalesce(
+            Subquery(totals),
+            Value(Decimal("0.00")),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0011_merge_20260302_2320'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='ledger_balance',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text="Sum of this account's transactions, maintained on every transaction write.", max_digits=12),
+        ),
+        migrations.RunPython(backfill_ledger_balance, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.2 on 2026-10-18 01:23
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_balance_snapshots(apps, schema_editor):
+    AccountBalanceSnapshot = apps.get_model("financial", "AccountBalanceSnapshot")
+    Transaction = apps.get_model("financial", "Transaction")
+    monthly_totals = (
+        Transaction.objects.annotate(month=TruncMonth("posted_on"))
+        .order_by("account_id", "month")
+        .values("account_id", "month")
+        .annotate(total=Sum("amount"))
+        .values_list("account_id", "month", "total")
+    )
+    batch = []
+    current_account_id = None
+    running = Decimal("0.00")
+    for account_id, month, total in monthly_totals.iterator():
+        if account_id != current_account_id:
+            current_account_id = account_id
+            running = Decimal("0.00")
+        running += total
+        batch.append(AccountBalanceSnapshot(account_id=account_id, month=month, closing_balance=running))
+        if len(batch) >= 1000:
+            AccountBalanceSnapshot.objects.bulk_create(batch)
+            batch = []
+    AccountBalanceSnapshot.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0012_account_ledger_balance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountBalanceSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('closing_balance', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_snapshots', to='financial.account')),
+            ],
+            options={
+                'ordering': ('account_id', 'month'),
+                'constraints': [models.UniqueConstraint(fields=('account', 'month'), name='financial_balance_snapshot_account_month_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_balance_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:05
+
+from django.db import migrations
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # SQLite search uses an FTS5 shadow table managed by the post_migrate hook.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS fin_txn_description_trgm "
+        "ON financial_transaction USING gin (description gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS fin_txn_notes_trgm "
+        "ON financial_transaction USING gin (notes gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS fin_txn_description_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS fin_txn_notes_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0013_account_balance_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.2 on 2026-10-18 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0014_transaction_trigram_indexes'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account', 'category', 'posted_on', 'created_at', 'id'], name='fin_txn_acct_cat_posted_id'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account', 'transaction_type', 'posted_on', 'created_at', 'id'], name='fin_txn_acct_type_posted_id'),
+        ),
+    ]
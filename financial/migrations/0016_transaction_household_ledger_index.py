@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 01:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0015_transaction_filter_indexes'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['household', 'posted_on', 'created_at', 'id'], name='fin_txn_hh_posted_created_id'),
+        ),
+    ]
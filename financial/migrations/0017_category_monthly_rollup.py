@@ -0,0 +1,57 @@
+# Generated by Django 6.0.2 on 2026-10-18 01:45
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_category_rollups(apps, schema_editor):
+    CategoryMonthlyRollup = apps.get_model("financial", "CategoryMonthlyRollup")
+    Transaction = apps.get_model("financial", "Transaction")
+    buckets = (
+        Transaction.objects.annotate(month=TruncMonth("posted_on"))
+        .order_by()
+        .values("household_id", "category_id", "month", "transaction_type")
+        .annotate(total=Sum("amount"), transaction_count=Count("id"))
+    )
+    batch = []
+    for bucket in buckets.iterator():
+        batch.append(CategoryMonthlyRollup(**bucket))
+        if len(batch) >= 1000:
+            CategoryMonthlyRollup.objects.bulk_create(batch)
+            batch = []
+    CategoryMonthlyRollup.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0016_transaction_household_ledger_index'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryMonthlyRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('transaction_type', models.CharField(choices=[('deposit', 'Deposit'), ('expense', 'Expense'), ('transfer', 'Transfer'), ('adjustment', 'Adjustment'), ('payment', 'Payment'), ('charge', 'Charge')], max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('transaction_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='financial.category')),
+                ('household', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_rollups', to='households.household')),
+            ],
+            options={
+                'ordering': ('household_id', 'month', 'category_id', 'transaction_type'),
+                'indexes': [models.Index(fields=['household', 'month'], name='fin_rollup_household_month')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('category__isnull', False)), fields=('household', 'category', 'month', 'transaction_type'), name='financial_rollup_category_month_type_unique'), models.UniqueConstraint(condition=models.Q(('category__isnull', True)), fields=('household', 'month', 'transaction_type'), name='financial_rollup_uncategorized_month_type_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_category_rollups, migrations.RunPython.noop),
+    ]
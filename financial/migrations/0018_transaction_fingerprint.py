@@ -0,0 +1,53 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:00
+
+import hashlib
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def backfill_transaction_fingerprints(apps, schema_editor):
+    # Frozen copy of financial.models.transaction_fingerprint: existing rows are
+    # treated as already imported so re-importing their statements is a no-op.
+    Transaction = apps.get_model("financial", "Transaction")
+    occurrences = defaultdict(int)
+    current_account_id = None
+    batch = []
+    rows = Transaction.objects.order_by("account_id", "posted_on", "created_at", "id").only(
+        "id", "account_id", "posted_on", "amount", "description"
+    )
+    for row in rows.iterator(chunk_size=2000):
+        if row.account_id != current_account_id:
+            current_account_id = row.account_id
+            occurrences.clear()
+        description = " ".join(row.description.split()).casefold()
+        key = (row.account_id, row.posted_on, row.amount, description)
+        occurrences[key] += 1
+        payload = f"{row.account_id}|{row.posted_on.isoformat()}|{row.amount:.2f}|{description}|{occurrences[key]}"
+        row.fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        batch.append(row)
+        if len(batch) >= 1000:
+            Transaction.objects.bulk_update(batch, ["fingerprint"])
+            batch = []
+    Transaction.objects.bulk_update(batch, ["fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0017_category_monthly_rollup'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='fingerprint',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the source statement line; set by imports and bulk entry to skip re-imported rows.', max_length=64, null=True),
+        ),
+        migrations.RunPython(backfill_transaction_fingerprints, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.UniqueConstraint(condition=models.Q(('fingerprint__isnull', False)), fields=('fingerprint',), name='fin_txn_fingerprint_unique'),
+        ),
+    ]
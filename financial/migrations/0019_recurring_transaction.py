@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:05
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0018_transaction_fingerprint'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecurringTransaction',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('description', models.CharField(max_length=255)),
+                ('transaction_type', models.CharField(choices=[('deposit', 'Deposit'), ('expense', 'Expense'), ('transfer', 'Transfer'), ('adjustment', 'Adjustment'), ('payment', 'Payment'), ('charge', 'Charge')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Entered as a positive amount; signed per account type.', max_digits=10)),
+                ('frequency', models.CharField(choices=[('weekly', 'Weekly'), ('monthly', 'Monthly'), ('yearly', 'Yearly')], default='monthly', max_length=10)),
+                ('interval', models.PositiveSmallIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ('starts_on', models.DateField()),
+                ('ends_on', models.DateField(blank=True, null=True)),
+                ('next_occurrence', models.DateField(editable=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_transactions', to='financial.account')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recurring_transactions', to='financial.category')),
+                ('household', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='recurring_transactions', to='households.household')),
+            ],
+            options={
+                'ordering': ('next_occurrence', 'description'),
+                'indexes': [models.Index(condition=models.Q(('is_active', True)), fields=['next_occurrence'], name='fin_recurring_due_idx')],
+            },
+        ),
+    ]
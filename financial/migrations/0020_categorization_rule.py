@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:09
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0019_recurring_transaction'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategorizationRule',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('match_type', models.CharField(choices=[('prefix', 'Starts with'), ('contains', 'Contains'), ('regex', 'Regular expression'), ('amount', 'Amount range')], max_length=10)),
+                ('pattern', models.CharField(blank=True, max_length=255)),
+                ('min_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('max_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('priority', models.PositiveSmallIntegerField(default=100, help_text='Lower numbers win when several rules match.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rules', to='financial.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='categorization_rules', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('priority', 'created_at', 'id'),
+                'indexes': [models.Index(fields=['user', 'priority', 'created_at'], name='fin_catrule_user_priority')],
+            },
+        ),
+    ]
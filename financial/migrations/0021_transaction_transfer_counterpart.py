@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0020_categorization_rule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='transfer_counterpart',
+            field=models.OneToOneField(blank=True, editable=False, help_text='The other leg of a transfer between two household accounts.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='financial.transaction'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:20
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+VIOLATION_LIST_LIMIT = 50
+SIGN_RULES = models.CheckConstraint(condition=models.Q(models.Q(('account_type', 'checking'), ('transaction_type', 'deposit'), ('amount__gt', 0)), models.Q(('account_type', 'checking'), ('transaction_type', 'expense'), ('amount__lt', 0)), models.Q(('account_type', 'checking'), ('transaction_type', 'transfer'), ('amount__lt', 0)), models.Q(('account_type', 'checking'), ('transaction_type', 'adjustment'), ('amount__gt', 0)), models.Q(('account_type', 'savings'), ('transaction_type', 'deposit'), ('amount__gt', 0)), models.Q(('account_type', 'savings'), ('transaction_type', 'expense'), ('amount__lt', 0)), models.Q(('account_type', 'savings'), ('transaction_type', 'transfer'), ('amount__lt', 0)), models.Q(('account_type', 'savings'), ('transaction_type', 'adjustment'), ('amount__gt', 0)), models.Q(('account_type', 'credit_card'), ('transaction_type', 'payment'), ('amount__lt', 0)), models.Q(('account_type', 'credit_card'), ('transaction_type', 'charge'), ('amount__gt', 0)), models.Q(('account_type', 'credit_card'), ('transaction_type', 'adjustment'), ('amount__lt', 0)), models.Q(('account_type', 'credit_card'), ('transaction_type', 'transfer'), ('amount__gt', 0)), models.Q(('account_type', 'loan'), ('transaction_type', 'payment'), ('amount__lt', 0)), models.Q(('account_type', 'loan'), ('transaction_type', 'charge'), ('amount__gt', 0)), models.Q(('account_type', 'loan'), ('transaction_type', 'adjustment'), ('amount__lt', 0)), models.Q(('account_type', 'loan'), ('transaction_type', 'transfer'), ('amount__gt', 0)), models.Q(('account_type', 'other'), ('transaction_type', 'payment'), ('amount__lt', 0)), models.Q(('account_type', 'other'), ('transaction_type', 'charge'), ('amount__gt', 0)), models.Q(('account_type', 'other'), ('transaction_type', 'adjustment'), ('amount__lt', 0)), models.Q(('account_type', 'other'), ('transaction_type', 'transfer'), ('amount__gt', 0)), _connector='OR'), name='fin_txn_sign_rules', violation_error_message='This transaction type or amount sign is not allowed for the account.')
+
+
+def backfill_transaction_account_type(apps, schema_editor):
+    Account = apps.get_model("financial", "Account")
+    Transaction = apps.get_model("financial", "Transaction")
+    Transaction.objects.update(
+        account_type=Subquery(Account.objects.filter(pk=OuterRef("account_id")).values("account_type")[:1])
+    )
+
+
+def check_existing_sign_rules(apps, schema_editor):
+    """Refuse to add the constraint over rows it would reject.
+
+    Account types could change under existing transactions before this
+    migration, so a ledger can already hold a type or sign that no longer fits
+    its account. Repairing those would move balances, so list them instead.
+    """
+
+    Transaction = apps.get_model("financial", "Transaction")
+    violating = Transaction.objects.exclude(SIGN_RULES.condition).order_by("pk")
+    count = violating.count()
+    if not count:
+        return
+    shown = [str(pk) for pk in violating.values_list("pk", flat=True)[:VIOLATION_LIST_LIMIT]]
+    more = f" (and {count - len(shown)} more)" if count > len(shown) else ""
+    raise RuntimeError(
+        f"{count} transaction(s) break the sign rules for their account type: "
+        f"{', '.join(shown)}{more}. Fix their type, amount or account, then migrate again."
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0021_transaction_transfer_counterpart'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='account_type',
+            field=models.CharField(choices=[('checking', 'Checking'), ('savings', 'Savings'), ('credit_card', 'Credit Card'), ('loan', 'Loan'), ('other', 'Other')], default='', editable=False, help_text="Copy of the account's type so the sign-rule CHECK constraint can see it.", max_length=20),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_transaction_account_type, migrations.RunPython.noop),
+        migrations.RunPython(check_existing_sign_rules, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=SIGN_RULES,
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:30
+
+from decimal import Decimal
+
+import financial.money
+from django.db import migrations, models
+from django.db.models import F, Value
+from django.db.models.functions import Round
+
+
+# (model, field, money field options). Each column is widened so scaling by
+# 100 can't overflow, scaled to cents while it is still decimal, then cast to
+# bigint.
+LEDGER_HELP_TEXT = "Sum of this account's transactions, maintained on every transaction write."
+MONEY_FIELDS = (
+    ("account", "current_balance", dict(default=Decimal("0.00"), max_digits=12)),
+    ("account", "ledger_balance", dict(default=Decimal("0.00"), editable=False, help_text=LEDGER_HELP_TEXT, max_digits=12)),
+    ("accountbalancesnapshot", "closing_balance", dict(max_digits=12)),
+    ("categorymonthlyrollup", "total", dict(default=Decimal("0.00"), max_digits=14)),
+    ("monthlybillpayment", "actual_payment_amount", dict(blank=True, max_digits=12, null=True)),
+    ("transaction", "amount", dict(max_digits=10)),
+)
+WIDE_MAX_DIGITS = 20
+
+
+def _scale(model_name, field_name, factor):
+    def scale(apps, schema_editor):
+        model = apps.get_model("financial", model_name)
+        model.objects.exclude(**{f"{field_name}__isnull": True}).update(
+            **{field_name: Round(F(field_name) * Value(factor), precision=2)}
+        )
+
+    return scale
+
+
+def _operations():
+    operations = []
+    for model_name, field_name, options in MONEY_FIELDS:
+        wide = {**options, "decimal_places": 2, "max_digits": WIDE_MAX_DIGITS}
+        operations += [
+            migrations.AlterField(model_name=model_name, name=field_name, field=models.DecimalField(**wide)),
+            migrations.RunPython(
+                _scale(model_name, field_name, Decimal("100")),
+                _scale(model_name, field_name, Decimal("0.01")),
+            ),
+            migrations.AlterField(
+                model_name=model_name,
+                name=field_name,
+                field=financial.money.MoneyField(**options),
+            ),
+        ]
+    return operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0022_transaction_account_type_sign_rules'),
+    ]
+
+    operations = _operations()
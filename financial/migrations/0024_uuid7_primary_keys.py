@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:35
+
+import financial.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0023_money_minor_units'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='id',
+            field=models.UUIDField(default=financial.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='id',
+            field=models.UUIDField(default=financial.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='monthlybillpayment',
+            name='id',
+            field=models.UUIDField(default=financial.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='id',
+            field=models.UUIDField(default=financial.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
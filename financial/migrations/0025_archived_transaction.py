@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:46
+
+import django.db.models.deletion
+import financial.money
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0024_uuid7_primary_keys'),
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTransaction',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('account_type', models.CharField(choices=[('checking', 'Checking'), ('savings', 'Savings'), ('credit_card', 'Credit Card'), ('loan', 'Loan'), ('other', 'Other')], max_length=20)),
+                ('posted_on', models.DateField()),
+                ('description', models.CharField(max_length=255)),
+                ('transaction_type', models.CharField(choices=[('deposit', 'Deposit'), ('expense', 'Expense'), ('transfer', 'Transfer'), ('adjustment', 'Adjustment'), ('payment', 'Payment'), ('charge', 'Charge')], max_length=20)),
+                ('amount', financial.money.MoneyField(max_digits=10)),
+                ('notes', models.TextField(blank=True)),
+                ('fingerprint', models.CharField(blank=True, max_length=64, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_transactions', to='financial.account')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_transactions', to='financial.category')),
+                ('household', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_transactions', to='households.household')),
+                ('transfer_counterpart', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='financial.archivedtransaction')),
+            ],
+            options={
+                'ordering': ('-posted_on', '-created_at', '-id'),
+                'indexes': [models.Index(fields=['account', 'posted_on', 'created_at', 'id'], name='fin_archtxn_acct_posted_id'), models.Index(fields=['household', 'posted_on', 'created_at', 'id'], name='fin_archtxn_hh_posted_id')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('fingerprint__isnull', False)), fields=('fingerprint',), name='fin_archtxn_fingerprint_unique')],
+            },
+        ),
+    ]
@@ -1,17 +1,26 @@
+import calendar
+import hashlib
+import re
 import uuid
-from datetime import date
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterable
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
-from django.db.models import Case, IntegerField, When
-from django.db.models.functions import Lower
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Count, ExpressionWrapper, F, IntegerField, Max, Q, Sum, Value, When, Window
+from django.db.models.expressions import RowRange
+from django.db.models.functions import Lower, TruncMonth
+from django.utils import timezone
 from households.models import Household, HouseholdMember
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .fragments import ACCOUNT_ROW_FRAGMENT, invalidate_fragment
+from .ids import uuid7
 from .integrations.google_calendar.models import GoogleOAuthToken
+from .money import MoneyField, money_value
 
 
 ROUTING_NUMBER_VALIDATOR = RegexValidator(
@@ -28,6 +37,16 @@ class AccountType(models.TextChoices):
 	OTHER = "other", "Other"
 
 
+# Rank of each account type in account listings; ties break on name, then created_at.
+ACCOUNT_TYPE_ORDER = {
+	AccountType.CHECKING: 0,
+	AccountType.SAVINGS: 1,
+	AccountType.CREDIT_CARD: 2,
+	AccountType.LOAN: 3,
+	AccountType.OTHER: 4,
+}
+
+
 class AccountStatus(models.TextChoices):
 	ACTIVE = "active", "Active"
 	CLOSED = "closed", "Closed"
@@ -49,36 +68,7 @@ class TransactionType(models.TextChoices):
 
 	@classmethod
 	def allowed_values_for_account(cls, account_type: str) -> list[str]:
-		allowed_map = {
-			AccountType.CHECKING: [
-				cls.DEPOSIT,
-				cls.EXPENSE,
-				cls.TRANSFER,
-				cls.ADJUSTMENT,
-			],
-			AccountType.SAVINGS: [
-				cls.DEPOSIT,
-				cls.EXPENSE,
-				cls.TRANSFER,
-				cls.ADJUSTMENT,
-			],
-			AccountType.CREDIT_CARD: [
-				cls.PAYMENT,
-				cls.CHARGE,
-				cls.ADJUSTMENT,
-			],
-			AccountType.LOAN: [
-				cls.PAYMENT,
-				cls.CHARGE,
-				cls.ADJUSTMENT,
-			],
-			AccountType.OTHER: [
-				cls.PAYMENT,
-				cls.CHARGE,
-				cls.ADJUSTMENT,
-			],
-		}
-		return [value for value in allowed_map.get(account_type, [])]
+		return list(TRANSACTION_SIGN_RULES.get(account_type, {}))
 
 	@classmethod
 	def allowed_for_account(cls, account_type: str) -> list[tuple[str, str]]:
@@ -86,24 +76,119 @@ class TransactionType(models.TextChoices):
 		return [(value, label) for value, label in cls.choices if value in allowed_values]
 
 
+LIABILITY_ACCOUNT_TYPES = frozenset({AccountType.CREDIT_CARD, AccountType.LOAN, AccountType.OTHER})
+
+# Sign applied to the entered (positive) amount for each account type and the
+# transaction types it allows; key order is the order forms offer the types.
+TRANSACTION_SIGN_RULES: dict[str, dict[str, Decimal]] = {
+	AccountType.CHECKING: {
+		TransactionType.DEPOSIT: Decimal("1"),
+		TransactionType.EXPENSE: Decimal("-1"),
+		TransactionType.TRANSFER: Decimal("-1"),
+		TransactionType.ADJUSTMENT: Decimal("1"),
+	},
+	AccountType.SAVINGS: {
+		TransactionType.DEPOSIT: Decimal("1"),
+		TransactionType.EXPENSE: Decimal("-1"),
+		TransactionType.TRANSFER: Decimal("-1"),
+		TransactionType.ADJUSTMENT: Decimal("1"),
+	},
+	AccountType.CREDIT_CARD: {
+		TransactionType.PAYMENT: Decimal("-1"),
+		TransactionType.CHARGE: Decimal("1"),
+		TransactionType.ADJUSTMENT: Decimal("-1"),
+		TransactionType.TRANSFER: Decimal("1"),
+	},
+	AccountType.LOAN: {
+		TransactionType.PAYMENT: Decimal("-1"),
+		TransactionType.CHARGE: Decimal("1"),
+		TransactionType.ADJUSTMENT: Decimal("-1"),
+		TransactionType.TRANSFER: Decimal("1"),
+	},
+	AccountType.OTHER: {
+		TransactionType.PAYMENT: Decimal("-1"),
+		TransactionType.CHARGE: Decimal("1"),
+		TransactionType.ADJUSTMENT: Decimal("-1"),
+		TransactionType.TRANSFER: Decimal("1"),
+	},
+}
+
+
+def signed_transaction_amount(account_type: str, transaction_type: str, amount: Decimal) -> Decimal:
+	"""Apply the sign rule for an allowed ``transaction_type`` to a positive ``amount``."""
+
+	return abs(amount) * TRANSACTION_SIGN_RULES[account_type][transaction_type]
+
+
+def transaction_sign_rules_q(account_type: str | None = None) -> Q:
+	"""``Q`` accepting exactly the type and sign pairs ``TRANSACTION_SIGN_RULES`` allows.
+
+	Without ``account_type`` it covers every account type through the
+	denormalized ``Transaction.account_type`` column (the CHECK constraint).
+	"""
+
+	allowed = Q()
+	for rule_account_type, rules in TRANSACTION_SIGN_RULES.items():
+		if account_type is not None and rule_account_type != account_type:
+			continue
+		scope = Q(account_type=rule_account_type) if account_type is None else Q()
+		for transaction_type, sign in rules.items():
+			allowed |= scope & Q(transaction_type=transaction_type) & (Q(amount__gt=0) if sign > 0 else Q(amount__lt=0))
+	return allowed
+
+
+def _fingerprint_description(description: str) -> str:
+	return " ".join(description.split()).casefold()
+
+
+def transaction_fingerprint(account_id, posted_on: date, amount: Decimal, description: str, ordinal: int) -> str:
+	"""Content hash identifying one statement line within an account.
+
+	``ordinal`` numbers identical lines (same day, amount and description) so
+	two genuine same-day purchases keep distinct fingerprints.
+	"""
+
+	payload = f"{account_id}|{posted_on.isoformat()}|{amount:.2f}|{_fingerprint_description(description)}|{ordinal}"
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def assign_transaction_fingerprints(transactions: Iterable["Transaction"], occurrences: dict | None = None) -> dict:
+	"""Fingerprint unsaved rows, numbering repeated lines from 1 in the order given.
+
+	Pass the returned ``occurrences`` back in to keep numbering across chunks of
+	the same statement.
+	"""
+
+	occurrences = {} if occurrences is None else occurrences
+	for row in transactions:
+		key = (row.account_id, row.posted_on, row.amount, _fingerprint_description(row.description))
+		occurrences[key] = occurrences.get(key, 0) + 1
+		row.fingerprint = transaction_fingerprint(row.account_id, row.posted_on, row.amount, row.description, occurrences[key])
+	return occurrences
+
+
+def mark_households_changed(household_ids: Iterable) -> None:
+	"""Record a write to the financial data of ``household_ids``.
+
+	Bumps each household's ``data_version`` in the writing transaction, so the
+	new version becomes visible together with the data. Caches derived from a
+	household's data key on the version, so every worker moves on at once.
+	"""
+
+	Household.bump_data_version(household_ids)
+
+
 class AccountQuerySet(models.QuerySet):
 	"""Reusable queryset helpers for deterministic ordering and scoping."""
 
 	def with_account_type_order(self):
 		"""Annotate a numeric weight for ordering account types."""
 
-		order_map = [
-			(AccountType.CHECKING, 0),
-			(AccountType.SAVINGS, 1),
-			(AccountType.CREDIT_CARD, 2),
-			(AccountType.LOAN, 3),
-			(AccountType.OTHER, 4),
-		]
-		whens = [When(account_type=value, then=rank) for value, rank in order_map]
+		whens = [When(account_type=value, then=rank) for value, rank in ACCOUNT_TYPE_ORDER.items()]
 		return self.annotate(
 			_account_type_order=Case(
 				*whens,
-				default=len(order_map),
+				default=len(ACCOUNT_TYPE_ORDER),
 				output_field=IntegerField(),
 			)
 		)
@@ -134,7 +219,7 @@ AccountManager = models.Manager.from_queryset(AccountQuerySet)
 
 
 class Account(models.Model):
-	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 	user = models.ForeignKey(
 		settings.AUTH_USER_MODEL,
 		related_name="accounts",
@@ -166,11 +251,16 @@ class Account(models.Model):
 		choices=AccountStatus.choices,
 		default=AccountStatus.ACTIVE,
 	)
-	current_balance = models.DecimalField(
+	current_balance = MoneyField(
 		max_digits=12,
-		decimal_places=2,
 		default=Decimal("0.00"),
 	)
+	ledger_balance = MoneyField(
+		max_digits=12,
+		default=Decimal("0.00"),
+		editable=False,
+		help_text="Sum of this account's transactions, maintained on every transaction write.",
+	)
 	credit_limit_or_principal = models.DecimalField(
 		max_digits=12,
 		decimal_places=2,
@@ -244,6 +334,23 @@ class Account(models.Model):
 			if not 1 <= self.payment_due_day <= 31:
 				raise ValidationError({"payment_due_day": "Day must be between 1 and 31."})
 
+		if self.pk is not None and not self._state.adding and self.account_type in TRANSACTION_SIGN_RULES:
+			incompatible = any(
+				model.objects.filter(account_id=self.pk).exclude(transaction_sign_rules_q(self.account_type)).exists()
+				for model in (Transaction, ArchivedTransaction)
+			)
+			if incompatible:
+				raise ValidationError({
+					"account_type": "Existing transactions don't fit this account type's transaction types and signs.",
+				})
+			incompatible_schedules = self.recurring_transactions.filter(is_active=True).exclude(
+				transaction_type__in=TransactionType.allowed_values_for_account(self.account_type)
+			)
+			if incompatible_schedules.exists():
+				raise ValidationError({
+					"account_type": "Active recurring transactions use types this account type doesn't allow.",
+				})
+
 	def __str__(self):
 		return f"{self.name} ({self.get_account_type_display()})"
 
@@ -266,26 +373,204 @@ class Account(models.Model):
 					is_primary=not has_primary,
 				)
 			self.household = household
-		return super().save(*args, **kwargs)
+		adding = self._state.adding
+		rendered_version = self.updated_at
+		with transaction.atomic():
+			result = super().save(*args, **kwargs)
+			if not adding:
+				# Keep the denormalized copy the sign-rule CHECK constraint reads in step.
+				for model in (Transaction, ArchivedTransaction):
+					model.objects.filter(account_id=self.pk).exclude(account_type=self.account_type).update(
+						account_type=self.account_type
+					)
+			mark_households_changed([self.household_id])
+		if not adding:
+			invalidate_fragment(ACCOUNT_ROW_FRAGMENT, self.pk, rendered_version)
+		return result
+
+	def delete(self, *args, **kwargs):
+		account_id, rendered_version = self.pk, self.updated_at
+		with transaction.atomic():
+			# Transactions cascade away without Transaction.delete(), so take
+			# their hot and archived rows out of the rollups here.
+			for model in (Transaction, ArchivedTransaction):
+				CategoryMonthlyRollup.objects.subtract_rows(model.objects.filter(account_id=account_id))
+			result = super().delete(*args, **kwargs)
+			mark_households_changed([self.household_id])
+		invalidate_fragment(ACCOUNT_ROW_FRAGMENT, account_id, rendered_version)
+		return result
+
+
+TRANSACTION_ORDERING = ("-posted_on", "-created_at", "-id")
+# Foreign keys whose existence checks would each cost a query in clean_fields().
+TRANSACTION_RELATION_FIELDS = ("account", "household", "category", "transfer_counterpart")
+# Fields both legs of a transfer must keep in step; edit the pair, not one leg.
+TRANSFER_LOCKED_FIELDS = ("account_id", "posted_on", "transaction_type", "amount")
+TRANSFER_LEG_EDIT_ERROR = (
+	"Transfer legs can't change account, date, type or amount on their own. Delete the transfer and record it again."
+)
 
 
-class TransactionQuerySet(models.QuerySet):
-	"""Reusable queryset helpers for deterministic transaction ordering."""
+DEFAULT_TRANSACTION_ARCHIVE_AFTER_DAYS = 730
+
+
+def transaction_archive_horizon(today: date | None = None) -> date:
+	"""Oldest ``posted_on`` guaranteed to be in the hot table; older rows may be archived."""
+
+	today = today or timezone.localdate()
+	days = getattr(settings, "TRANSACTION_ARCHIVE_AFTER_DAYS", DEFAULT_TRANSACTION_ARCHIVE_AFTER_DAYS)
+	return today - timedelta(days=days)
 
-	def ordered(self) -> "TransactionQuerySet":
-		return self.order_by("-posted_on", "-created_at", "-id")
 
-	def for_account(self, account) -> "TransactionQuerySet":
+class TransactionRowQuerySet(models.QuerySet):
+	"""Read helpers shared by hot transactions and their archived copies.
+
+	Both tables have the same columns, so one set of filters, orderings and
+	keyset seeks builds the matching query against either model.
+	"""
+
+	def ordered(self) -> "TransactionRowQuerySet":
+		return self.order_by(*TRANSACTION_ORDERING)
+
+	def with_running_balance(self, closing_balance: Decimal) -> "TransactionRowQuerySet":
+		"""Annotate ``running_balance``: the account balance right after each row.
+
+		``closing_balance`` is the balance after the first row in ``ordered()``
+		order; each row subtracts the signed amounts of the rows before it with a
+		window over the same ordering. The window only sees rows that survive the
+		queryset's filters, so a keyset page never sums the whole history.
+		"""
+
+		amount_field = MoneyField(max_digits=14)
+		preceding_total = Window(
+			Sum("amount"),
+			order_by=list(TRANSACTION_ORDERING),
+			frame=RowRange(start=None, end=0),
+			output_field=amount_field,
+		)
+		return self.annotate(
+			running_balance=ExpressionWrapper(
+				Value(closing_balance, output_field=amount_field) - preceding_total + F("amount"),
+				output_field=amount_field,
+			)
+		)
+
+	@staticmethod
+	def _after_position_q(posted_on, created_at, pk) -> Q:
+		return (
+			Q(posted_on__lt=posted_on)
+			| Q(posted_on=posted_on, created_at__lt=created_at)
+			| Q(posted_on=posted_on, created_at=created_at, id__lt=pk)
+		)
+
+	def before_position(self, posted_on, created_at, pk) -> "TransactionRowQuerySet":
+		"""Rows that sort strictly after the given key in ``ordered()`` (keyset seek).
+
+		The leading ``posted_on__lte`` bound keeps the predicate sargable so the
+		``(account, posted_on, created_at, id)`` index can seek instead of scan.
+		"""
+
+		return self.filter(posted_on__lte=posted_on).filter(self._after_position_q(posted_on, created_at, pk))
+
+	def before_ranked_position(self, rank: float, posted_on, created_at, pk, *, rank_field: str = "search_rank") -> "TransactionRowQuerySet":
+		"""Keyset seek for ``(-rank, ordered())`` orderings such as search results."""
+
+		return self.filter(
+			Q(**{f"{rank_field}__lt": rank})
+			| (Q(**{rank_field: rank}) & self._after_position_q(posted_on, created_at, pk))
+		)
+
+	def for_account(self, account) -> "TransactionRowQuerySet":
 		if account is None:
 			return self.none()
 		return self.filter(account=account)
 
-	def for_household(self, household) -> "TransactionQuerySet":
+	def for_household(self, household) -> "TransactionRowQuerySet":
 		if household is None:
 			return self.none()
 		return self.filter(household=household)
 
 
+
+class TransactionQuerySet(TransactionRowQuerySet):
+	"""Reusable queryset helpers for deterministic transaction ordering."""
+
+	def bulk_create(self, objs, *args, **kwargs):
+		"""Fill the denormalized ``account_type`` with one lookup for rows that lack it."""
+
+		objs = list(objs)
+		missing = {row.account_id for row in objs if not row.account_type}
+		if missing:
+			account_types = dict(Account.objects.filter(pk__in=missing).values_list("pk", "account_type"))
+			for row in objs:
+				if not row.account_type:
+					row.account_type = account_types.get(row.account_id, "")
+		return super().bulk_create(objs, *args, **kwargs)
+
+	@staticmethod
+	def lock_accounts(account_ids: Iterable) -> None:
+		"""Row-lock ``account_ids`` in primary-key order so concurrent writers never deadlock."""
+
+		account_ids = sorted({account_id for account_id in account_ids if account_id is not None}, key=str)
+		list(Account.objects.select_for_update().filter(pk__in=account_ids).order_by("pk").values_list("pk", flat=True))
+
+	def bulk_record(
+		self,
+		transactions: list["Transaction"],
+		*,
+		batch_size: int = 1000,
+		skip_duplicates: bool = False,
+	) -> list["Transaction"]:
+		"""``bulk_create`` validated, already signed rows and keep derived data current.
+
+		Ledger balances, monthly snapshots and category rollups are adjusted once
+		per account, month and bucket instead of once per row. With
+		``skip_duplicates`` rows whose ``fingerprint`` already exists are dropped
+		by the insert itself (``ON CONFLICT DO NOTHING``) and only the rows that
+		actually landed are returned and counted. Rows older than the archive
+		horizon are also checked against archived fingerprints.
+		"""
+
+		if skip_duplicates:
+			transactions = ArchivedTransaction.objects.drop_archived_duplicates(transactions)
+		if not transactions:
+			return []
+		with transaction.atomic():
+			self.lock_accounts(row.account_id for row in transactions)
+			if skip_duplicates:
+				self.bulk_create(transactions, batch_size=batch_size, ignore_conflicts=True)
+				inserted = set(self.filter(pk__in=[row.pk for row in transactions]).values_list("pk", flat=True))
+				created = [row for row in transactions if row.pk in inserted]
+			else:
+				created = self.bulk_create(transactions, batch_size=batch_size)
+			self.apply_recorded_effects(created)
+		return created
+
+	def apply_recorded_effects(self, transactions: Iterable["Transaction"]) -> None:
+		"""Fold newly inserted rows into ledger balances, snapshots and rollups."""
+
+		ledger: dict = defaultdict(Decimal)
+		months: dict = defaultdict(Decimal)
+		buckets: dict = defaultdict(lambda: [Decimal("0.00"), 0])
+		for row in transactions:
+			ledger[row.account_id] += row.amount
+			months[(row.account_id, AccountBalanceSnapshot.normalize_month(row.posted_on))] += row.amount
+			key = CategoryMonthlyRollup.bucket_key(CategoryMonthlyRollup.state_of(row))
+			bucket = buckets[tuple(key.items())]
+			bucket[0] += row.amount
+			bucket[1] += 1
+
+		for account_id in sorted(ledger, key=str):
+			Account.objects.filter(pk=account_id).update(
+				ledger_balance=F("ledger_balance") + money_value(ledger[account_id])
+			)
+		for (account_id, month), delta in sorted(months.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+			AccountBalanceSnapshot.objects.apply_delta(account_id, month, delta)
+		for key, (total, count) in buckets.items():
+			CategoryMonthlyRollup.objects.apply_delta(**dict(key), total=total, count=count)
+		mark_households_changed(row.household_id for row in transactions)
+
+
 TransactionManager = models.Manager.from_queryset(TransactionQuerySet)
 
 
@@ -305,7 +590,7 @@ MonthlyBillPaymentManager = models.Manager.from_queryset(MonthlyBillPaymentQuery
 
 
 class MonthlyBillPayment(models.Model):
-	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 	account = models.ForeignKey(
 		Account,
 		related_name="monthly_bill_payments",
@@ -319,9 +604,8 @@ class MonthlyBillPayment(models.Model):
 		blank=True,
 	)
 	month = models.DateField()
-	actual_payment_amount = models.DecimalField(
+	actual_payment_amount = MoneyField(
 		max_digits=12,
-		decimal_places=2,
 		null=True,
 		blank=True,
 	)
@@ -363,7 +647,16 @@ class MonthlyBillPayment(models.Model):
 
 	def save(self, *args, **kwargs):
 		self.month = self.normalize_month(self.month)
-		return super().save(*args, **kwargs)
+		with transaction.atomic():
+			result = super().save(*args, **kwargs)
+			mark_households_changed([self.account.household_id])
+		return result
+
+	def delete(self, *args, **kwargs):
+		with transaction.atomic():
+			result = super().delete(*args, **kwargs)
+			mark_households_changed([self.account.household_id])
+		return result
 
 class MonthlyBillPaymentCalendarLink(models.Model):	
 	monthly_bill_payment = models.OneToOneField(
@@ -378,7 +671,7 @@ class MonthlyBillPaymentCalendarLink(models.Model):
 
 
 class Transaction(models.Model):
-	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 	account = models.ForeignKey(
 		Account,
 		related_name="transactions",
@@ -389,10 +682,16 @@ class Transaction(models.Model):
 		related_name="transactions",
 		on_delete=models.PROTECT,
 	)
+	account_type = models.CharField(
+		max_length=20,
+		choices=AccountType.choices,
+		editable=False,
+		help_text="Copy of the account's type so the sign-rule CHECK constraint can see it.",
+	)
 	posted_on = models.DateField()
 	description = models.CharField(max_length=255)
 	transaction_type = models.CharField(max_length=20, choices=TransactionType.choices)
-	amount = models.DecimalField(max_digits=10, decimal_places=2)
+	amount = MoneyField(max_digits=10)
 	category = models.ForeignKey(
 		"Category",
 		related_name="transactions",
@@ -401,6 +700,22 @@ class Transaction(models.Model):
 		null=True,
 	)
 	notes = models.TextField(blank=True)
+	transfer_counterpart = models.OneToOneField(
+		"self",
+		related_name="+",
+		on_delete=models.SET_NULL,
+		blank=True,
+		null=True,
+		editable=False,
+		help_text="The other leg of a transfer between two household accounts.",
+	)
+	fingerprint = models.CharField(
+		max_length=64,
+		blank=True,
+		null=True,
+		editable=False,
+		help_text="Hash of the source statement line; set by imports and bulk entry to skip re-imported rows.",
+	)
 	created_at = models.DateTimeField(auto_now_add=True)
 
 	objects = TransactionManager()
@@ -412,19 +727,55 @@ class Transaction(models.Model):
 				fields=["account", "posted_on", "created_at", "id"],
 				name="fin_txn_acct_posted_created_id",
 			),
+			models.Index(
+				fields=["account", "category", "posted_on", "created_at", "id"],
+				name="fin_txn_acct_cat_posted_id",
+			),
+			models.Index(
+				fields=["account", "transaction_type", "posted_on", "created_at", "id"],
+				name="fin_txn_acct_type_posted_id",
+			),
+			models.Index(
+				fields=["household", "posted_on", "created_at", "id"],
+				name="fin_txn_hh_posted_created_id",
+			),
+		]
+		constraints = [
+			models.UniqueConstraint(
+				fields=["fingerprint"],
+				condition=Q(fingerprint__isnull=False),
+				name="fin_txn_fingerprint_unique",
+			),
+			models.CheckConstraint(
+				condition=transaction_sign_rules_q(),
+				name="fin_txn_sign_rules",
+				violation_error_message="This transaction type or amount sign is not allowed for the account.",
+			),
 		]
 
 	def clean(self):
 		super().clean()
-		if self.account is not None:
-			self.household = self.account.household
-		if self.account is not None and self.household_id != self.account.household_id:
-			raise ValidationError({"account": "Account household does not match transaction household."})
-		if self.account is None or not self.transaction_type:
+		if self.account_id is None:
 			return
+		self.household = self.account.household
+		self._apply_sign_rule()
+
+		if self.transfer_counterpart_id is not None and not self._state.adding:
+			stored = Transaction.objects.filter(pk=self.pk).values(*TRANSFER_LOCKED_FIELDS).first()
+			if stored is not None and self._moves_transfer_leg(stored):
+				raise ValidationError(TRANSFER_LEG_EDIT_ERROR)
+
+	def _apply_sign_rule(self) -> None:
+		"""Copy the account type, check the transaction type and sign the entered amount once.
+
+		The ``fin_txn_sign_rules`` CHECK constraint enforces the same table, so
+		bulk inserts that never call this still can't store a wrong sign.
+		"""
 
-		allowed = TransactionType.allowed_values_for_account(self.account.account_type)
-		if self.transaction_type not in allowed:
+		self.account_type = self.account.account_type
+		if not self.transaction_type:
+			return
+		if self.transaction_type not in TRANSACTION_SIGN_RULES.get(self.account_type, {}):
 			raise ValidationError({
 				"transaction_type": "This transaction type is not allowed for the account.",
 			})
@@ -435,48 +786,586 @@ class Transaction(models.Model):
 		if self.amount <= Decimal("0") and not signed_once:
 			raise ValidationError({"amount": "Amount must be greater than 0."})
 
-		sign_map = {
-			AccountType.CHECKING: {
-				TransactionType.DEPOSIT: Decimal("1"),
-				TransactionType.EXPENSE: Decimal("-1"),
-				TransactionType.TRANSFER: Decimal("-1"),
-				TransactionType.ADJUSTMENT: Decimal("1"),
-			},
-			AccountType.SAVINGS: {
-				TransactionType.DEPOSIT: Decimal("1"),
-				TransactionType.EXPENSE: Decimal("-1"),
-				TransactionType.TRANSFER: Decimal("-1"),
-				TransactionType.ADJUSTMENT: Decimal("1"),
-			},
-			AccountType.CREDIT_CARD: {
-				TransactionType.PAYMENT: Decimal("-1"),
-				TransactionType.CHARGE: Decimal("1"),
-				TransactionType.ADJUSTMENT: Decimal("-1"),
-			},
-			AccountType.LOAN: {
-				TransactionType.PAYMENT: Decimal("-1"),
-				TransactionType.CHARGE: Decimal("1"),
-				TransactionType.ADJUSTMENT: Decimal("-1"),
-			},
-			AccountType.OTHER: {
-				TransactionType.PAYMENT: Decimal("-1"),
-				TransactionType.CHARGE: Decimal("1"),
-				TransactionType.ADJUSTMENT: Decimal("-1"),
-			},
-		}
-		sign = sign_map[self.account.account_type][self.transaction_type]
-		self.amount = abs(self.amount) * sign
+		self.amount = signed_transaction_amount(self.account_type, self.transaction_type, self.amount)
 		self._signed_amount = True
 
+	def _moves_transfer_leg(self, stored: dict) -> bool:
+		return any(stored[field] != getattr(self, field) for field in TRANSFER_LOCKED_FIELDS)
+
+	@staticmethod
+	def _apply_ledger_delta(account_id, posted_on: date, delta: Decimal) -> None:
+		if account_id is None or not delta:
+			return
+		# Updating the account row first also serializes snapshot upserts per account.
+		Account.objects.filter(pk=account_id).update(ledger_balance=F("ledger_balance") + money_value(delta))
+		AccountBalanceSnapshot.objects.apply_delta(account_id, posted_on, delta)
+
+	def _locked_ledger_state(self) -> dict | None:
+		"""Read the stored ledger and rollup fields for this row, locking it until commit."""
+
+		if self._state.adding:
+			return None
+		return (
+			Transaction.objects.select_for_update()
+			.filter(pk=self.pk)
+			.values(*CategoryMonthlyRollup.STATE_FIELDS, "account_id")
+			.first()
+		)
+
+	def save(self, *args, **kwargs):
+		# Field coercion and the sign rule run in Python; foreign keys, fingerprint
+		# uniqueness and the sign-rule CHECK are left to the database.
+		if self.account_id is not None:
+			self.household_id = self.account.household_id
+		self.clean_fields(exclude=TRANSACTION_RELATION_FIELDS)
+		if self.account_id is not None:
+			self._apply_sign_rule()
+		with transaction.atomic():
+			previous = self._locked_ledger_state()
+			if previous is not None and self.transfer_counterpart_id is not None and self._moves_transfer_leg(previous):
+				raise ValidationError(TRANSFER_LEG_EDIT_ERROR)
+			result = super().save(*args, **kwargs)
+			if (
+				previous is not None
+				and previous["account_id"] == self.account_id
+				and AccountBalanceSnapshot.normalize_month(previous["posted_on"]) == AccountBalanceSnapshot.normalize_month(self.posted_on)
+			):
+				self._apply_ledger_delta(self.account_id, self.posted_on, self.amount - previous["amount"])
+			else:
+				if previous is not None:
+					self._apply_ledger_delta(previous["account_id"], previous["posted_on"], -previous["amount"])
+				self._apply_ledger_delta(self.account_id, self.posted_on, self.amount)
+			CategoryMonthlyRollup.objects.apply_change(previous, CategoryMonthlyRollup.state_of(self))
+			mark_households_changed([self.household_id])
+		self.account.refresh_from_db(fields=["ledger_balance"])
+		return result
+
+	def delete(self, *args, **kwargs):
+		"""Delete this row, and the other leg too when it is part of a transfer."""
+
+		with transaction.atomic():
+			counterpart = None
+			if self.transfer_counterpart_id is not None:
+				counterpart = Transaction.objects.filter(pk=self.transfer_counterpart_id).first()
+				Transaction.objects.lock_accounts([self.account_id, counterpart.account_id if counterpart else None])
+			previous = self._locked_ledger_state()
+			result = super().delete(*args, **kwargs)
+			if previous is not None:
+				self._apply_ledger_delta(previous["account_id"], previous["posted_on"], -previous["amount"])
+				CategoryMonthlyRollup.objects.apply_change(previous, None)
+				mark_households_changed([previous["household_id"]])
+			if counterpart is not None:
+				# The collector already cleared the counterpart's link to this row.
+				counterpart.transfer_counterpart_id = None
+				counterpart.delete()
+		return result
+
+
+class ArchivedTransactionQuerySet(TransactionRowQuerySet):
+	def drop_archived_duplicates(self, transactions: list["Transaction"]) -> list["Transaction"]:
+		"""Drop unsaved rows whose fingerprint already belongs to an archived row.
+
+		Archived rows were all posted before the horizon, so batches of newer
+		rows skip the lookup entirely.
+		"""
+
+		horizon = transaction_archive_horizon()
+		fingerprints = {row.fingerprint for row in transactions if row.fingerprint and row.posted_on < horizon}
+		if not fingerprints:
+			return transactions
+		archived = set(self.filter(fingerprint__in=fingerprints).values_list("fingerprint", flat=True))
+		if not archived:
+			return transactions
+		return [row for row in transactions if row.fingerprint not in archived]
+
+
+ArchivedTransactionManager = models.Manager.from_queryset(ArchivedTransactionQuerySet)
+
+
+class ArchivedTransaction(models.Model):
+	"""A transaction moved out of the hot table once it aged past the archive horizon.
+
+	Columns mirror ``Transaction`` one for one, so the read helpers of
+	``TransactionRowQuerySet`` build the same query against either table;
+	readers query the archive as a second step only when the rows they need
+	may be older than the horizon. Archived rows are read-only and still count
+	towards ledger balances, snapshots and rollups.
+	"""
+
+	id = models.UUIDField(primary_key=True, editable=False)
+	account = models.ForeignKey(
+		Account,
+		related_name="archived_transactions",
+		on_delete=models.CASCADE,
+	)
+	household = models.ForeignKey(
+		Household,
+		related_name="archived_transactions",
+		on_delete=models.PROTECT,
+	)
+	account_type = models.CharField(max_length=20, choices=AccountType.choices)
+	posted_on = models.DateField()
+	description = models.CharField(max_length=255)
+	transaction_type = models.CharField(max_length=20, choices=TransactionType.choices)
+	amount = MoneyField(max_digits=10)
+	category = models.ForeignKey(
+		"Category",
+		related_name="archived_transactions",
+		on_delete=models.SET_NULL,
+		blank=True,
+		null=True,
+	)
+	notes = models.TextField(blank=True)
+	transfer_counterpart = models.OneToOneField(
+		"self",
+		related_name="+",
+		on_delete=models.SET_NULL,
+		blank=True,
+		null=True,
+	)
+	fingerprint = models.CharField(max_length=64, blank=True, null=True)
+	created_at = models.DateTimeField()
+	archived_at = models.DateTimeField(auto_now_add=True)
+
+	objects = ArchivedTransactionManager()
+
+	class Meta:
+		ordering = ("-posted_on", "-created_at", "-id")
+		indexes = [
+			models.Index(
+				fields=["account", "posted_on", "created_at", "id"],
+				name="fin_archtxn_acct_posted_id",
+			),
+			models.Index(
+				fields=["household", "posted_on", "created_at", "id"],
+				name="fin_archtxn_hh_posted_id",
+			),
+		]
+		constraints = [
+			models.UniqueConstraint(
+				fields=["fingerprint"],
+				condition=Q(fingerprint__isnull=False),
+				name="fin_archtxn_fingerprint_unique",
+			),
+		]
+
+	@classmethod
+	def from_transaction(cls, row: Transaction) -> "ArchivedTransaction":
+		return cls(**{field.attname: getattr(row, field.attname) for field in Transaction._meta.concrete_fields})
+
+class RecurrenceFrequency(models.TextChoices):
+	WEEKLY = "weekly", "Weekly"
+	MONTHLY = "monthly", "Monthly"
+	YEARLY = "yearly", "Yearly"
+
+
+class RecurringTransactionQuerySet(models.QuerySet):
+	def for_account(self, account) -> "RecurringTransactionQuerySet":
+		if account is None:
+			return self.none()
+		return self.filter(account=account)
+
+	def due(self, through: date) -> "RecurringTransactionQuerySet":
+		"""Active schedules with at least one occurrence on or before ``through``."""
+
+		return self.filter(is_active=True, next_occurrence__lte=through).exclude(account__status=AccountStatus.CLOSED)
+
+
+RecurringTransactionManager = models.Manager.from_queryset(RecurringTransactionQuerySet)
+
+
+class RecurringTransaction(models.Model):
+	"""A repeating transaction; ``next_occurrence`` is the first one not yet materialized."""
+
+	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	account = models.ForeignKey(
+		Account,
+		related_name="recurring_transactions",
+		on_delete=models.CASCADE,
+	)
+	household = models.ForeignKey(
+		Household,
+		related_name="recurring_transactions",
+		on_delete=models.PROTECT,
+	)
+	description = models.CharField(max_length=255)
+	transaction_type = models.CharField(max_length=20, choices=TransactionType.choices)
+	amount = models.DecimalField(max_digits=10, decimal_places=2, help_text="Entered as a positive amount; signed per account type.")
+	category = models.ForeignKey(
+		"Category",
+		related_name="recurring_transactions",
+		on_delete=models.SET_NULL,
+		blank=True,
+		null=True,
+	)
+	frequency = models.CharField(max_length=10, choices=RecurrenceFrequency.choices, default=RecurrenceFrequency.MONTHLY)
+	interval = models.PositiveSmallIntegerField(default=1, validators=[MinValueValidator(1)])
+	starts_on = models.DateField()
+	ends_on = models.DateField(blank=True, null=True)
+	next_occurrence = models.DateField(editable=False)
+	is_active = models.BooleanField(default=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	objects = RecurringTransactionManager()
+
+	class Meta:
+		ordering = ("next_occurrence", "description")
+		indexes = [
+			models.Index(
+				fields=["next_occurrence"],
+				condition=Q(is_active=True),
+				name="fin_recurring_due_idx",
+			),
+		]
+
+	def __str__(self):
+		return f"{self.description} ({self.get_frequency_display()})"
+
+	def clean(self):
+		super().clean()
+		if self.account_id is not None:
+			self.household = self.account.household
+		if self.amount is not None and self.amount <= Decimal("0"):
+			raise ValidationError({"amount": "Amount must be greater than 0."})
+		if self.account_id is not None and self.transaction_type:
+			if self.transaction_type not in TransactionType.allowed_values_for_account(self.account.account_type):
+				raise ValidationError({"transaction_type": "This transaction type is not allowed for the account."})
+		if self.starts_on and self.ends_on and self.ends_on < self.starts_on:
+			raise ValidationError({"ends_on": "End date must be on or after the start date."})
+
 	def save(self, *args, **kwargs):
-		if self.account is not None:
+		if self.account_id is not None:
 			self.household = self.account.household
+		if self.next_occurrence is None:
+			self.next_occurrence = self.starts_on
 		self.full_clean()
 		return super().save(*args, **kwargs)
 
+	def following_occurrence(self, occurrence: date) -> date:
+		"""The occurrence after ``occurrence``; monthly dates stay anchored to ``starts_on``'s day."""
+
+		if self.frequency == RecurrenceFrequency.WEEKLY:
+			return date.fromordinal(occurrence.toordinal() + 7 * self.interval)
+		step = self.interval * (12 if self.frequency == RecurrenceFrequency.YEARLY else 1)
+		month_index = occurrence.year * 12 + occurrence.month - 1 + step
+		year, month = divmod(month_index, 12)
+		month += 1
+		return date(year, month, min(self.starts_on.day, calendar.monthrange(year, month)[1]))
+
+	def occurrence_fingerprint(self, occurrence: date) -> str:
+		"""Fingerprint of the transaction materialized for ``occurrence``, unique per schedule and date."""
+
+		return hashlib.sha256(f"recurring|{self.pk}|{occurrence.isoformat()}".encode("utf-8")).hexdigest()
+
+
+class AccountBalanceSnapshotQuerySet(models.QuerySet):
+	def for_account(self, account) -> "AccountBalanceSnapshotQuerySet":
+		if account is None:
+			return self.none()
+		return self.filter(account=account)
+
+	def closing_balance(self, month: date) -> Decimal:
+		"""Balance at the end of ``month``: the latest snapshot on or before it."""
+
+		balance = (
+			self.filter(month__lte=AccountBalanceSnapshot.normalize_month(month))
+			.order_by("-month")
+			.values_list("closing_balance", flat=True)
+			.first()
+		)
+		return balance if balance is not None else Decimal("0.00")
+
+	def apply_delta(self, account_id, posted_on: date, delta: Decimal) -> None:
+		"""Shift every closing balance from ``posted_on``'s month onward by ``delta``.
+
+		Months without activity have no row; readers carry the previous month
+		forward, so only the touched month may need to be created.
+		"""
+
+		month = AccountBalanceSnapshot.normalize_month(posted_on)
+		account_snapshots = self.filter(account_id=account_id)
+		account_snapshots.filter(month__gte=month).update(closing_balance=F("closing_balance") + money_value(delta))
+		if account_snapshots.filter(month=month).exists():
+			return
+		self.create(
+			account_id=account_id,
+			month=month,
+			closing_balance=account_snapshots.closing_balance(month) + delta,
+		)
+
+
+AccountBalanceSnapshotManager = models.Manager.from_queryset(AccountBalanceSnapshotQuerySet)
+
+
+class AccountBalanceSnapshot(models.Model):
+	"""Closing ledger balance of an account for each month with activity."""
+
+	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	account = models.ForeignKey(
+		Account,
+		related_name="balance_snapshots",
+		on_delete=models.CASCADE,
+	)
+	month = models.DateField()
+	closing_balance = MoneyField(max_digits=12)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	objects = AccountBalanceSnapshotManager()
+
+	class Meta:
+		ordering = ("account_id", "month")
+		constraints = [
+			models.UniqueConstraint(
+				fields=["account", "month"],
+				name="financial_balance_snapshot_account_month_unique",
+			)
+		]
+
+	@staticmethod
+	def normalize_month(value: date) -> date:
+		return date(value.year, value.month, 1)
+
+
+class CategoryMonthlyRollupQuerySet(models.QuerySet):
+	def for_household(self, household) -> "CategoryMonthlyRollupQuerySet":
+		if household is None:
+			return self.none()
+		return self.filter(household=household)
+
+	def apply_delta(
+		self,
+		*,
+		household_id,
+		category_id,
+		month: date,
+		transaction_type: str,
+		total: Decimal,
+		count: int,
+	) -> None:
+		"""Add ``total``/``count`` to one rollup bucket, creating it on first use."""
+
+		if not total and not count:
+			return
+		bucket = self.filter(
+			household_id=household_id,
+			category_id=category_id,
+			month=month,
+			transaction_type=transaction_type,
+		)
+		changes = {
+			"total": F("total") + money_value(total),
+			"transaction_count": F("transaction_count") + count,
+		}
+		if not bucket.update(**changes):
+			try:
+				with transaction.atomic():
+					self.create(
+						household_id=household_id,
+						category_id=category_id,
+						month=month,
+						transaction_type=transaction_type,
+						total=total,
+						transaction_count=count,
+					)
+				return
+			except IntegrityError:
+				# A concurrent writer created the bucket first.
+				bucket.update(**changes)
+		if count < 0:
+			bucket.filter(transaction_count__lte=0).delete()
+
+	def subtract_rows(self, rows: models.QuerySet) -> None:
+		"""Take ``rows`` (hot or archived transactions) out of their buckets, one delta per bucket.
+
+		For deletes that bypass ``Transaction.delete``; call it before the rows go.
+		"""
+
+		buckets = (
+			rows.order_by()
+			.annotate(month=TruncMonth("posted_on"))
+			.values("household_id", "category_id", "month", "transaction_type")
+			.annotate(total=Sum("amount"), count=Count("pk"))
+		)
+		for bucket in buckets:
+			total, count = bucket.pop("total"), bucket.pop("count")
+			self.apply_delta(**bucket, total=-total, count=-count)
+
+	def apply_change(self, before: dict | None, after: dict | None) -> None:
+		"""Move one transaction's contribution from its ``before`` to its ``after`` state.
+
+		Either side may be ``None`` for inserts and deletes; states are dicts of
+		``CategoryMonthlyRollup.STATE_FIELDS``.
+		"""
+
+		before_key = CategoryMonthlyRollup.bucket_key(before) if before else None
+		after_key = CategoryMonthlyRollup.bucket_key(after) if after else None
+		if before_key is not None and before_key == after_key:
+			self.apply_delta(**before_key, total=after["amount"] - before["amount"], count=0)
+			return
+		if before_key is not None:
+			self.apply_delta(**before_key, total=-before["amount"], count=-1)
+		if after_key is not None:
+			self.apply_delta(**after_key, total=after["amount"], count=1)
+
+
+CategoryMonthlyRollupManager = models.Manager.from_queryset(CategoryMonthlyRollupQuerySet)
+
+
+class CategoryMonthlyRollup(models.Model):
+	"""Signed total and row count of a household's transactions per category, month and type."""
+
+	STATE_FIELDS = ("household_id", "category_id", "posted_on", "transaction_type", "amount")
+
+	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	household = models.ForeignKey(
+		Household,
+		related_name="category_rollups",
+		on_delete=models.CASCADE,
+	)
+	category = models.ForeignKey(
+		"Category",
+		related_name="monthly_rollups",
+		on_delete=models.CASCADE,
+		blank=True,
+		null=True,
+	)
+	month = models.DateField()
+	transaction_type = models.CharField(max_length=20, choices=TransactionType.choices)
+	total = MoneyField(max_digits=14, default=Decimal("0.00"))
+	transaction_count = models.IntegerField(default=0)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	objects = CategoryMonthlyRollupManager()
+
+	class Meta:
+		ordering = ("household_id", "month", "category_id", "transaction_type")
+		constraints = [
+			models.UniqueConstraint(
+				fields=["household", "category", "month", "transaction_type"],
+				condition=Q(category__isnull=False),
+				name="financial_rollup_category_month_type_unique",
+			),
+			models.UniqueConstraint(
+				fields=["household", "month", "transaction_type"],
+				condition=Q(category__isnull=True),
+				name="financial_rollup_uncategorized_month_type_unique",
+			),
+		]
+		indexes = [
+			models.Index(fields=["household", "month"], name="fin_rollup_household_month"),
+		]
+
+	@staticmethod
+	def state_of(transaction_obj: "Transaction") -> dict:
+		return {field: getattr(transaction_obj, field) for field in CategoryMonthlyRollup.STATE_FIELDS}
+
+	@staticmethod
+	def bucket_key(state: dict) -> dict:
+		return {
+			"household_id": state["household_id"],
+			"category_id": state["category_id"],
+			"month": AccountBalanceSnapshot.normalize_month(state["posted_on"]),
+			"transaction_type": state["transaction_type"],
+		}
+
+
+class CategorizationMatchType(models.TextChoices):
+	PREFIX = "prefix", "Starts with"
+	CONTAINS = "contains", "Contains"
+	REGEX = "regex", "Regular expression"
+	AMOUNT = "amount", "Amount range"
+
+
+# Rules share one combined regex: backreferences would point at the wrong
+# group, group names would collide and global flags would no longer lead.
+REGEX_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+REGEX_NAMED_GROUP = re.compile(r"\(\?P<")
+REGEX_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+class CategorizationRule(models.Model):
+	"""Per-user rule that picks a category for new transactions.
+
+	Text patterns match the description case-insensitively with runs of
+	whitespace collapsed; amount bounds apply to the amount's magnitude.
+	"""
 
-class Category(models.Model):
 	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	user = models.ForeignKey(
+		settings.AUTH_USER_MODEL,
+		related_name="categorization_rules",
+		on_delete=models.CASCADE,
+	)
+	category = models.ForeignKey(
+		"Category",
+		related_name="rules",
+		on_delete=models.CASCADE,
+	)
+	match_type = models.CharField(max_length=10, choices=CategorizationMatchType.choices)
+	pattern = models.CharField(max_length=255, blank=True)
+	min_amount = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+	max_amount = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+	priority = models.PositiveSmallIntegerField(default=100, help_text="Lower numbers win when several rules match.")
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		ordering = ("priority", "created_at", "id")
+		indexes = [
+			models.Index(fields=["user", "priority", "created_at"], name="fin_catrule_user_priority"),
+		]
+
+	def __str__(self):
+		return f"{self.get_match_type_display()} {self.pattern!r} -> {self.category}"
+
+	@classmethod
+	def cache_key(cls, user_id) -> str:
+		"""Key for ``user_id``'s compiled rules, derived from the rules themselves.
+
+		Adding or editing a rule moves the latest ``updated_at`` and deleting one
+		(or its category) lowers the count, so every worker sees a new key.
+		"""
+
+		stamp = cls.objects.filter(user_id=user_id).aggregate(count=Count("pk"), latest=Max("updated_at"))
+		latest = stamp["latest"].isoformat() if stamp["latest"] else ""
+		return f"financial:categorization-rules:{user_id}:{stamp['count']}:{latest}"
+
+	def clean(self):
+		super().clean()
+		self.pattern = (self.pattern or "").strip()
+		if self.category_id is not None and self.user_id is not None and self.category.user_id != self.user_id:
+			raise ValidationError({"category": "Category belongs to another user."})
+		if self.match_type == CategorizationMatchType.AMOUNT:
+			if self.min_amount is None and self.max_amount is None:
+				raise ValidationError({"min_amount": "Amount rules need a minimum or maximum amount."})
+		elif not self.pattern:
+			raise ValidationError({"pattern": "Enter a pattern."})
+		if self.match_type == CategorizationMatchType.REGEX:
+			try:
+				re.compile(self.pattern)
+			except re.error as exc:
+				raise ValidationError({"pattern": f"Invalid regular expression: {exc}."}) from exc
+			if REGEX_BACKREFERENCE.search(self.pattern):
+				raise ValidationError({"pattern": "Backreferences are not supported."})
+			if REGEX_NAMED_GROUP.search(self.pattern):
+				raise ValidationError({"pattern": "Named groups are not supported; use (?:...) instead."})
+			if REGEX_GLOBAL_FLAGS.search(self.pattern):
+				raise ValidationError({"pattern": "Inline flags are not supported; rules already ignore case."})
+		for field in ("min_amount", "max_amount"):
+			value = getattr(self, field)
+			if value is not None and value < Decimal("0"):
+				raise ValidationError({field: "Amount bounds cannot be negative."})
+		if self.min_amount is not None and self.max_amount is not None and self.min_amount > self.max_amount:
+			raise ValidationError({"max_amount": "Maximum amount must be at least the minimum amount."})
+
+	def save(self, *args, **kwargs):
+		self.full_clean()
+		return super().save(*args, **kwargs)
+
+
+class Category(models.Model):
+	id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 	user = models.ForeignKey(
 		settings.AUTH_USER_MODEL,
 		related_name="transaction_categories",
@@ -494,5 +1383,38 @@ class Category(models.Model):
 			)
 		]
 
+	def save(self, *args, **kwargs):
+		adding = self._state.adding
+		with transaction.atomic():
+			result = super().save(*args, **kwargs)
+			if not adding:
+				# A rename shows up in every transaction row filed under this category.
+				mark_households_changed(
+					CategoryMonthlyRollup.objects.filter(category=self).values_list("household_id", flat=True).distinct()
+				)
+		return result
+
+	def delete(self, *args, **kwargs):
+		# Transactions fall back to uncategorized (SET_NULL) without save(), so
+		# fold this category's rollups into the uncategorized buckets here.
+		with transaction.atomic():
+			rollups = list(
+				CategoryMonthlyRollup.objects.filter(category=self).values(
+					"household_id", "month", "transaction_type", "total", "transaction_count"
+				)
+			)
+			result = super().delete(*args, **kwargs)
+			for rollup in rollups:
+				CategoryMonthlyRollup.objects.apply_delta(
+					household_id=rollup["household_id"],
+					category_id=None,
+					month=rollup["month"],
+					transaction_type=rollup["transaction_type"],
+					total=rollup["total"],
+					count=rollup["transaction_count"],
+				)
+			mark_households_changed(rollup["household_id"] for rollup in rollups)
+		return result
+
 	def __str__(self):
 		return self.name
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from django import forms
+from django.core import exceptions
+from django.core.validators import DecimalValidator
+from django.db import models
+from django.db.models import Value
+from django.utils.functional import cached_property
+
+
+MONEY_DECIMAL_PLACES = 2
+
+
+def to_minor_units(amount: Decimal | int | str, places: int = MONEY_DECIMAL_PLACES) -> int:
+    """Whole number of minor units in ``amount``, rounding half up past ``places``."""
+
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    scaled = amount.scaleb(places)
+    if scaled != scaled.to_integral_value():
+        scaled = scaled.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    return int(scaled)
+
+
+def from_minor_units(minor_units: int | Decimal, places: int = MONEY_DECIMAL_PLACES) -> Decimal:
+    """``Decimal`` with exactly ``places`` decimal places; no rounding is ever needed."""
+
+    return Decimal(minor_units).scaleb(-places)
+
+
+@dataclass(frozen=True, slots=True)
+class Money:
+    """An integer count of cents.
+
+    Arithmetic and formatting stay in integers; ``amount`` is the ``Decimal``
+    view used at form and template boundaries.
+    """
+
+    minor_units: int
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal | int | str) -> "Money":
+        return cls(to_minor_units(amount))
+
+    @property
+    def amount(self) -> Decimal:
+        return from_minor_units(self.minor_units)
+
+    def __add__(self, other: "Money") -> "Money":
+        return Money(self.minor_units + other.minor_units)
+
+    def __sub__(self, other: "Money") -> "Money":
+        return Money(self.minor_units - other.minor_units)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.minor_units)
+
+    def __bool__(self) -> bool:
+        return bool(self.minor_units)
+
+    def format(self) -> str:
+        whole, fraction = divmod(abs(self.minor_units), 10**MONEY_DECIMAL_PLACES)
+        sign = "-" if self.minor_units < 0 else ""
+        return f"{sign}${whole:,}.{fraction:0{MONEY_DECIMAL_PLACES}d}"
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class MoneyField(models.BigIntegerField):
+    """Monetary amount stored as a ``bigint`` count of minor units.
+
+    Python code keeps seeing ``Decimal`` values with ``decimal_places`` places,
+    while the database stores, compares and ``SUM``s plain integers. Wrap
+    ``Decimal`` operands of ``F()`` arithmetic in ``money_value()`` so they are
+    scaled the same way.
+    """
+
+    description = "Monetary amount stored in minor units"
+    default_error_messages = {
+        "invalid": "“%(value)s” value must be a decimal number.",
+    }
+
+    def __init__(self, *args, max_digits: int = 12, decimal_places: int = MONEY_DECIMAL_PLACES, **kwargs):
+        self.max_digits = max_digits
+        self.decimal_places = decimal_places
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["max_digits"] = self.max_digits
+        if self.decimal_places != MONEY_DECIMAL_PLACES:
+            kwargs["decimal_places"] = self.decimal_places
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        return [*self.default_validators, *self._validators, DecimalValidator(self.max_digits, self.decimal_places)]
+
+    def to_python(self, value):
+        if value is None or isinstance(value, Decimal):
+            return value
+        try:
+            amount = Decimal(str(value).strip())
+        except InvalidOperation:
+            raise exceptions.ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"value": value},
+            ) from None
+        if not amount.is_finite():
+            raise exceptions.ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"value": value},
+            )
+        return amount
+
+    def get_prep_value(self, value):
+        if hasattr(value, "resolve_expression"):
+            return value
+        value = self.to_python(value)
+        if value is None:
+            return None
+        return to_minor_units(value, self.decimal_places)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return from_minor_units(value, self.decimal_places)
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(
+            self,
+            **{
+                "form_class": forms.DecimalField,
+                "max_digits": self.max_digits,
+                "decimal_places": self.decimal_places,
+                **kwargs,
+            },
+        )
+
+
+def money_value(amount: Decimal) -> Value:
+    """``amount`` as a query value scaled to minor units, for ``F()`` arithmetic on a ``MoneyField``."""
+
+    return Value(amount, output_field=MoneyField())
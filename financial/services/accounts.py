@@ -3,11 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List, Optional
 
-from django.urls import NoReverseMatch, reverse
+from django.template.loader import render_to_string
 
-from financial.models import Account, AccountStatus
+from financial.fragments import ACCOUNT_ROW_FRAGMENT, cached_fragments, fragment_key
+from financial.models import ACCOUNT_TYPE_ORDER, Account, AccountStatus
 
 from .formatters import format_usd
+from .routes import RouteTemplate, route_template
 
 
 STATUS_BADGE_CLASSES = {
@@ -17,11 +19,23 @@ STATUS_BADGE_CLASSES = {
 }
 
 
-def _safe_reverse(route: str, *, args: list[str]) -> str:
-    try:
-        return reverse(route, args=args)
-    except NoReverseMatch:
-        return "#"
+@dataclass(frozen=True, slots=True)
+class AccountRowUrls:
+    """Row URL templates; resolve once per batch of rows."""
+
+    preview: RouteTemplate
+    open: RouteTemplate
+    edit: RouteTemplate
+    delete: RouteTemplate
+
+    @classmethod
+    def resolve(cls) -> "AccountRowUrls":
+        return cls(
+            preview=route_template("financial:accounts-preview", 1),
+            open=route_template("financial:accounts-detail", 1),
+            edit=route_template("financial:accounts-edit", 1),
+            delete=route_template("financial:accounts-delete-confirm", 1),
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,7 +58,8 @@ class AccountSummaryRow:
     delete_url: str
 
     @classmethod
-    def from_account(cls, account: Account) -> "AccountSummaryRow":
+    def from_account(cls, account: Account, *, urls: Optional[AccountRowUrls] = None) -> "AccountSummaryRow":
+        urls = urls or AccountRowUrls.resolve()
         account_type_label_check = "CC" if account.account_type == "credit_card" else account.get_account_type_display()
         
         return cls(
@@ -58,17 +73,89 @@ class AccountSummaryRow:
             status_label=account.get_status_display(),
             status_badge_class=STATUS_BADGE_CLASSES.get(account.status, "badge"),
             current_balance_display=format_usd(account.current_balance),
-            preview_url=_safe_reverse("financial:accounts-preview", args=[account.id]),
-            open_url=_safe_reverse("financial:accounts-detail", args=[account.id]),
-            edit_url=_safe_reverse("financial:accounts-edit", args=[account.id]),
-            delete_url=_safe_reverse("financial:accounts-delete-confirm", args=[account.id]),
+            preview_url=urls.preview.format(account.id),
+            open_url=urls.open.format(account.id),
+            edit_url=urls.edit.format(account.id),
+            delete_url=urls.delete.format(account.id),
         )
 
 
 def serialize_account_rows(accounts: Iterable[Account]) -> List[AccountSummaryRow]:
     """Convert queryset into deterministic cotton component payload."""
 
-    return [AccountSummaryRow.from_account(account) for account in accounts]
+    urls = AccountRowUrls.resolve()
+    return [AccountSummaryRow.from_account(account, urls=urls) for account in accounts]
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRowFragment:
+    row: AccountSummaryRow
+    html: str
+
+
+def _render_account_row(account: Account, urls: AccountRowUrls) -> AccountRowFragment:
+    row = AccountSummaryRow.from_account(account, urls=urls)
+    return AccountRowFragment(row=row, html=render_to_string("components/financial/account_row.html", {"row": row}))
+
+
+def account_row_fragments(accounts: Iterable[Account]) -> List[AccountRowFragment]:
+    """Serialized and rendered table rows, served from the fragment cache until an account changes."""
+
+    urls = AccountRowUrls.resolve()
+    return cached_fragments(
+        accounts,
+        key=lambda account: fragment_key(ACCOUNT_ROW_FRAGMENT, account.pk, account.updated_at),
+        render=lambda account: _render_account_row(account, urls),
+    )
+
+
+ROW_PATCH_REPLACE = "replace"
+ROW_PATCH_DELETE = "delete"
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRowPatch:
+    """A single-row change to an already rendered accounts table."""
+
+    action: str
+    row_id: str
+    row: Optional[AccountSummaryRow] = None
+
+
+def account_order_key(account: Account) -> tuple:
+    """Python mirror of ``AccountQuerySet.ordered()`` for a single account."""
+
+    return (
+        ACCOUNT_TYPE_ORDER.get(account.account_type, len(ACCOUNT_TYPE_ORDER)),
+        account.name,
+        account.created_at,
+    )
+
+
+def diff_account_rows(
+    household,
+    *,
+    account_id,
+    before_key: tuple,
+    after: Optional[Account],
+) -> Optional[List[AccountRowPatch]]:
+    """Row patches that bring the rendered accounts table up to date after one account changed.
+
+    ``before_key`` is the account's ``account_order_key`` as last rendered
+    and ``after`` the saved account (``None`` once deleted). Returns ``None``
+    when the whole table has to be re-rendered: the ordering key changed, or
+    the last account was deleted and the table switches to its empty state.
+    """
+
+    if after is None:
+        if not Account.objects.for_household(household).exists():
+            return None
+        return [AccountRowPatch(action=ROW_PATCH_DELETE, row_id=str(account_id))]
+
+    if before_key != account_order_key(after):
+        return None
+    row = AccountSummaryRow.from_account(after)
+    return [AccountRowPatch(action=ROW_PATCH_REPLACE, row_id=row.id, row=row)]
 
 
 @dataclass(frozen=True, slots=True)
@@ -79,6 +166,7 @@ class AccountPreviewDTO:
     status_label: str
     status_badge_class: str
     current_balance_display: str
+    ledger_balance_display: str
     credit_limit_display: Optional[str]
     has_credit_limit: bool
     statement_close_date_display: Optional[str]
@@ -104,6 +192,7 @@ def build_account_preview(account: Account) -> AccountPreviewDTO:
         status_label=account.get_status_display(),
         status_badge_class=STATUS_BADGE_CLASSES.get(account.status, "badge"),
         current_balance_display=format_usd(account.current_balance),
+        ledger_balance_display=format_usd(account.ledger_balance),
         credit_limit_display=credit_limit_display,
         has_credit_limit=credit_limit_display is not None,
         statement_close_date_display=statement_display,
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from django.db import transaction
+
+from financial.models import ArchivedTransaction, Transaction, transaction_archive_horizon
+
+
+ARCHIVE_BATCH_SIZE = 2000
+
+
+@dataclass(frozen=True)
+class TransactionArchiveResult:
+    before: date
+    transactions: int
+    batches: int
+
+
+def _archive_batch(before: date, batch_size: int) -> int:
+    with transaction.atomic():
+        candidates = list(
+            Transaction.objects.filter(posted_on__lt=before)
+            .order_by()
+            .values_list("pk", "transfer_counterpart_id")[:batch_size]
+        )
+        if not candidates:
+            return 0
+        # Transfer legs share a posted_on, so both are old enough; move them together.
+        pks = {pk for pk, _ in candidates} | {counterpart for _, counterpart in candidates if counterpart}
+        rows = list(Transaction.objects.select_for_update().filter(pk__in=pks, posted_on__lt=before))
+        ArchivedTransaction.objects.bulk_create([ArchivedTransaction.from_transaction(row) for row in rows])
+        # A queryset delete skips Transaction.delete(), so balances, snapshots and rollups stay as they are.
+        Transaction.objects.filter(pk__in=[row.pk for row in rows]).delete()
+    return len(rows)
+
+
+def archive_transactions(*, before: date | None = None, batch_size: int = ARCHIVE_BATCH_SIZE) -> TransactionArchiveResult:
+    """Move transactions posted before ``before`` from the hot table to the archive.
+
+    ``before`` defaults to the archive horizon and may not be later than it:
+    readers skip the archive for ranges starting on or after the horizon.
+    Each batch of ``batch_size`` rows is copied and deleted in its own atomic
+    block, so a long run never holds locks on the whole history. Archived rows
+    still count towards ledger balances, snapshots and rollups.
+    """
+
+    horizon = transaction_archive_horizon()
+    before = before or horizon
+    if before > horizon:
+        raise ValueError(f"Transactions can only be archived before the archive horizon ({horizon.isoformat()}).")
+
+    archived = 0
+    batches = 0
+    while moved := _archive_batch(before, batch_size):
+        archived += moved
+        batches += 1
+    return TransactionArchiveResult(before=before, transactions=archived, batches=batches)
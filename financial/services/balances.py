@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+from financial.models import Account, AccountBalanceSnapshot, ArchivedTransaction, Transaction
+
+
+def _next_month(month: date) -> date:
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+def closing_balance_for_month(account: Account, month: date) -> Decimal:
+    """Ledger balance at the end of ``month`` read from a single snapshot row."""
+
+    return AccountBalanceSnapshot.objects.for_account(account).closing_balance(month)
+
+
+def monthly_closing_balances(account: Account, *, start: date, end: date) -> list[tuple[date, Decimal]]:
+    """Closing balance for every month in ``[start, end]``, carrying quiet months forward."""
+
+    start = AccountBalanceSnapshot.normalize_month(start)
+    end = AccountBalanceSnapshot.normalize_month(end)
+    snapshots = AccountBalanceSnapshot.objects.for_account(account)
+    stored = dict(snapshots.filter(month__gte=start, month__lte=end).values_list("month", "closing_balance"))
+    balance = snapshots.closing_balance(start)
+
+    series: list[tuple[date, Decimal]] = []
+    month = start
+    while month <= end:
+        balance = stored.get(month, balance)
+        series.append((month, balance))
+        month = _next_month(month)
+    return series
+
+
+def rebuild_balance_snapshots(account_ids: Iterable) -> int:
+    """Recompute snapshots for ``account_ids`` from one monthly aggregate per table (hot and archived).
+
+    The accounts are locked before aggregating: transaction writers hold the
+    same lock while applying their snapshot delta, so none can land between
+    the read and the replacement and be overwritten.
+    """
+
+    account_ids = list(account_ids)
+    with transaction.atomic():
+        Transaction.objects.lock_accounts(account_ids)
+        snapshots = _snapshots_from_transactions(account_ids)
+        AccountBalanceSnapshot.objects.filter(account_id__in=account_ids).delete()
+        AccountBalanceSnapshot.objects.bulk_create(snapshots, batch_size=1000)
+    return len(snapshots)
+
+
+def _snapshots_from_transactions(account_ids: list) -> list[AccountBalanceSnapshot]:
+    monthly_totals: dict = defaultdict(Decimal)
+    for model in (Transaction, ArchivedTransaction):
+        totals = (
+            model.objects.filter(account_id__in=account_ids)
+            .annotate(month=TruncMonth("posted_on"))
+            .order_by()
+            .values("account_id", "month")
+            .annotate(total=Sum("amount"))
+            .values_list("account_id", "month", "total")
+        )
+        for account_id, month, total in totals.iterator():
+            monthly_totals[(account_id, month)] += total
+
+    snapshots: list[AccountBalanceSnapshot] = []
+    current_account_id = None
+    running = Decimal("0.00")
+    for (account_id, month), total in sorted(monthly_totals.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+        if account_id != current_account_id:
+            current_account_id = account_id
+            running = Decimal("0.00")
+        running += total
+        snapshots.append(AccountBalanceSnapshot(account_id=account_id, month=month, closing_balance=running))
+    return snapshots
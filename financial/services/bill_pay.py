@@ -6,10 +6,12 @@ from decimal import Decimal
 
 from django.db.models import Case, IntegerField, QuerySet, When
 from django.db.models.functions import Lower
-from django.urls import reverse
+from django.template.loader import render_to_string
 
+from financial.fragments import BILL_PAY_ROW_FRAGMENT, cached_fragments, fragment_key, fragment_version
 from financial.models import Account, AccountStatus, AccountType, MonthlyBillPayment
 from financial.services.formatters import format_usd
+from financial.services.routes import route_template
 
 LIABILITY_TYPES = [AccountType.CREDIT_CARD, AccountType.LOAN, AccountType.OTHER]
 
@@ -66,6 +68,7 @@ class BillPayRow:
     edit_url: str
     save_url: str
     month_param: str
+    fragment_version: str
 
 
 @dataclass(frozen=True, slots=True)
@@ -118,7 +121,10 @@ def monthly_payments_by_account(accounts: QuerySet[Account], month: date) -> dic
     account_ids = [account.id for account in accounts]
     if not account_ids:
         return {}
-    payments = MonthlyBillPayment.objects.filter(account_id__in=account_ids, month=normalize_month(month))
+    payments = MonthlyBillPayment.objects.filter(
+        account_id__in=account_ids,
+        month=normalize_month(month),
+    ).select_related("funding_account")
     return {str(payment.account_id): payment for payment in payments}
 
 
@@ -126,9 +132,11 @@ def build_bill_pay_rows(accounts: QuerySet[Account], month: date) -> list[BillPa
     normalized_month = normalize_month(month)
     month_param = month_to_query_value(normalized_month)
     payments_map = monthly_payments_by_account(accounts, normalized_month)
+    row_url_template = route_template("financial:bill-pay-row", 1)
     rows: list[BillPayRow] = []
 
     for account in accounts:
+        row_url = f"{row_url_template.format(account.id)}?month={month_param}"
         payment = payments_map.get(str(account.id))
         amount = payment.actual_payment_amount if payment else None
         funding_account = payment.funding_account if payment else None
@@ -149,15 +157,34 @@ def build_bill_pay_rows(accounts: QuerySet[Account], month: date) -> list[BillPa
                 funding_account_display=funding_account.name if funding_account is not None else "—",
                 paid=paid,
                 paid_label="Paid" if paid else "Not paid",
-                edit_url=f"{reverse('financial:bill-pay-row', args=[account.id])}?month={month_param}",
-                save_url=f"{reverse('financial:bill-pay-row', args=[account.id])}?month={month_param}",
+                edit_url=row_url,
+                save_url=row_url,
                 month_param=month_param,
+                # Everything the rendered row depends on: the account, its payment and the funding account.
+                fragment_version=":".join(
+                    [
+                        month_param,
+                        fragment_version(account.updated_at),
+                        fragment_version(payment.updated_at if payment else None),
+                        fragment_version(funding_account.updated_at if funding_account is not None else None),
+                    ]
+                ),
             )
         )
 
     return rows
 
 
+def bill_pay_row_fragments(rows: list[BillPayRow]) -> list[str]:
+    """Rendered ``_row.html`` for each row, served from the fragment cache until its inputs change."""
+
+    return cached_fragments(
+        rows,
+        key=lambda row: fragment_key(BILL_PAY_ROW_FRAGMENT, row.account_id, row.fragment_version),
+        render=lambda row: render_to_string("financial/bill_pay/_row.html", {"row": row}),
+    )
+
+
 def build_bill_pay_row(*, account: Account, month: date) -> BillPayRow:
     rows = build_bill_pay_rows(Account.objects.filter(pk=account.pk), month)
     return rows[0]
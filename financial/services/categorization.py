@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from financial.models import (
+    CategorizationMatchType,
+    CategorizationRule,
+    CategoryMonthlyRollup,
+    Transaction,
+    mark_households_changed,
+)
+
+
+RULES_CACHE_TIMEOUT = 60 * 60
+_TRIE_RANKS = ""
+_RULE_GROUP = "_rule"
+_TEXT_FLAGS = re.IGNORECASE | re.DOTALL
+
+
+def normalize_rule_text(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def _compile_rules(text_rules: Iterable[tuple[int, str]]):
+    for rank, regex in text_rules:
+        try:
+            yield rank, re.compile(regex, _TEXT_FLAGS)
+        except re.error:
+            # Only rules written without clean() can get here; they never match.
+            continue
+
+
+class CategoryRuleMatcher:
+    """One user's rules compiled into a prefix trie plus a single combined regex.
+
+    Prefix rules are found with one walk down the trie; substring and regex
+    rules are each an optional lookahead in one pattern, so a single match
+    call reports every text rule that hits. The matching rule with the best
+    rank (priority, then age) whose amount bounds also hold wins.
+    """
+
+    def __init__(self, rules: Iterable[CategorizationRule]):
+        self._categories: list = []
+        self._bounds: list[tuple[Decimal | None, Decimal | None]] = []
+        self._trie: dict = {}
+        self._amount_ranks: list[int] = []
+        text_rules: list[tuple[int, str]] = []
+        for rank, rule in enumerate(rules):
+            self._categories.append(rule.category_id)
+            self._bounds.append((rule.min_amount, rule.max_amount))
+            if rule.match_type == CategorizationMatchType.PREFIX:
+                node = self._trie
+                for char in normalize_rule_text(rule.pattern):
+                    node = node.setdefault(char, {})
+                node.setdefault(_TRIE_RANKS, []).append(rank)
+            elif rule.match_type == CategorizationMatchType.CONTAINS:
+                text_rules.append((rank, re.escape(normalize_rule_text(rule.pattern))))
+            elif rule.match_type == CategorizationMatchType.REGEX:
+                text_rules.append((rank, rule.pattern))
+            else:
+                self._amount_ranks.append(rank)
+        self._pattern = None
+        self._rule_patterns: list[tuple[int, re.Pattern]] = []
+        if text_rules:
+            try:
+                self._pattern = re.compile(
+                    "".join(f"(?:(?=.*?(?P<{_RULE_GROUP}{rank}>{regex}))|)" for rank, regex in text_rules),
+                    _TEXT_FLAGS,
+                )
+            except re.error:
+                # Rules saved before clean() checked for it can still clash once combined
+                # (a repeated group name, say), so fall back to one search per rule.
+                self._rule_patterns = list(_compile_rules(text_rules))
+
+    def __bool__(self) -> bool:
+        return bool(self._categories)
+
+    def _text_ranks(self, text: str) -> list[int]:
+        ranks: list[int] = []
+        node = self._trie
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            ranks.extend(node.get(_TRIE_RANKS, ()))
+        if self._pattern is not None:
+            groups = self._pattern.match(text).groupdict()
+            ranks.extend(int(name[len(_RULE_GROUP):]) for name, value in groups.items() if value is not None)
+        ranks.extend(rank for rank, pattern in self._rule_patterns if pattern.search(text))
+        return ranks
+
+    def match(self, description: str, amount: Decimal | None):
+        """Category id of the best rule matching ``description`` and ``amount``, or ``None``."""
+
+        if not self._categories:
+            return None
+        magnitude = abs(amount) if amount is not None else None
+        for rank in sorted(self._text_ranks(normalize_rule_text(description or "")) + self._amount_ranks):
+            low, high = self._bounds[rank]
+            if low is None and high is None:
+                return self._categories[rank]
+            if magnitude is None:
+                continue
+            if (low is None or magnitude >= low) and (high is None or magnitude <= high):
+                return self._categories[rank]
+        return None
+
+
+def rules_matcher_for_user(user_id) -> CategoryRuleMatcher:
+    """Compiled rules for ``user_id``; one small aggregate query checks they are current."""
+
+    key = CategorizationRule.cache_key(user_id)
+    matcher = cache.get(key)
+    if matcher is None:
+        rules = CategorizationRule.objects.filter(user_id=user_id).order_by("priority", "created_at", "id")
+        matcher = CategoryRuleMatcher(rules.only("category_id", "match_type", "pattern", "min_amount", "max_amount"))
+        cache.set(key, matcher, RULES_CACHE_TIMEOUT)
+    return matcher
+
+
+def recategorize_history(user_id, *, overwrite: bool = False, chunk_size: int = 1000) -> int:
+    """Apply ``user_id``'s rules to transactions in their accounts, ``chunk_size`` rows at a time.
+
+    Only uncategorized rows are touched unless ``overwrite`` is set; rows no
+    rule matches keep their category. Rollups move with each changed row.
+    """
+
+    matcher = rules_matcher_for_user(user_id)
+    if not matcher:
+        return 0
+    candidates = Transaction.objects.filter(account__user_id=user_id).order_by("pk")
+    if not overwrite:
+        candidates = candidates.filter(category__isnull=True)
+
+    changed = 0
+    last_pk = None
+    while True:
+        with transaction.atomic():
+            chunk_qs = candidates if last_pk is None else candidates.filter(pk__gt=last_pk)
+            rows = list(
+                chunk_qs.select_for_update(of=("self",)).values(
+                    "pk", "description", *CategoryMonthlyRollup.STATE_FIELDS
+                )[:chunk_size]
+            )
+            if not rows:
+                break
+            updates: dict = defaultdict(list)
+            buckets: dict = defaultdict(lambda: [Decimal("0.00"), 0])
+            households: set = set()
+            for row in rows:
+                category_id = matcher.match(row["description"], row["amount"])
+                if category_id is None or category_id == row["category_id"]:
+                    continue
+                updates[category_id].append(row["pk"])
+                households.add(row["household_id"])
+                before = buckets[tuple(CategoryMonthlyRollup.bucket_key(row).items())]
+                before[0] -= row["amount"]
+                before[1] -= 1
+                after = buckets[tuple(CategoryMonthlyRollup.bucket_key({**row, "category_id": category_id}).items())]
+                after[0] += row["amount"]
+                after[1] += 1
+            for category_id, pks in updates.items():
+                changed += Transaction.objects.filter(pk__in=pks).update(category_id=category_id)
+            for key, (total, count) in buckets.items():
+                CategoryMonthlyRollup.objects.apply_delta(**dict(key), total=total, count=count)
+            mark_households_changed(households)
+        last_pk = rows[-1]["pk"]
+    return changed
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
+
+from financial.money import Money
 
 
 def to_decimal(value: Decimal | float | int | str) -> Decimal:
@@ -12,7 +14,4 @@ def to_decimal(value: Decimal | float | int | str) -> Decimal:
 def format_usd(value: Decimal | float | int | str) -> str:
     """Format numeric input as USD currency with deterministic rounding."""
 
-    amount = to_decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    sign = "-" if amount < 0 else ""
-    absolute_value = abs(amount)
-    return f"{sign}${absolute_value:,.2f}"
+    return Money.from_decimal(to_decimal(value)).format()
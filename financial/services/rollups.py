@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+from financial.models import (
+    Account,
+    AccountBalanceSnapshot,
+    ArchivedTransaction,
+    CategoryMonthlyRollup,
+    Transaction,
+    TransactionType,
+)
+from financial.services.formatters import format_usd
+
+
+# Spending is outflow: expenses are stored negative, liability charges positive.
+SPENDING_SIGNS = {
+    TransactionType.EXPENSE: Decimal("-1"),
+    TransactionType.CHARGE: Decimal("1"),
+}
+UNCATEGORIZED_LABEL = "Uncategorized"
+
+
+@dataclass(frozen=True, slots=True)
+class CategorySpendingRow:
+    category_id: str | None
+    label: str
+    monthly_displays: List[str]
+    total: Decimal
+    total_display: str
+    transaction_count: int
+    share_percent: int
+
+
+@dataclass(frozen=True, slots=True)
+class CategorySpendingReport:
+    months: List[date]
+    rows: List[CategorySpendingRow]
+    total_display: str
+
+
+def _month_range(start: date, end: date) -> list[date]:
+    months = []
+    month = AccountBalanceSnapshot.normalize_month(start)
+    end = AccountBalanceSnapshot.normalize_month(end)
+    while month <= end:
+        months.append(month)
+        month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+    return months
+
+
+def category_spending(household, *, start: date, end: date) -> CategorySpendingReport:
+    """Per-category spending for each month in ``[start, end]`` read from rollup rows."""
+
+    months = _month_range(start, end)
+    if not months:
+        return CategorySpendingReport(months=[], rows=[], total_display=format_usd(Decimal("0.00")))
+    rollups = (
+        CategoryMonthlyRollup.objects.for_household(household)
+        .filter(month__gte=months[0], month__lte=months[-1], transaction_type__in=list(SPENDING_SIGNS))
+        .values_list("category_id", "category__name", "month", "transaction_type", "total", "transaction_count")
+    )
+
+    month_index = {month: idx for idx, month in enumerate(months)}
+    buckets: dict = {}
+    for category_id, category_name, month, transaction_type, total, count in rollups:
+        bucket = buckets.setdefault(
+            category_id,
+            {"label": category_name or UNCATEGORIZED_LABEL, "monthly": [Decimal("0.00")] * len(months), "count": 0},
+        )
+        bucket["monthly"][month_index[month]] += total * SPENDING_SIGNS[transaction_type]
+        bucket["count"] += count
+
+    grand_total = sum((sum(bucket["monthly"]) for bucket in buckets.values()), Decimal("0.00"))
+    rows = []
+    for category_id, bucket in buckets.items():
+        total = sum(bucket["monthly"], Decimal("0.00"))
+        rows.append(
+            CategorySpendingRow(
+                category_id=str(category_id) if category_id else None,
+                label=bucket["label"],
+                monthly_displays=[format_usd(amount) for amount in bucket["monthly"]],
+                total=total,
+                total_display=format_usd(total),
+                transaction_count=bucket["count"],
+                share_percent=int(total * 100 / grand_total) if grand_total > 0 else 0,
+            )
+        )
+    rows.sort(key=lambda row: (-row.total, row.label.lower()))
+    return CategorySpendingReport(months=months, rows=rows, total_display=format_usd(grand_total))
+
+
+def rebuild_category_rollups(household_ids: Iterable) -> int:
+    """Recompute rollups for ``household_ids`` from one grouped aggregate per table (hot and archived).
+
+    The households' accounts are locked before aggregating, as in
+    ``rebuild_balance_snapshots``, so no concurrent rollup delta is lost.
+    """
+
+    household_ids = list(household_ids)
+    with transaction.atomic():
+        Transaction.objects.lock_accounts(
+            Account.objects.filter(household_id__in=household_ids).values_list("pk", flat=True)
+        )
+        rollups = _rollups_from_transactions(household_ids)
+        CategoryMonthlyRollup.objects.filter(household_id__in=household_ids).delete()
+        CategoryMonthlyRollup.objects.bulk_create(rollups, batch_size=1000)
+    return len(rollups)
+
+
+def _rollups_from_transactions(household_ids: list) -> list[CategoryMonthlyRollup]:
+    totals: dict = defaultdict(lambda: [Decimal("0.00"), 0])
+    for model in (Transaction, ArchivedTransaction):
+        buckets = (
+            model.objects.filter(household_id__in=household_ids)
+            .annotate(month=TruncMonth("posted_on"))
+            .order_by()
+            .values_list("household_id", "category_id", "month", "transaction_type")
+            .annotate(total=Sum("amount"), transaction_count=Count("id"))
+        )
+        for household_id, category_id, month, transaction_type, total, count in buckets.iterator():
+            bucket = totals[(household_id, category_id, month, transaction_type)]
+            bucket[0] += total
+            bucket[1] += count
+    return [
+        CategoryMonthlyRollup(
+            household_id=household_id,
+            category_id=category_id,
+            month=month,
+            transaction_type=transaction_type,
+            total=total,
+            transaction_count=count,
+        )
+        for (household_id, category_id, month, transaction_type), (total, count) in totals.items()
+    ]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Greatest
+
+from financial.models import ArchivedTransaction, ArchivedTransactionQuerySet, Transaction, TransactionRowQuerySet
+from financial.services.transactions import (
+    TRANSACTIONS_PAGE_SIZE,
+    TransactionCursor,
+    TransactionCursorError,
+    TransactionPage,
+    fetch_transaction_page,
+)
+
+
+SEARCH_ORDERING = ("-search_rank", "-posted_on", "-created_at", "-id")
+SEARCHABLE_MODELS = (Transaction, ArchivedTransaction)
+
+
+def sqlite_fts_tables(model) -> tuple[str, str]:
+    """``(fts_table, keys_table)`` of the FTS5 index kept over ``model``'s table.
+
+    The keys table maps each row id to the integer key its index row uses. The
+    transaction tables have UUID primary keys, so their implicit rowid is not
+    stable (VACUUM and migration table rebuilds renumber it).
+    """
+
+    table = model._meta.db_table
+    return f"{table}_fts", f"{table}_fts_keys"
+
+
+def sqlite_fts_triggers(model) -> tuple[str, str, str]:
+    fts_table, _ = sqlite_fts_tables(model)
+    return f"{fts_table}_ai", f"{fts_table}_ad", f"{fts_table}_au"
+
+
+SQLITE_FTS_TABLE, SQLITE_FTS_KEYS_TABLE = sqlite_fts_tables(Transaction)
+SQLITE_FTS_TRIGGERS = sqlite_fts_triggers(Transaction)
+
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_search_query(query: str | None) -> str:
+    return " ".join((query or "").split())
+
+
+def _sqlite_match_expression(query: str) -> str:
+    """Quote every token as an FTS5 prefix phrase so user input is never parsed as syntax."""
+
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN_RE.findall(query))
+
+
+def _sqlite_fts_key(keys_table: str, row: str) -> str:
+    return f"(SELECT id FROM {keys_table} WHERE transaction_id = {row}.id)"
+
+
+def _rank_sqlite(queryset: TransactionRowQuerySet, query: str) -> TransactionRowQuerySet:
+    match = _sqlite_match_expression(query)
+    if not match:
+        return queryset.none()
+    fts_table, keys_table = sqlite_fts_tables(queryset.model)
+    quoted_table = f'"{queryset.model._meta.db_table}"'
+    matched_ids = (
+        f"SELECT fts_keys.transaction_id FROM {fts_table} "
+        f"JOIN {keys_table} AS fts_keys ON fts_keys.id = {fts_table}.rowid "
+        f"WHERE {fts_table} MATCH %s"
+    )
+    return queryset.filter(
+        RawSQL(f"{quoted_table}.id IN ({matched_ids})", (match,), output_field=BooleanField())
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT -bm25({fts_table}, 2.0, 1.0) FROM {fts_table} "
+            f"WHERE {fts_table} MATCH %s AND {fts_table}.rowid = {_sqlite_fts_key(keys_table, quoted_table)}",
+            (match,),
+            output_field=FloatField(),
+        )
+    )
+
+
+def _rank_postgresql(queryset: TransactionRowQuerySet, query: str) -> TransactionRowQuerySet:
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    # ``<%`` (trigram_word_similar) is served by the GIN gin_trgm_ops indexes.
+    return queryset.filter(
+        Q(description__trigram_word_similar=query) | Q(notes__trigram_word_similar=query)
+    ).annotate(
+        search_rank=Cast(
+            Greatest(TrigramWordSimilarity(query, "description"), TrigramWordSimilarity(query, "notes")),
+            output_field=FloatField(),
+        )
+    )
+
+
+def rank_transactions(queryset: TransactionRowQuerySet, query: str) -> TransactionRowQuerySet:
+    """Filter ``queryset`` to matches of ``query`` annotated with ``search_rank`` (higher is better)."""
+
+    query = normalize_search_query(query)
+    if not query:
+        return queryset.none()
+    if connections[queryset.db].vendor == "postgresql":
+        return _rank_postgresql(queryset, query)
+    return _rank_sqlite(queryset, query)
+
+
+def search_transactions(
+    queryset: TransactionRowQuerySet,
+    query: str,
+    *,
+    archived: ArchivedTransactionQuerySet | None = None,
+    cursor: str | None = None,
+    page_size: int = TRANSACTIONS_PAGE_SIZE,
+    extra_fields: Iterable[str] = (),
+) -> TransactionPage:
+    """Return one relevance-ranked keyset page of transactions matching ``query``.
+
+    ``archived`` is the same selection over ``ArchivedTransaction``. Relevance
+    does not follow the archive horizon, so it is always searched too and the
+    two pages are merged on the shared ranked ordering.
+    """
+
+    position = None
+    if cursor:
+        position = TransactionCursor.decode(cursor)
+        if position.rank is None:
+            raise TransactionCursorError("Invalid transactions cursor.")
+    querysets = [_ranked(queryset, query, position)]
+    if archived is not None:
+        querysets.append(_ranked(archived, query, position))
+    return fetch_transaction_page(
+        *querysets,
+        page_size=page_size,
+        extra_fields=("search_rank", *extra_fields),
+        merge_key=_ranked_position,
+    )
+
+
+def _ranked(queryset: TransactionRowQuerySet, query: str, position: TransactionCursor | None) -> TransactionRowQuerySet:
+    ranked = rank_transactions(queryset, query).order_by(*SEARCH_ORDERING)
+    if position is not None:
+        ranked = ranked.before_ranked_position(position.rank, position.posted_on, position.created_at, position.id)
+    return ranked
+
+
+def _ranked_position(values) -> tuple:
+    return values["search_rank"], values["posted_on"], values["created_at"], values["id"]
+
+
+def ensure_sqlite_search_index(using: str = "default") -> None:
+    """Create the FTS5 indexes, their key tables and sync triggers when any are missing.
+
+    SQLite table rebuilds during migrations drop triggers, so this runs after
+    every ``migrate`` and rebuilds an index from the existing rows whenever
+    part of it was absent.
+    """
+
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for model in SEARCHABLE_MODELS:
+            _ensure_sqlite_index(cursor, model)
+
+
+def _ensure_sqlite_index(cursor, model) -> None:
+    table = model._meta.db_table
+    fts_table, keys_table = sqlite_fts_tables(model)
+    triggers = sqlite_fts_triggers(model)
+    cursor.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name IN (%s, %s, %s, %s)",
+        (*triggers, keys_table),
+    )
+    if cursor.fetchone()[0] == len(triggers) + 1:
+        return
+    for trigger in triggers:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    cursor.execute(f"DROP TABLE IF EXISTS {fts_table}")
+    cursor.execute(f"DROP TABLE IF EXISTS {keys_table}")
+    cursor.execute(f"CREATE TABLE {keys_table} (id INTEGER PRIMARY KEY, transaction_id TEXT NOT NULL UNIQUE)")
+    cursor.execute(f"CREATE VIRTUAL TABLE {fts_table} USING fts5(description, notes)")
+    insert_trigger, delete_trigger, update_trigger = triggers
+    cursor.execute(
+        f"CREATE TRIGGER {insert_trigger} AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {keys_table}(transaction_id) VALUES (new.id); "
+        f"INSERT INTO {fts_table}(rowid, description, notes) "
+        f"VALUES ({_sqlite_fts_key(keys_table, 'new')}, new.description, new.notes); "
+        "END"
+    )
+    cursor.execute(
+        f"CREATE TRIGGER {delete_trigger} AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts_table} WHERE rowid = {_sqlite_fts_key(keys_table, 'old')}; "
+        f"DELETE FROM {keys_table} WHERE transaction_id = old.id; "
+        "END"
+    )
+    cursor.execute(
+        f"CREATE TRIGGER {update_trigger} AFTER UPDATE OF description, notes ON {table} BEGIN "
+        f"UPDATE {fts_table} SET description = new.description, notes = new.notes "
+        f"WHERE rowid = {_sqlite_fts_key(keys_table, 'new')}; "
+        "END"
+    )
+    cursor.execute(f"INSERT INTO {keys_table}(transaction_id) SELECT id FROM {table}")
+    cursor.execute(
+        f"INSERT INTO {fts_table}(rowid, description, notes) "
+        f"SELECT fts_keys.id, t.description, t.notes FROM {keys_table} AS fts_keys "
+        f"JOIN {table} AS t ON t.id = fts_keys.transaction_id"
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from financial.models import (
+    ACCOUNT_TYPE_ORDER,
+    Account,
+    AccountStatus,
+    AccountType,
+)
+
+from .bill_pay import LIABILITY_TYPES
+from .formatters import format_usd
+
+
+HOUSEHOLD_SUMMARY_CACHE_TIMEOUT = 60 * 60
+ZERO = Decimal("0.00")
+
+
+@dataclass(frozen=True, slots=True)
+class AccountTypeTotal:
+    account_type: str
+    label: str
+    account_count: int
+    balance: Decimal
+    balance_display: str
+    is_liability: bool
+
+
+@dataclass(frozen=True, slots=True)
+class HouseholdSummary:
+    """Household totals from ledger balances; liabilities are amounts owed, so positive."""
+
+    totals: tuple[AccountTypeTotal, ...]
+    assets: Decimal
+    liabilities: Decimal
+    net_worth: Decimal
+    credit_limit: Decimal
+    utilization: Optional[Decimal]
+    assets_display: str
+    liabilities_display: str
+    net_worth_display: str
+    credit_limit_display: str
+    utilization_display: str
+
+    @property
+    def has_accounts(self) -> bool:
+        return bool(self.totals)
+
+
+def household_summary_cache_key(household) -> str:
+    # Every write bumps data_version, so stale summaries are never read again, whichever worker cached them.
+    return f"financial:household-summary:{household.pk}:{household.data_version}"
+
+
+def build_household_summary(household) -> HouseholdSummary:
+    """Aggregate the household's open accounts in one ``GROUP BY account_type`` query.
+
+    Utilization only counts credit cards that have a limit, so a card without
+    one doesn't inflate it.
+    """
+
+    is_card_with_limit = Q(account_type=AccountType.CREDIT_CARD, credit_limit_or_principal__isnull=False)
+    groups = {
+        group["account_type"]: group
+        for group in Account.objects.filter(household=household)
+        .exclude(status=AccountStatus.CLOSED)
+        .order_by()
+        .values("account_type")
+        .annotate(
+            account_count=Count("id"),
+            balance=Sum("ledger_balance"),
+            credit_limit=Sum("credit_limit_or_principal", filter=is_card_with_limit),
+            limited_balance=Sum("ledger_balance", filter=is_card_with_limit),
+        )
+    }
+
+    labels = dict(AccountType.choices)
+    totals = []
+    assets = liabilities = ZERO
+    for account_type in sorted(groups, key=lambda value: ACCOUNT_TYPE_ORDER.get(value, len(ACCOUNT_TYPE_ORDER))):
+        group = groups[account_type]
+        balance = group["balance"] or ZERO
+        is_liability = account_type in LIABILITY_TYPES
+        if is_liability:
+            liabilities += balance
+        else:
+            assets += balance
+        totals.append(
+            AccountTypeTotal(
+                account_type=account_type,
+                label=labels.get(account_type, account_type),
+                account_count=group["account_count"],
+                balance=balance,
+                balance_display=format_usd(balance),
+                is_liability=is_liability,
+            )
+        )
+
+    cards = groups.get(AccountType.CREDIT_CARD, {})
+    credit_limit = cards.get("credit_limit") or ZERO
+    utilization = None
+    if credit_limit > ZERO:
+        utilization = ((cards.get("limited_balance") or ZERO) / credit_limit).quantize(
+            Decimal("0.0001"),
+            rounding=ROUND_HALF_UP,
+        )
+    net_worth = assets - liabilities
+    return HouseholdSummary(
+        totals=tuple(totals),
+        assets=assets,
+        liabilities=liabilities,
+        net_worth=net_worth,
+        credit_limit=credit_limit,
+        utilization=utilization,
+        assets_display=format_usd(assets),
+        liabilities_display=format_usd(liabilities),
+        net_worth_display=format_usd(net_worth),
+        credit_limit_display=format_usd(credit_limit),
+        utilization_display=f"{utilization * 100:.0f}%" if utilization is not None else "—",
+    )
+
+
+def household_summary(household) -> Optional[HouseholdSummary]:
+    """The household's summary, cached until its ``data_version`` moves on."""
+
+    if household is None:
+        return None
+    key = household_summary_cache_key(household)
+    summary = cache.get(key)
+    if summary is None:
+        summary = build_household_summary(household)
+        cache.set(key, summary, HOUSEHOLD_SUMMARY_CACHE_TIMEOUT)
+    return summary
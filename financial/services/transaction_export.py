@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import csv
+import heapq
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterator
+
+from financial.models import ArchivedTransactionQuerySet, TransactionQuerySet, TransactionRowQuerySet, TransactionType
+from financial.services.formatters import to_decimal
+from financial.services.transactions import amount_sign
+
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_HEADER = ("Posted On", "Account", "Description", "Category", "Type", "Amount", "Notes")
+EXPORT_FIELDS = (
+    "posted_on",
+    "account__name",
+    "description",
+    "category__name",
+    "transaction_type",
+    "amount",
+    "notes",
+)
+EXPORT_ORDERING = ("posted_on", "created_at", "id")
+
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+_TYPE_LABELS = dict(TransactionType.choices)
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the encoded line straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def format_export_amount(amount) -> str:
+    """Plain signed decimal using the same +/- convention as ``format_signed_amount``."""
+
+    amount = to_decimal(amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return f"{amount_sign(amount)}{abs(amount):.2f}"
+
+
+def _csv_text(value: str | None) -> str:
+    # Spreadsheet apps evaluate cells starting with formula characters.
+    value = value or ""
+    if value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_transaction_csv(
+    queryset: TransactionQuerySet,
+    *,
+    archived: ArchivedTransactionQuerySet | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Yield CSV lines oldest first, reading ``chunk_size`` rows at a time.
+
+    ``archived`` is the same selection over ``ArchivedTransaction``; both
+    streams are already in export order, so they are merged as they are read.
+    """
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_HEADER)
+    rows = _export_rows(queryset, chunk_size)
+    if archived is not None:
+        rows = heapq.merge(rows, _export_rows(archived, chunk_size))
+    for _position, (posted_on, account_name, description, category_name, transaction_type, amount, notes) in rows:
+        yield writer.writerow(
+            (
+                posted_on.isoformat(),
+                _csv_text(account_name),
+                _csv_text(description),
+                _csv_text(category_name),
+                _TYPE_LABELS.get(transaction_type, transaction_type),
+                format_export_amount(amount),
+                _csv_text(notes),
+            )
+        )
+
+
+def _export_rows(queryset: TransactionRowQuerySet, chunk_size: int) -> Iterator[tuple[tuple, tuple]]:
+    rows = queryset.order_by(*EXPORT_ORDERING).values_list(*EXPORT_ORDERING, *EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    split = len(EXPORT_ORDERING)
+    for row in rows:
+        yield row[:split], row[split:]
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, Mapping
+
+from django.db.models import Count, Q
+
+from financial.models import (
+    ArchivedTransactionQuerySet,
+    TransactionQuerySet,
+    TransactionRowQuerySet,
+    TransactionType,
+    transaction_archive_horizon,
+)
+
+
+UNCATEGORIZED_FILTER_VALUE = "none"
+FILTER_PARAM_NAMES = ("start", "end", "category", "type", "min_amount", "max_amount")
+
+
+class TransactionFilterError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class FacetValue:
+    value: str
+    label: str
+    count: int
+    selected: bool
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionFacets:
+    categories: List[FacetValue]
+    transaction_types: List[FacetValue]
+    total: int
+
+
+def _parse_date(raw: str, label: str) -> date:
+    try:
+        return date.fromisoformat(raw)
+    except ValueError as exc:
+        raise TransactionFilterError(f"Invalid {label}. Use YYYY-MM-DD.") from exc
+
+
+def _parse_amount(raw: str, label: str) -> Decimal:
+    try:
+        amount = Decimal(raw)
+    except InvalidOperation as exc:
+        raise TransactionFilterError(f"Invalid {label}.") from exc
+    if not amount.is_finite() or amount < 0:
+        raise TransactionFilterError(f"Invalid {label}.")
+    return amount
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionFilters:
+    """Panel filters parsed from query parameters.
+
+    Amount bounds apply to the magnitude the user typed, so they match both
+    the positive and the negated stored amount regardless of sign rules.
+    """
+
+    start: date | None = None
+    end: date | None = None
+    category: str | None = None
+    transaction_type: str | None = None
+    min_amount: Decimal | None = None
+    max_amount: Decimal | None = None
+
+    @classmethod
+    def from_query_params(cls, params: Mapping[str, Any]) -> "TransactionFilters":
+        raw = {name: (params.get(name) or "").strip() for name in FILTER_PARAM_NAMES}
+        category = raw["category"] or None
+        if category and category != UNCATEGORIZED_FILTER_VALUE:
+            try:
+                category = str(uuid.UUID(category))
+            except ValueError as exc:
+                raise TransactionFilterError("Invalid category.") from exc
+        transaction_type = raw["type"] or None
+        if transaction_type and transaction_type not in TransactionType.values:
+            raise TransactionFilterError("Invalid transaction type.")
+        filters = cls(
+            start=_parse_date(raw["start"], "start date") if raw["start"] else None,
+            end=_parse_date(raw["end"], "end date") if raw["end"] else None,
+            category=category,
+            transaction_type=transaction_type,
+            min_amount=_parse_amount(raw["min_amount"], "minimum amount") if raw["min_amount"] else None,
+            max_amount=_parse_amount(raw["max_amount"], "maximum amount") if raw["max_amount"] else None,
+        )
+        if filters.start and filters.end and filters.start > filters.end:
+            raise TransactionFilterError("Start date must be on or before end date.")
+        if filters.min_amount is not None and filters.max_amount is not None and filters.min_amount > filters.max_amount:
+            raise TransactionFilterError("Minimum amount must not exceed maximum amount.")
+        return filters
+
+    @property
+    def is_active(self) -> bool:
+        return any(value is not None for value in self._query_values().values())
+
+    def _query_values(self) -> dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "category": self.category,
+            "type": self.transaction_type,
+            "min_amount": self.min_amount,
+            "max_amount": self.max_amount,
+        }
+
+    def to_query_params(self) -> dict[str, str]:
+        return {name: str(value) for name, value in self._query_values().items() if value is not None}
+
+    def range_q(self) -> Q:
+        q = Q()
+        if self.start is not None:
+            q &= Q(posted_on__gte=self.start)
+        if self.end is not None:
+            q &= Q(posted_on__lte=self.end)
+        if self.min_amount is not None or self.max_amount is not None:
+            positive = Q()
+            negative = Q()
+            if self.min_amount is not None:
+                positive &= Q(amount__gte=self.min_amount)
+                negative &= Q(amount__lte=-self.min_amount)
+            if self.max_amount is not None:
+                positive &= Q(amount__lte=self.max_amount)
+                negative &= Q(amount__gte=-self.max_amount)
+            q &= positive | negative
+        return q
+
+    def category_q(self) -> Q:
+        if self.category is None:
+            return Q()
+        if self.category == UNCATEGORIZED_FILTER_VALUE:
+            return Q(category__isnull=True)
+        return Q(category_id=self.category)
+
+    def transaction_type_q(self) -> Q:
+        if self.transaction_type is None:
+            return Q()
+        return Q(transaction_type=self.transaction_type)
+
+    @property
+    def reaches_archive(self) -> bool:
+        """Whether the range may hold archived rows, which are all older than the horizon."""
+
+        return self.start is None or self.start < transaction_archive_horizon()
+
+    def apply(self, queryset: TransactionRowQuerySet) -> TransactionRowQuerySet:
+        return queryset.filter(self.range_q() & self.category_q() & self.transaction_type_q())
+
+    def apply_to_archive(self, archived: ArchivedTransactionQuerySet) -> ArchivedTransactionQuerySet | None:
+        """``apply`` for the archive, or ``None`` when the range can't reach it."""
+
+        return self.apply(archived) if self.reaches_archive else None
+
+
+def transaction_facets(
+    queryset: TransactionQuerySet,
+    filters: TransactionFilters,
+    *,
+    archived: ArchivedTransactionQuerySet | None = None,
+) -> TransactionFacets:
+    """Count every category and transaction type value in one grouped query per table.
+
+    Each facet counts rows matching all *other* active filters, so picking a
+    category still shows how many rows each alternative category would give.
+    ``archived`` is the same scope over ``ArchivedTransaction``; its counts are
+    added with a second grouped query when the date range reaches the archive.
+    """
+
+    sources = [queryset]
+    if archived is not None and filters.reaches_archive:
+        sources.append(archived)
+
+    category_counts: dict[str, list] = {}
+    type_counts: dict[str, int] = {}
+    total = 0
+    for source in sources:
+        for row in _grouped_facet_counts(source, filters):
+            category_value = str(row["category_id"]) if row["category_id"] else UNCATEGORIZED_FILTER_VALUE
+            label = row["category__name"] or "Uncategorized"
+            entry = category_counts.setdefault(category_value, [label, 0])
+            entry[1] += row["category_count"]
+            type_counts[row["transaction_type"]] = type_counts.get(row["transaction_type"], 0) + row["type_count"]
+            total += row["total_count"]
+
+    categories = [
+        FacetValue(value=value, label=label, count=count, selected=value == filters.category)
+        for value, (label, count) in category_counts.items()
+        if count or value == filters.category
+    ]
+    categories.sort(key=lambda facet: (facet.value == UNCATEGORIZED_FILTER_VALUE, facet.label.lower()))
+    transaction_types = [
+        FacetValue(
+            value=value,
+            label=label,
+            count=type_counts.get(value, 0),
+            selected=value == filters.transaction_type,
+        )
+        for value, label in TransactionType.choices
+        if type_counts.get(value) or value == filters.transaction_type
+    ]
+    return TransactionFacets(categories=categories, transaction_types=transaction_types, total=total)
+
+
+def _grouped_facet_counts(queryset: TransactionRowQuerySet, filters: TransactionFilters):
+    return (
+        queryset.filter(filters.range_q())
+        .order_by()
+        .values("category_id", "category__name", "transaction_type")
+        .annotate(
+            category_count=Count("id", filter=filters.transaction_type_q()),
+            type_count=Count("id", filter=filters.category_q()),
+            total_count=Count("id", filter=filters.category_q() & filters.transaction_type_q()),
+        )
+    )
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Iterator
+
+from django.db import transaction
+
+from financial.models import (
+    TRANSACTION_SIGN_RULES,
+    LIABILITY_ACCOUNT_TYPES,
+    Account,
+    Transaction,
+    TransactionType,
+    assign_transaction_fingerprints,
+)
+from financial.services.categorization import rules_matcher_for_user
+
+
+IMPORT_BATCH_SIZE = 2000
+MAX_REPORTED_ERRORS = 25
+CENT = Decimal("0.01")
+MAX_AMOUNT = Decimal("100000000")
+DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d")
+
+# Bank exports name the same column many ways; matched case-insensitively.
+POSTED_ON_HEADERS = ("posted_on", "date", "posted date", "posting date", "transaction date", "post date")
+DESCRIPTION_HEADERS = ("description", "memo", "payee", "name", "details")
+AMOUNT_HEADERS = ("amount", "transaction amount")
+DEBIT_HEADERS = ("debit", "withdrawal", "withdrawals")
+CREDIT_HEADERS = ("credit", "deposit", "deposits")
+
+class TransactionImportValidationError(Exception):
+    def __init__(self, errors: list[str]):
+        super().__init__("Transaction import validation failed.")
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class TransactionImportResult:
+    total_rows: int
+    imported_rows: int
+
+    @property
+    def duplicate_rows(self) -> int:
+        return self.total_rows - self.imported_rows
+
+
+@dataclass(frozen=True)
+class _ColumnMap:
+    posted_on: int
+    description: int
+    amount: int | None
+    debit: int | None
+    credit: int | None
+
+
+def _find_column(headers: list[str], candidates: tuple[str, ...]) -> int | None:
+    for candidate in candidates:
+        if candidate in headers:
+            return headers.index(candidate)
+    return None
+
+
+def _map_columns(header_row: list[str]) -> _ColumnMap:
+    headers = [header.strip().lower() for header in header_row]
+    posted_on = _find_column(headers, POSTED_ON_HEADERS)
+    description = _find_column(headers, DESCRIPTION_HEADERS)
+    amount = _find_column(headers, AMOUNT_HEADERS)
+    debit = _find_column(headers, DEBIT_HEADERS)
+    credit = _find_column(headers, CREDIT_HEADERS)
+
+    errors = []
+    if posted_on is None:
+        errors.append("Missing a date column (for example \"Date\" or \"Posting Date\").")
+    if description is None:
+        errors.append("Missing a description column (for example \"Description\" or \"Memo\").")
+    if amount is None and (debit is None or credit is None):
+        errors.append("Missing an \"Amount\" column or a \"Debit\"/\"Credit\" column pair.")
+    if errors:
+        raise TransactionImportValidationError(errors)
+    return _ColumnMap(posted_on=posted_on, description=description, amount=amount, debit=debit, credit=credit)
+
+
+def _parse_date(value: str) -> date:
+    value = value.strip()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"unrecognized date \"{value}\".")
+
+
+def _parse_amount(value: str) -> Decimal:
+    value = value.strip().replace("$", "").replace(",", "")
+    negative = value.startswith("(") and value.endswith(")")
+    if negative:
+        value = value[1:-1]
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"invalid amount \"{value}\".") from None
+    if not amount.is_finite() or amount != amount.quantize(CENT) or abs(amount) >= MAX_AMOUNT:
+        raise ValueError(f"invalid amount \"{value}\".")
+    return -amount if negative else amount
+
+
+def _statement_amount(row: list[str], columns: _ColumnMap) -> Decimal:
+    """Signed amount as the bank reports it: negative is money leaving the account holder."""
+
+    if columns.amount is not None and row[columns.amount].strip():
+        return _parse_amount(row[columns.amount])
+    debit = row[columns.debit].strip() if columns.debit is not None else ""
+    credit = row[columns.credit].strip() if columns.credit is not None else ""
+    if debit:
+        return -abs(_parse_amount(debit))
+    if credit:
+        return abs(_parse_amount(credit))
+    raise ValueError("amount is required.")
+
+
+def _statement_rows(uploaded_file) -> Iterator[list[str]]:
+    """Decode and split the upload lazily, one CSV record at a time."""
+
+    uploaded_file.seek(0)
+    text = io.TextIOWrapper(uploaded_file.file, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    try:
+        yield from reader
+    except UnicodeDecodeError:
+        raise TransactionImportValidationError(
+            ["Import file must be UTF-8 encoded. Save or export the statement as \"CSV UTF-8\" and try again."]
+        ) from None
+    except csv.Error as exc:
+        raise TransactionImportValidationError([f"Row {reader.line_num}: the file is not valid CSV ({exc})."]) from None
+    finally:
+        # Leave the underlying upload open for Django to clean up.
+        text.detach()
+
+
+def _record_batch(batch: list[Transaction], occurrences: dict) -> int:
+    assign_transaction_fingerprints(batch, occurrences)
+    return len(Transaction.objects.bulk_record(batch, skip_duplicates=True))
+
+
+def import_transactions_from_csv(*, uploaded_file, account: Account, user=None) -> TransactionImportResult:
+    """Stream a bank statement CSV into ``account`` in ``IMPORT_BATCH_SIZE`` chunks.
+
+    The whole import runs in one atomic block: rows are parsed, signed with the
+    shared sign-rule table and inserted chunk by chunk, and any row error rolls
+    the import back after the file has been fully scanned for errors. Rows are
+    fingerprinted so lines already imported from an overlapping statement are
+    skipped by the insert instead of duplicated, and categorized with
+    ``user``'s rules when given.
+    """
+
+    sign_rules = TRANSACTION_SIGN_RULES[account.account_type]
+    if account.account_type in LIABILITY_ACCOUNT_TYPES:
+        outflow_type, inflow_type = TransactionType.CHARGE, TransactionType.PAYMENT
+    else:
+        outflow_type, inflow_type = TransactionType.EXPENSE, TransactionType.DEPOSIT
+    outflow_sign, inflow_sign = sign_rules[outflow_type], sign_rules[inflow_type]
+    matcher = rules_matcher_for_user(user.pk) if user is not None else None
+
+    rows = _statement_rows(uploaded_file)
+    header = next(rows, None)
+    if header is None:
+        raise TransactionImportValidationError(["Import file must include a header row."])
+    columns = _map_columns(header)
+    mapped = (columns.posted_on, columns.description, columns.amount, columns.debit, columns.credit)
+    width = max(index for index in mapped if index is not None) + 1
+
+    errors: list[str] = []
+    error_count = 0
+    total_rows = 0
+    imported_rows = 0
+    batch: list[Transaction] = []
+    occurrences: dict = {}
+    with transaction.atomic():
+        for line_number, row in enumerate(rows, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            total_rows += 1
+            try:
+                if len(row) < width:
+                    raise ValueError("row has fewer columns than the header.")
+                description = row[columns.description].strip()
+                if not description:
+                    raise ValueError("description is required.")
+                amount = _statement_amount(row, columns)
+                if not amount:
+                    raise ValueError("amount must not be zero.")
+                posted_on = _parse_date(row[columns.posted_on])
+            except ValueError as exc:
+                error_count += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"Row {line_number}: {exc}")
+                continue
+            if error_count:
+                continue
+
+            is_outflow = amount < 0
+            batch.append(
+                Transaction(
+                    account=account,
+                    household_id=account.household_id,
+                    posted_on=posted_on,
+                    description=description[:255],
+                    transaction_type=outflow_type if is_outflow else inflow_type,
+                    amount=abs(amount) * (outflow_sign if is_outflow else inflow_sign),
+                    category_id=matcher.match(description, amount) if matcher else None,
+                )
+            )
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported_rows += _record_batch(batch, occurrences)
+                batch = []
+
+        if error_count:
+            if error_count > len(errors):
+                errors.append(f"{error_count - len(errors)} more rows have errors.")
+            raise TransactionImportValidationError(errors)
+        if total_rows == 0:
+            raise TransactionImportValidationError(["Import file has no data rows."])
+        imported_rows += _record_batch(batch, occurrences)
+
+    account.refresh_from_db(fields=["ledger_balance"])
+    return TransactionImportResult(total_rows=total_rows, imported_rows=imported_rows)
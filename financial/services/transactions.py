@@ -1,31 +1,57 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import heapq
+import uuid
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, List, Mapping, Optional
 
-from django.urls import NoReverseMatch, reverse
+from django.db.models import Value
 
-from financial.models import Transaction
+from financial.models import (
+    TRANSACTION_SIGN_RULES,
+    Account,
+    ArchivedTransaction,
+    ArchivedTransactionQuerySet,
+    Transaction,
+    TransactionQuerySet,
+    TransactionRowQuerySet,
+    transaction_archive_horizon,
+)
 
+from .categorization import rules_matcher_for_user
 from .formatters import format_usd
+from .routes import RouteTemplate, route_template
+
+
+TRANSACTIONS_PAGE_SIZE = 50
+TRANSACTION_ROW_FIELDS = (
+    "id",
+    "account_id",
+    "posted_on",
+    "created_at",
+    "description",
+    "amount",
+    "category__name",
+)
+TRANSACTION_EDIT_ROUTE = "financial:account-transactions-edit"
+
+
+def amount_sign(amount) -> str:
+    return "-" if amount < 0 else "+"
 
 
 def format_signed_amount(amount) -> str:
-    sign = "-" if amount < 0 else "+"
-    return f"{sign}{format_usd(abs(amount))}"
+    return f"{amount_sign(amount)}{format_usd(abs(amount))}"
 
 
 def format_posted_on(posted_on) -> str:
     return posted_on.strftime("%b %d, %Y").replace(" 0", " ")
 
 
-def _safe_reverse(route: str, *, args: list[str]) -> str:
-    try:
-        return reverse(route, args=args)
-    except NoReverseMatch:
-        return "#"
-
-
 @dataclass(frozen=True, slots=True)
 class TransactionRow:
     id: str
@@ -34,23 +60,270 @@ class TransactionRow:
     amount_display: str
     category_label: Optional[str]
     edit_url: str
+    balance_display: Optional[str] = None
+    account_name: Optional[str] = None
+    transfer_account_name: Optional[str] = None
 
     @classmethod
-    def from_transaction(cls, transaction: Transaction) -> "TransactionRow":
+    def from_transaction(
+        cls,
+        transaction: Transaction,
+        *,
+        edit_url_template: RouteTemplate | None = None,
+    ) -> "TransactionRow":
+        edit_url_template = edit_url_template or transaction_edit_url_template()
         return cls(
             id=str(transaction.id),
             posted_on_display=format_posted_on(transaction.posted_on),
             description=transaction.description,
             amount_display=format_signed_amount(transaction.amount),
             category_label=transaction.category.name if transaction.category else None,
-            edit_url=_safe_reverse(
-                "financial:account-transactions-edit",
-                args=[str(transaction.account_id), str(transaction.id)],
-            ),
+            edit_url=edit_url_template.format(transaction.account_id, transaction.id),
+        )
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any], *, edit_url_template: RouteTemplate) -> "TransactionRow":
+        transaction_id = str(values["id"])
+        # Archived rows are read-only; the edit view only knows the hot table.
+        edit_url = "" if values.get("is_archived") else edit_url_template.format(values["account_id"], transaction_id)
+        return cls(
+            id=transaction_id,
+            posted_on_display=format_posted_on(values["posted_on"]),
+            description=values["description"],
+            amount_display=format_signed_amount(values["amount"]),
+            category_label=values["category__name"],
+            edit_url=edit_url,
+            balance_display=format_usd(values["running_balance"]) if "running_balance" in values else None,
+            account_name=values.get("account__name"),
+            transfer_account_name=values.get("transfer_counterpart__account__name"),
         )
 
 
 def serialize_transaction_rows(transactions: Iterable[Transaction]) -> List[TransactionRow]:
     """Convert queryset into deterministic row payloads for templates."""
 
-    return [TransactionRow.from_transaction(transaction) for transaction in transactions]
+    edit_url_template = transaction_edit_url_template()
+    return [TransactionRow.from_transaction(transaction, edit_url_template=edit_url_template) for transaction in transactions]
+
+
+def transaction_edit_url_template() -> RouteTemplate:
+    """The edit route as a template taking ``(account_id, transaction_id)``."""
+
+    return route_template(TRANSACTION_EDIT_ROUTE, 2)
+
+
+def transaction_row_values(queryset: TransactionRowQuerySet, *extra_fields: str):
+    """Project only the columns a row needs; the category name rides the same JOIN.
+
+    ``extra_fields`` adds annotations such as ``running_balance`` or joined
+    columns such as ``account__name`` to the same projection. Archived rows
+    carry ``is_archived`` so merged listings leave them without an edit link.
+    """
+
+    values = queryset.values(*TRANSACTION_ROW_FIELDS, *extra_fields)
+    if queryset.model is ArchivedTransaction:
+        values = values.annotate(is_archived=Value(True))
+    return values
+
+
+def serialize_transaction_values(values: Iterable[Mapping[str, Any]]) -> List[TransactionRow]:
+    """Build rows from a ``transaction_row_values`` projection without model instances."""
+
+    edit_url_template = transaction_edit_url_template()
+    return [TransactionRow.from_values(row, edit_url_template=edit_url_template) for row in values]
+
+
+class TransactionCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionCursor:
+    """Keyset position ``(posted_on, created_at, id)`` of the last row on a page.
+
+    ``balance`` checkpoints the running balance after the *next* row so the
+    following page can seed its window without re-reading newer rows.
+    ``rank`` is the leading sort key for relevance-ordered search pages.
+    """
+
+    posted_on: date
+    created_at: datetime
+    id: uuid.UUID
+    balance: Decimal | None = None
+    rank: float | None = None
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any]) -> "TransactionCursor":
+        balance = None
+        if values.get("running_balance") is not None:
+            balance = values["running_balance"] - values["amount"]
+        return cls(
+            posted_on=values["posted_on"],
+            created_at=values["created_at"],
+            id=values["id"],
+            balance=balance,
+            rank=values.get("search_rank"),
+        )
+
+    @classmethod
+    def from_transaction(cls, transaction: Transaction) -> "TransactionCursor":
+        return cls(posted_on=transaction.posted_on, created_at=transaction.created_at, id=transaction.id)
+
+    def encode(self) -> str:
+        balance = "" if self.balance is None else str(self.balance)
+        rank = "" if self.rank is None else repr(self.rank)
+        raw = f"{self.posted_on.isoformat()}|{self.created_at.isoformat()}|{self.id.hex}|{balance}|{rank}"
+        return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TransactionCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+            posted_on, created_at, pk, balance, rank = raw.split("|")
+            return cls(
+                posted_on=date.fromisoformat(posted_on),
+                created_at=datetime.fromisoformat(created_at),
+                id=uuid.UUID(hex=pk),
+                balance=Decimal(balance) if balance else None,
+                rank=float(rank) if rank else None,
+            )
+        except (binascii.Error, InvalidOperation, UnicodeError, TypeError, ValueError) as exc:
+            raise TransactionCursorError("Invalid transactions cursor.") from exc
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionPage:
+    rows: list[TransactionRow]
+    next_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def paginate_transactions(
+    queryset: TransactionQuerySet,
+    *,
+    archived: ArchivedTransactionQuerySet | None = None,
+    cursor: str | None = None,
+    page_size: int = TRANSACTIONS_PAGE_SIZE,
+    closing_balance: Decimal | None = None,
+    extra_fields: Iterable[str] = (),
+) -> TransactionPage:
+    """Return one keyset page of ``queryset`` in ``ordered()`` order.
+
+    Fetches ``page_size + 1`` rows to detect a following page, so the cost of a
+    page is independent of how many transactions precede it. When
+    ``closing_balance`` (the balance after the newest row) is given, rows carry
+    a running balance seeded from it on the first page and from the cursor
+    checkpoint afterwards. ``extra_fields`` joins more columns into the same
+    projection, e.g. ``account__name`` for cross-account listings.
+
+    ``archived`` is the same selection over ``ArchivedTransaction``. It is only
+    read when the hot page comes up short or ends before the archive horizon:
+    every archived row sorts after hot rows posted on or after the horizon.
+    The two pages are then merged and the running balance recomputed.
+    """
+
+    position = TransactionCursor.decode(cursor) if cursor else None
+    if position is not None and position.balance is not None:
+        closing_balance = position.balance
+    extra_fields = list(extra_fields)
+
+    values = _page_values(_seek(queryset, position, closing_balance), page_size, extra_fields, closing_balance)
+    if archived is None or _hot_page_is_complete(values, page_size):
+        return _page_from_values(values, page_size)
+
+    archived_values = _page_values(_seek(archived, position, None), page_size, extra_fields, None)
+    values = list(heapq.merge(values, archived_values, key=_row_position, reverse=True))[: page_size + 1]
+    if closing_balance is not None:
+        balance = closing_balance
+        for row in values:
+            row["running_balance"] = balance
+            balance -= row["amount"]
+    return _page_from_values(values, page_size)
+
+
+def _seek(queryset, position: TransactionCursor | None, closing_balance: Decimal | None):
+    queryset = queryset.ordered()
+    if position is not None:
+        queryset = queryset.before_position(position.posted_on, position.created_at, position.id)
+    if closing_balance is not None:
+        queryset = queryset.with_running_balance(closing_balance)
+    return queryset
+
+
+def _hot_page_is_complete(values: list[dict], page_size: int) -> bool:
+    return len(values) > page_size and values[-1]["posted_on"] >= transaction_archive_horizon()
+
+
+def _row_position(values: Mapping[str, Any]) -> tuple:
+    return values["posted_on"], values["created_at"], values["id"]
+
+
+def _page_values(
+    queryset: TransactionRowQuerySet,
+    page_size: int,
+    extra_fields: Iterable[str],
+    closing_balance: Decimal | None = None,
+) -> list[dict]:
+    if closing_balance is not None:
+        extra_fields = (*extra_fields, "running_balance")
+    return list(transaction_row_values(queryset, *extra_fields)[: page_size + 1])
+
+
+def _page_from_values(values: list[dict], page_size: int) -> TransactionPage:
+    next_cursor = None
+    if len(values) > page_size:
+        values = values[:page_size]
+        next_cursor = TransactionCursor.from_values(values[-1]).encode()
+    return TransactionPage(rows=serialize_transaction_values(values), next_cursor=next_cursor)
+
+
+def fetch_transaction_page(
+    *querysets: TransactionRowQuerySet,
+    page_size: int,
+    extra_fields: Iterable[str] = (),
+    merge_key=_row_position,
+) -> TransactionPage:
+    """Slice already ordered and seeked querysets into a page plus next cursor.
+
+    With several querysets (the hot table and the archive) each is read one
+    page deep and the pages are merged on ``merge_key``, their shared
+    descending sort key.
+    """
+
+    pages = [_page_values(queryset, page_size, extra_fields) for queryset in querysets]
+    values = list(heapq.merge(*pages, key=merge_key, reverse=True))[: page_size + 1]
+    return _page_from_values(values, page_size)
+
+
+def create_bulk_transactions(account: Account, rows: Iterable[Mapping[str, Any]], *, user=None) -> List[Transaction]:
+    """Sign and insert already validated grid rows with a single ``bulk_create``.
+
+    Rows carry the cleaned form values; sign rules come from the shared table
+    so no per-row ``full_clean`` or FK lookups are needed. Like single entries,
+    hand-entered rows are not fingerprinted: a second identical same-day
+    entry is a real purchase, not a re-import. Rows left without a category
+    get one from ``user``'s rules.
+    """
+
+    sign_rules = TRANSACTION_SIGN_RULES[account.account_type]
+    matcher = rules_matcher_for_user(user.pk) if user is not None else None
+    transactions = [
+        Transaction(
+            account=account,
+            household_id=account.household_id,
+            posted_on=row["posted_on"],
+            description=row["description"],
+            transaction_type=row["transaction_type"],
+            amount=abs(row["amount"]) * sign_rules[row["transaction_type"]],
+            category_id=row.get("category") or (matcher.match(row["description"], row["amount"]) if matcher else None),
+            notes=row.get("notes", ""),
+        )
+        for row in rows
+    ]
+    created = Transaction.objects.bulk_record(transactions)
+    account.refresh_from_db(fields=["ledger_balance"])
+    return created
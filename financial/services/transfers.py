@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from financial.models import (
+    LIABILITY_ACCOUNT_TYPES,
+    Account,
+    AccountStatus,
+    Transaction,
+    TransactionType,
+    signed_transaction_amount,
+)
+
+
+class TransferError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TransferLegs:
+    outgoing: Transaction
+    incoming: Transaction
+
+
+def incoming_transfer_type(account: Account) -> str:
+    """Money arriving pays down a liability and is a deposit into an asset account."""
+
+    return TransactionType.PAYMENT if account.account_type in LIABILITY_ACCOUNT_TYPES else TransactionType.DEPOSIT
+
+
+def record_transfer(
+    *,
+    from_account: Account,
+    to_account: Account,
+    amount: Decimal,
+    posted_on: date,
+    description: str = "",
+    notes: str = "",
+) -> TransferLegs:
+    """Write both legs of a transfer in one atomic ``bulk_record`` call.
+
+    Each leg points at the other through ``transfer_counterpart``. Both
+    accounts are locked in primary-key order before the insert, and ledger
+    balances, snapshots and rollups move in the same transaction.
+    """
+
+    if from_account.pk == to_account.pk:
+        raise TransferError("Choose two different accounts.")
+    if from_account.household_id != to_account.household_id:
+        raise TransferError("Transfers must stay within one household.")
+    if AccountStatus.CLOSED in (from_account.status, to_account.status):
+        raise TransferError("Closed accounts can't take part in transfers.")
+    if amount is None or amount <= Decimal("0"):
+        raise TransferError("Amount must be greater than 0.")
+
+    outgoing = Transaction(
+        account=from_account,
+        household_id=from_account.household_id,
+        posted_on=posted_on,
+        description=description or f"Transfer to {to_account.name}",
+        transaction_type=TransactionType.TRANSFER,
+        amount=signed_transaction_amount(from_account.account_type, TransactionType.TRANSFER, amount),
+        notes=notes,
+    )
+    incoming_type = incoming_transfer_type(to_account)
+    incoming = Transaction(
+        account=to_account,
+        household_id=to_account.household_id,
+        posted_on=posted_on,
+        description=description or f"Transfer from {from_account.name}",
+        transaction_type=incoming_type,
+        amount=signed_transaction_amount(to_account.account_type, incoming_type, amount),
+        notes=notes,
+    )
+    outgoing.transfer_counterpart_id = incoming.pk
+    incoming.transfer_counterpart_id = outgoing.pk
+
+    Transaction.objects.bulk_record([outgoing, incoming])
+    from_account.refresh_from_db(fields=["ledger_balance"])
+    to_account.refresh_from_db(fields=["ledger_balance"])
+    return TransferLegs(outgoing=outgoing, incoming=incoming)
@@ -0,0 +1,123 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from financial.models import Account, AccountBalanceSnapshot, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.balances import closing_balance_for_month, monthly_closing_balances, rebuild_balance_snapshots
+
+User = get_user_model()
+
+
+class AccountBalanceSnapshotTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("snap", "snap@example.com", "pass-1234")
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Snapshot Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _create(self, posted_on, transaction_type, amount, account=None) -> Transaction:
+        return Transaction.objects.create(
+            account=account or self.account,
+            posted_on=posted_on,
+            description="Snapshot row",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+        )
+
+    def _snapshots(self) -> dict:
+        return dict(AccountBalanceSnapshot.objects.for_account(self.account).values_list("month", "closing_balance"))
+
+    def test_writes_keep_monthly_closing_balances_current(self):
+        self._create(date(2026, 1, 5), TransactionType.DEPOSIT, "100.00")
+        self._create(date(2026, 3, 9), TransactionType.EXPENSE, "30.00")
+        backdated = self._create(date(2026, 2, 14), TransactionType.DEPOSIT, "50.00")
+
+        self.assertEqual(
+            self._snapshots(),
+            {
+                date(2026, 1, 1): Decimal("100.00"),
+                date(2026, 2, 1): Decimal("150.00"),
+                date(2026, 3, 1): Decimal("120.00"),
+            },
+        )
+
+        backdated.posted_on = date(2025, 12, 31)
+        backdated.save()
+        self.assertEqual(self._snapshots()[date(2025, 12, 1)], Decimal("50.00"))
+        self.assertEqual(self._snapshots()[date(2026, 2, 1)], Decimal("150.00"))
+        self.assertEqual(self._snapshots()[date(2026, 3, 1)], Decimal("120.00"))
+
+        backdated.delete()
+        self.assertEqual(self._snapshots()[date(2026, 3, 1)], Decimal("70.00"))
+
+    def test_historical_balance_reads_one_row(self):
+        self._create(date(2026, 1, 5), TransactionType.DEPOSIT, "100.00")
+        self._create(date(2026, 3, 9), TransactionType.EXPENSE, "30.00")
+
+        with CaptureQueriesContext(connection) as context:
+            february = closing_balance_for_month(self.account, date(2026, 2, 20))
+        self.assertEqual(february, Decimal("100.00"))
+        self.assertEqual(len(context), 1)
+        self.assertEqual(closing_balance_for_month(self.account, date(2025, 6, 1)), Decimal("0.00"))
+
+        self.assertEqual(
+            monthly_closing_balances(self.account, start=date(2025, 12, 1), end=date(2026, 4, 1)),
+            [
+                (date(2025, 12, 1), Decimal("0.00")),
+                (date(2026, 1, 1), Decimal("100.00")),
+                (date(2026, 2, 1), Decimal("100.00")),
+                (date(2026, 3, 1), Decimal("70.00")),
+                (date(2026, 4, 1), Decimal("70.00")),
+            ],
+        )
+
+    def test_moving_account_updates_both_histories(self):
+        savings = Account.objects.create(
+            user=self.user,
+            name="Snapshot Savings",
+            account_type=AccountType.SAVINGS,
+            status=AccountStatus.ACTIVE,
+        )
+        transaction = self._create(date(2026, 2, 1), TransactionType.DEPOSIT, "80.00")
+
+        transaction.account = savings
+        transaction.save()
+
+        self.assertEqual(closing_balance_for_month(self.account, date(2026, 2, 1)), Decimal("0.00"))
+        self.assertEqual(closing_balance_for_month(savings, date(2026, 2, 1)), Decimal("80.00"))
+
+    def test_rebuild_command_matches_incremental_snapshots(self):
+        self._create(date(2026, 1, 5), TransactionType.DEPOSIT, "100.00")
+        self._create(date(2026, 2, 9), TransactionType.EXPENSE, "30.00")
+        incremental = self._snapshots()
+        AccountBalanceSnapshot.objects.all().update(closing_balance=Decimal("0.00"))
+
+        output = StringIO()
+        call_command("rebuild_balance_snapshots", stdout=output)
+
+        self.assertEqual(self._snapshots(), incremental)
+        self.assertIn("Rebuilt 2 monthly snapshots for 1 accounts.", output.getvalue())
+
+    def test_rebuild_locks_accounts_before_aggregating(self):
+        self._create(date(2026, 1, 5), TransactionType.DEPOSIT, "100.00")
+
+        with CaptureQueriesContext(connection) as context:
+            rebuild_balance_snapshots([self.account.pk])
+
+        tables = [
+            table
+            for query in context.captured_queries
+            for table in (Account._meta.db_table, Transaction._meta.db_table)
+            if f'FROM "{table}"' in query["sql"]
+        ]
+        self.assertEqual(tables[0], Account._meta.db_table)
+        self.assertIn(Transaction._meta.db_table, tables)
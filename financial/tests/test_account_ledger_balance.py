@@ -0,0 +1,90 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountLedgerBalanceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ledgerbal", "ledgerbal@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Ledger Bal", slug="ledger-bal", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Ledger Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+            current_balance=Decimal("999.00"),
+        )
+        self.savings = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Ledger Savings",
+            account_type=AccountType.SAVINGS,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _ledger(self, account: Account) -> Decimal:
+        return Account.objects.values_list("ledger_balance", flat=True).get(pk=account.pk)
+
+    def _create(self, account, transaction_type, amount) -> Transaction:
+        return Transaction.objects.create(
+            account=account,
+            posted_on=date(2026, 4, 1),
+            description="Ledger row",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+        )
+
+    def test_create_edit_and_delete_keep_ledger_in_step(self):
+        deposit = self._create(self.checking, TransactionType.DEPOSIT, "500.00")
+        self._create(self.checking, TransactionType.EXPENSE, "120.50")
+        self.assertEqual(self._ledger(self.checking), Decimal("379.50"))
+        self.assertEqual(self.checking.ledger_balance, Decimal("379.50"))
+
+        deposit.amount = Decimal("450.00")
+        deposit.save()
+        self.assertEqual(self._ledger(self.checking), Decimal("329.50"))
+
+        deposit.delete()
+        self.assertEqual(self._ledger(self.checking), Decimal("-120.50"))
+
+    def test_moving_transaction_between_accounts_moves_its_amount(self):
+        transaction = self._create(self.checking, TransactionType.DEPOSIT, "75.00")
+
+        transaction.account = self.savings
+        transaction.save()
+
+        self.assertEqual(self._ledger(self.checking), Decimal("0.00"))
+        self.assertEqual(self._ledger(self.savings), Decimal("75.00"))
+
+    def test_recompute_command_reports_and_fixes_drift(self):
+        self._create(self.checking, TransactionType.DEPOSIT, "40.00")
+        Account.objects.filter(pk=self.checking.pk).update(ledger_balance=Decimal("12.00"))
+
+        report = StringIO()
+        call_command("recompute_ledger_balances", "--chunk-size", "1", stdout=report)
+        self.assertIn("1 drifted", report.getvalue())
+        self.assertIn("drift -28.00", report.getvalue())
+        self.assertEqual(self._ledger(self.checking), Decimal("12.00"))
+
+        call_command("recompute_ledger_balances", "--fix", stdout=StringIO())
+        self.assertEqual(self._ledger(self.checking), Decimal("40.00"))
+
+        clean = StringIO()
+        call_command("recompute_ledger_balances", stdout=clean)
+        self.assertIn("Checked 2 accounts across 1 households; 0 drifted.", clean.getvalue())
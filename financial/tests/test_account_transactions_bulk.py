@@ -0,0 +1,133 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import (
+    Account,
+    AccountBalanceSnapshot,
+    AccountStatus,
+    AccountType,
+    Category,
+    CategoryMonthlyRollup,
+    Transaction,
+    TransactionType,
+)
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountTransactionsBulkEntryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("bulk", "bulk@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Bulk Household", slug="bulk-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Bulk Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        self.groceries = Category.objects.create(user=self.user, name="Groceries")
+        self.bulk_url = reverse("financial:account-transactions-bulk", args=[self.account.id])
+        self.client.force_login(self.user)
+
+    def _payload(self, rows, *, total=None):
+        data = {
+            "rows-TOTAL_FORMS": str(total or len(rows)),
+            "rows-INITIAL_FORMS": "0",
+            "rows-MIN_NUM_FORMS": "1",
+            "rows-MAX_NUM_FORMS": "200",
+        }
+        for idx, row in enumerate(rows):
+            for key, value in row.items():
+                data[f"rows-{idx}-{key}"] = value
+        return data
+
+    def _row(self, description, amount, transaction_type=TransactionType.EXPENSE, category="", posted_on="2026-01-10"):
+        return {
+            "posted_on": posted_on,
+            "description": description,
+            "transaction_type": transaction_type,
+            "amount": amount,
+            "category": category,
+        }
+
+    def test_get_renders_grid(self):
+        response = self.client.get(self.bulk_url, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-bulk-row", count=10)
+        self.assertContains(response, 'value="expense"')
+        self.assertNotContains(response, 'value="charge"')
+
+    def test_post_inserts_rows_with_one_insert_and_updates_derived_data(self):
+        rows = [
+            self._row("Market", "42.10", category=str(self.groceries.id)),
+            self._row("Bakery", "7.90", category=str(self.groceries.id)),
+            self._row("Paycheck", "500.00", TransactionType.DEPOSIT, posted_on="2026-02-01"),
+            {},
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.bulk_url, self._payload(rows), HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 200)
+        inserts = [query for query in context.captured_queries if query["sql"].startswith("INSERT") and 'INTO "financial_transaction" ' in query["sql"]]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            sorted(Transaction.objects.for_account(self.account).values_list("description", "amount")),
+            [("Bakery", Decimal("-7.90")), ("Market", Decimal("-42.10")), ("Paycheck", Decimal("500.00"))],
+        )
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.ledger_balance, Decimal("450.00"))
+        self.assertEqual(
+            dict(AccountBalanceSnapshot.objects.for_account(self.account).values_list("month", "closing_balance")),
+            {date(2026, 1, 1): Decimal("-50.00"), date(2026, 2, 1): Decimal("450.00")},
+        )
+        rollup = CategoryMonthlyRollup.objects.get(category=self.groceries)
+        self.assertEqual((rollup.total, rollup.transaction_count), (Decimal("-50.00"), 2))
+
+    def test_invalid_rows_report_per_row_errors_and_insert_nothing(self):
+        other_user = User.objects.create_user("other-bulk", "other-bulk@example.com", "pass-1234")
+        foreign = Category.objects.create(user=other_user, name="Foreign")
+        rows = [
+            self._row("Market", "42.10"),
+            self._row("", "-3"),
+            self._row("Card charge", "5.00", TransactionType.CHARGE),
+            self._row("Foreign", "5.00", category=str(foreign.id)),
+        ]
+
+        response = self.client.post(self.bulk_url, self._payload(rows), HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Transaction.objects.exists())
+        self.assertContains(response, "Enter a description.", status_code=422)
+        self.assertContains(response, "Amount must be greater than 0.", status_code=422)
+        self.assertContains(response, "Select a valid choice", count=2, status_code=422)
+        self.assertContains(response, 'class="bg-error/10"', count=3, status_code=422)
+
+    def test_empty_grid_is_rejected(self):
+        response = self.client.post(self.bulk_url, self._payload([{}, {}]), HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_identical_entries_from_separate_submissions_are_all_kept(self):
+        for _ in range(2):
+            response = self.client.post(self.bulk_url, self._payload([self._row("Coffee", "5.00")]), HTTP_HX_REQUEST="true")
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(Transaction.objects.for_account(self.account).filter(description="Coffee").count(), 2)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.ledger_balance, Decimal("-10.00"))
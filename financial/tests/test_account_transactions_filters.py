@@ -0,0 +1,156 @@
+from datetime import date
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Category, Transaction, TransactionType
+from financial.services.transaction_filters import (
+    UNCATEGORIZED_FILTER_VALUE,
+    TransactionFilterError,
+    TransactionFilters,
+    transaction_facets,
+)
+from financial.services.transactions import TRANSACTIONS_PAGE_SIZE
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountTransactionsFilterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("filterer", "filterer@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Filter Household", slug="filter-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Filter Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        self.groceries = Category.objects.create(user=self.user, name="Groceries")
+        self.utilities = Category.objects.create(user=self.user, name="Utilities")
+        self.body_url = reverse("financial:account-transactions-body", args=[self.account.id])
+
+        self._create("Market", "42.00", TransactionType.EXPENSE, self.groceries, date(2025, 1, 5))
+        self._create("Bakery", "8.50", TransactionType.EXPENSE, self.groceries, date(2025, 2, 10))
+        self._create("Power", "120.00", TransactionType.EXPENSE, self.utilities, date(2025, 2, 12))
+        self._create("Paycheck", "1500.00", TransactionType.DEPOSIT, None, date(2025, 2, 15))
+        self._create("Refund", "9.00", TransactionType.DEPOSIT, self.groceries, date(2025, 3, 1))
+
+    def _create(self, description, amount, transaction_type, category, posted_on):
+        return Transaction.objects.create(
+            account=self.account,
+            household=self.household,
+            posted_on=posted_on,
+            description=description,
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+            category=category,
+        )
+
+    def _descriptions(self, filters: TransactionFilters) -> list[str]:
+        queryset = filters.apply(Transaction.objects.for_account(self.account)).ordered()
+        return list(queryset.values_list("description", flat=True))
+
+    def test_filters_combine_date_category_type_and_amount_magnitude(self):
+        self.assertEqual(
+            self._descriptions(TransactionFilters(start=date(2025, 2, 1), end=date(2025, 2, 28))),
+            ["Paycheck", "Power", "Bakery"],
+        )
+        self.assertEqual(
+            self._descriptions(TransactionFilters(category=str(self.groceries.id), transaction_type=TransactionType.EXPENSE)),
+            ["Bakery", "Market"],
+        )
+        self.assertEqual(self._descriptions(TransactionFilters(category=UNCATEGORIZED_FILTER_VALUE)), ["Paycheck"])
+        # Expenses are stored negative on checking; bounds match the magnitude.
+        self.assertEqual(
+            self._descriptions(TransactionFilters(min_amount=Decimal("8.00"), max_amount=Decimal("50.00"))),
+            ["Refund", "Bakery", "Market"],
+        )
+
+    def test_facet_counts_come_from_one_query_and_ignore_their_own_filter(self):
+        filters = TransactionFilters(category=str(self.groceries.id), transaction_type=TransactionType.EXPENSE)
+
+        with CaptureQueriesContext(connection) as context:
+            facets = transaction_facets(Transaction.objects.for_account(self.account), filters)
+
+        self.assertEqual(len(context), 1)
+        self.assertEqual(
+            [(facet.label, facet.count, facet.selected) for facet in facets.categories],
+            [("Groceries", 2, True), ("Utilities", 1, False)],
+        )
+        self.assertEqual(
+            [(facet.value, facet.count, facet.selected) for facet in facets.transaction_types],
+            [(TransactionType.DEPOSIT, 1, False), (TransactionType.EXPENSE, 2, True)],
+        )
+        self.assertEqual(facets.total, 2)
+
+    def test_query_params_round_trip_and_reject_bad_input(self):
+        params = {"start": "2025-02-01", "category": str(self.groceries.id), "min_amount": "5"}
+        filters = TransactionFilters.from_query_params(params)
+
+        self.assertTrue(filters.is_active)
+        self.assertEqual(TransactionFilters.from_query_params(filters.to_query_params()), filters)
+        for bad in ({"start": "02/01/2025"}, {"category": "groceries"}, {"type": "bogus"}, {"max_amount": "-1"}):
+            with self.subTest(bad=bad), self.assertRaises(TransactionFilterError):
+                TransactionFilters.from_query_params(bad)
+
+    def test_filtered_pages_use_composite_indexes(self):
+        queryset = Transaction.objects.for_account(self.account)
+
+        by_category = TransactionFilters(category=str(self.groceries.id)).apply(queryset).ordered()
+        by_type = TransactionFilters(transaction_type=TransactionType.EXPENSE).apply(queryset).ordered()
+
+        self.assertIn("fin_txn_acct_cat_posted_id", by_category.explain())
+        self.assertIn("fin_txn_acct_type_posted_id", by_type.explain())
+
+    def test_body_endpoint_renders_filtered_rows_and_facets(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.body_url, {"type": TransactionType.DEPOSIT}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-transaction-id", count=2)
+        self.assertContains(response, "Groceries (1)")
+        self.assertContains(response, "2 matching")
+        self.assertContains(response, "Clear filters")
+
+    def test_next_page_url_keeps_filters(self):
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=self.account,
+                    household=self.household,
+                    posted_on=date(2024, 12, 1),
+                    description=f"Older {idx}",
+                    transaction_type=TransactionType.EXPENSE,
+                    amount=Decimal("-1.00"),
+                )
+                for idx in range(TRANSACTIONS_PAGE_SIZE)
+            ]
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.body_url, {"type": TransactionType.EXPENSE}, HTTP_HX_REQUEST="true")
+        next_page_url = response.context["transactions_next_page_url"]
+        params = parse_qs(urlparse(next_page_url).query)
+        self.assertEqual(params["type"], [TransactionType.EXPENSE])
+
+        second = self.client.get(next_page_url, HTTP_HX_REQUEST="true")
+        self.assertContains(second, "data-transaction-id", count=3)
+        self.assertNotContains(second, "account_transactions_filters")
+
+    def test_body_endpoint_rejects_invalid_filters(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.body_url, {"end": "not-a-date"}, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 400)
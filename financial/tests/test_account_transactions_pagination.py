@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.transactions import (
+    TRANSACTIONS_PAGE_SIZE,
+    TransactionCursor,
+    TransactionCursorError,
+    paginate_transactions,
+)
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountTransactionsPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("pager", "pager@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Pager Household", slug="pager-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Pager Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        self.body_url = reverse("financial:account-transactions-body", args=[self.account.id])
+
+    def _create_transactions(self, count: int) -> None:
+        start_date = date(2025, 1, 1)
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=self.account,
+                    household=self.household,
+                    posted_on=start_date + timedelta(days=idx % 7),
+                    description=f"Row {idx:04d}",
+                    transaction_type=TransactionType.EXPENSE,
+                    amount=Decimal("-1.00"),
+                )
+                for idx in range(count)
+            ]
+        )
+
+    def test_pages_walk_every_row_once_in_ordered_sequence(self):
+        self._create_transactions(TRANSACTIONS_PAGE_SIZE * 2 + 7)
+        expected_ids = [str(pk) for pk in Transaction.objects.for_account(self.account).ordered().values_list("id", flat=True)]
+
+        seen_ids: list[str] = []
+        cursor = None
+        while True:
+            page = paginate_transactions(Transaction.objects.for_account(self.account), cursor=cursor)
+            seen_ids.extend(row.id for row in page.rows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(seen_ids, expected_ids)
+
+    def test_page_query_count_does_not_grow_with_history(self):
+        self._create_transactions(TRANSACTIONS_PAGE_SIZE * 4)
+        first = paginate_transactions(Transaction.objects.for_account(self.account))
+        with CaptureQueriesContext(connection) as small_context:
+            paginate_transactions(Transaction.objects.for_account(self.account), cursor=first.next_cursor, page_size=10)
+
+        self._create_transactions(TRANSACTIONS_PAGE_SIZE * 4)
+        with CaptureQueriesContext(connection) as large_context:
+            paginate_transactions(Transaction.objects.for_account(self.account), cursor=first.next_cursor, page_size=10)
+
+        self.assertEqual(len(small_context), len(large_context))
+        self.assertIn("LIMIT 11", small_context.captured_queries[-1]["sql"])
+
+    def test_cursor_round_trips_and_rejects_garbage(self):
+        self._create_transactions(1)
+        transaction = Transaction.objects.get()
+        cursor = TransactionCursor.from_transaction(transaction)
+
+        self.assertEqual(TransactionCursor.decode(cursor.encode()), cursor)
+        with self.assertRaises(TransactionCursorError):
+            TransactionCursor.decode("not-a-cursor")
+
+    def test_body_endpoint_appends_next_page_rows(self):
+        self._create_transactions(TRANSACTIONS_PAGE_SIZE + 5)
+        self.client.force_login(self.user)
+
+        first = self.client.get(self.body_url, HTTP_HX_REQUEST="true")
+        self.assertContains(first, "data-transaction-id", count=TRANSACTIONS_PAGE_SIZE)
+        self.assertContains(first, 'hx-trigger="revealed"')
+
+        next_cursor = paginate_transactions(Transaction.objects.for_account(self.account)).next_cursor
+        second = self.client.get(self.body_url, {"cursor": next_cursor}, HTTP_HX_REQUEST="true")
+        self.assertEqual(second.status_code, 200)
+        self.assertContains(second, "data-transaction-id", count=5)
+        self.assertNotContains(second, "account_transactions_table")
+        self.assertNotContains(second, 'hx-trigger="revealed"')
+
+    def test_body_endpoint_rejects_invalid_cursor(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.body_url, {"cursor": "%%%"}, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 400)
@@ -7,6 +7,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.transactions import TRANSACTIONS_PAGE_SIZE
 from households.models import Household, HouseholdMember
 
 User = get_user_model()
@@ -44,7 +45,7 @@ class AccountTransactionsPerformanceTests(TestCase):
                     posted_on=start_date + timedelta(days=idx % 14),
                     description=f"Load Test {idx:03d}",
                     transaction_type=TransactionType.EXPENSE if idx % 2 == 0 else TransactionType.DEPOSIT,
-                    amount=Decimal("5.00") + Decimal(idx),
+                    amount=(Decimal("5.00") + Decimal(idx)) * (-1 if idx % 2 == 0 else 1),
                 )
             )
         Transaction.objects.bulk_create(transactions)
@@ -60,4 +61,5 @@ class AccountTransactionsPerformanceTests(TestCase):
             2.0,
             msg=f"/accounts/<uuid>/ took {duration:.3f}s which exceeds the 2s budget",
         )
-        self.assertContains(response, "Load Test", count=200)
+        self.assertContains(response, "Load Test", count=TRANSACTIONS_PAGE_SIZE)
+        self.assertContains(response, "financial.account_transactions_load_more")
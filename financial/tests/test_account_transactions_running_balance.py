@@ -0,0 +1,91 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.transactions import paginate_transactions
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountTransactionsRunningBalanceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ledger", "ledger@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Ledger Household", slug="ledger-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Ledger Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+            current_balance=Decimal("1000.00"),
+        )
+        amounts = [("250.00", TransactionType.DEPOSIT), ("40.25", TransactionType.EXPENSE), ("9.75", TransactionType.EXPENSE)]
+        for day in range(1, 5):
+            for amount, transaction_type in amounts:
+                Transaction.objects.create(
+                    account=self.account,
+                    posted_on=date(2026, 3, day),
+                    description=f"Day {day} {transaction_type}",
+                    transaction_type=transaction_type,
+                    amount=Decimal(amount),
+                )
+
+    def _expected_balances(self) -> list[str]:
+        balance = self.account.current_balance
+        expected = []
+        for amount in Transaction.objects.for_account(self.account).ordered().values_list("amount", flat=True):
+            expected.append(f"${balance:,.2f}")
+            balance -= amount
+        return expected
+
+    def test_running_balance_continues_across_keyset_pages(self):
+        balances: list[str] = []
+        cursor = None
+        while True:
+            page = paginate_transactions(
+                Transaction.objects.for_account(self.account),
+                cursor=cursor,
+                page_size=5,
+                closing_balance=self.account.current_balance,
+            )
+            balances.extend(row.balance_display for row in page.rows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(balances, self._expected_balances())
+
+    def test_running_balance_is_a_window_over_the_page_only(self):
+        first = paginate_transactions(
+            Transaction.objects.for_account(self.account),
+            page_size=5,
+            closing_balance=self.account.current_balance,
+        )
+        with CaptureQueriesContext(connection) as context:
+            paginate_transactions(Transaction.objects.for_account(self.account), cursor=first.next_cursor, page_size=5)
+
+        sql = context.captured_queries[-1]["sql"]
+        self.assertEqual(len(context), 1)
+        self.assertIn(" OVER ", sql)
+        self.assertIn("LIMIT 6", sql)
+
+    def test_panel_seeds_balance_column_from_ledger_balance(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("financial:account-transactions-body", args=[self.account.id]))
+
+        self.assertContains(response, "Balance")
+        self.assertContains(response, "$800.00")
+        self.assertNotContains(response, "$1,000.00")
@@ -0,0 +1,96 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType
+from financial.services.accounts import account_order_key
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class AccountRowPatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("rows", "rows@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Rows Household", slug="rows-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("Everyday Checking", AccountType.CHECKING)
+        self.savings = self._account("Rainy Day Savings", AccountType.SAVINGS)
+        self.client.force_login(self.user)
+
+    def _account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            institution="Metro",
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+            current_balance=Decimal("100.00"),
+        )
+
+    def _edit(self, account, **changes):
+        payload = {
+            "name": account.name,
+            "institution": account.institution,
+            "account_type": account.account_type,
+            "number_last4": "",
+            "status": account.status,
+            "current_balance": "100.00",
+            "credit_limit_or_principal": "",
+            "statement_close_date": "",
+            "payment_due_day": "",
+            "notes": "",
+            **changes,
+        }
+        return self.client.post(reverse("financial:accounts-edit", args=[account.id]), payload, HTTP_HX_REQUEST="true")
+
+    def test_edit_in_place_patches_only_that_row(self):
+        response = self._edit(self.savings, current_balance="250.00")
+
+        body = response.content.decode()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('id="accounts-table"', body)
+        self.assertIn(f'id="account-row-{self.savings.id}"', body)
+        self.assertIn('hx-swap-oob="true"', body)
+        self.assertIn("$250.00", body)
+        self.assertNotIn(f"account-row-{self.checking.id}", body)
+
+    def test_edit_that_reorders_falls_back_to_the_full_table(self):
+        response = self._edit(self.checking, name="Zephyr Checking", account_type=AccountType.LOAN)
+
+        body = response.content.decode()
+        self.assertIn('id="accounts-table"', body)
+        self.assertIn(f"account-row-{self.savings.id}", body)
+
+    def test_delete_removes_only_that_row(self):
+        response = self.client.post(reverse("financial:accounts-delete", args=[self.savings.id]), HTTP_HX_REQUEST="true")
+
+        body = response.content.decode()
+        self.assertIn(f'<tr id="account-row-{self.savings.id}" hx-swap-oob="delete"></tr>', body)
+        self.assertNotIn('id="accounts-table"', body)
+        self.assertNotIn(f"account-row-{self.checking.id}", body)
+
+    def test_deleting_the_last_account_renders_the_empty_state(self):
+        self.savings.delete()
+
+        response = self.client.post(reverse("financial:accounts-delete", args=[self.checking.id]), HTTP_HX_REQUEST="true")
+
+        body = response.content.decode()
+        self.assertIn('id="accounts-table"', body)
+        self.assertIn("No accounts yet", body)
+
+    def test_order_key_matches_queryset_ordering(self):
+        self._account("Car Loan", AccountType.LOAN)
+        self._account("Another Checking", AccountType.CHECKING)
+
+        accounts = list(Account.objects.for_household(self.household))
+
+        self.assertEqual(accounts, sorted(accounts, key=account_order_key))
@@ -0,0 +1,233 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    CategorizationMatchType,
+    CategorizationRule,
+    Category,
+    CategoryMonthlyRollup,
+    Transaction,
+    TransactionType,
+)
+from financial.services.categorization import CategoryRuleMatcher, recategorize_history, rules_matcher_for_user
+from financial.services.transaction_import import import_transactions_from_csv
+from financial.services.transactions import create_bulk_transactions
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class CategorizationRuleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user("rules", "rules@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Rules Household", slug="rules-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Rules Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        self.groceries = Category.objects.create(user=self.user, name="Groceries")
+        self.coffee = Category.objects.create(user=self.user, name="Coffee")
+        self.shopping = Category.objects.create(user=self.user, name="Shopping")
+        self.big_ticket = Category.objects.create(user=self.user, name="Big Ticket")
+
+    def _rule(self, category, match_type, pattern="", priority=100, **kwargs):
+        return CategorizationRule.objects.create(
+            user=self.user,
+            category=category,
+            match_type=match_type,
+            pattern=pattern,
+            priority=priority,
+            **kwargs,
+        )
+
+    def _standard_rules(self):
+        self._rule(self.groceries, CategorizationMatchType.PREFIX, "Whole  Foods")
+        self._rule(self.coffee, CategorizationMatchType.CONTAINS, "coffee")
+        self._rule(self.shopping, CategorizationMatchType.REGEX, r"^amzn\s*mktp", priority=50)
+        self._rule(self.big_ticket, CategorizationMatchType.AMOUNT, min_amount=Decimal("500.00"), priority=200)
+
+    def test_matcher_picks_best_ranked_rule(self):
+        self._standard_rules()
+        matcher = CategoryRuleMatcher(CategorizationRule.objects.filter(user=self.user))
+
+        self.assertEqual(matcher.match("WHOLE FOODS #123", Decimal("-40.00")), self.groceries.id)
+        self.assertEqual(matcher.match("Blue Bottle Coffee", Decimal("-6.00")), self.coffee.id)
+        self.assertEqual(matcher.match("AMZN Mktp US coffee beans", Decimal("-20.00")), self.shopping.id)
+        self.assertEqual(matcher.match("Furniture store", Decimal("-899.00")), self.big_ticket.id)
+        self.assertIsNone(matcher.match("Furniture store", Decimal("-89.00")))
+        self.assertIsNone(matcher.match("Wholesale", Decimal("-5.00")))
+
+    def test_amount_bounds_narrow_text_rules(self):
+        self._rule(self.big_ticket, CategorizationMatchType.CONTAINS, "costco", priority=10, min_amount=Decimal("300.00"))
+        self._rule(self.groceries, CategorizationMatchType.CONTAINS, "costco", priority=20)
+        matcher = rules_matcher_for_user(self.user.pk)
+
+        self.assertEqual(matcher.match("COSTCO WHSE", Decimal("-350.00")), self.big_ticket.id)
+        self.assertEqual(matcher.match("COSTCO WHSE", Decimal("-35.00")), self.groceries.id)
+
+    def test_invalid_rules_are_rejected(self):
+        with self.assertRaises(ValidationError):
+            self._rule(self.shopping, CategorizationMatchType.REGEX, "amzn(")
+        with self.assertRaises(ValidationError):
+            self._rule(self.shopping, CategorizationMatchType.REGEX, r"(a)\1")
+        with self.assertRaises(ValidationError):
+            self._rule(self.big_ticket, CategorizationMatchType.AMOUNT)
+        other_user = User.objects.create_user("rules-other", "rules-other@example.com", "pass-1234")
+        with self.assertRaises(ValidationError):
+            CategorizationRule.objects.create(
+                user=other_user, category=self.coffee, match_type=CategorizationMatchType.CONTAINS, pattern="x"
+            )
+
+    def test_named_groups_and_inline_flags_are_rejected(self):
+        for pattern in ("(?P<shop>coffee)", "(?i)coffee", "coffee(?s)"):
+            with self.subTest(pattern=pattern), self.assertRaises(ValidationError):
+                self._rule(self.coffee, CategorizationMatchType.REGEX, pattern)
+
+    def test_rules_that_clash_when_combined_still_match_one_by_one(self):
+        # Saved without clean(), as rules written before it checked for these were.
+        CategorizationRule.objects.bulk_create(
+            [
+                CategorizationRule(user=self.user, category=self.coffee, match_type=CategorizationMatchType.REGEX, pattern="(?P<shop>coffee)", priority=10),
+                CategorizationRule(user=self.user, category=self.groceries, match_type=CategorizationMatchType.REGEX, pattern="(?P<shop>market)", priority=20),
+                CategorizationRule(user=self.user, category=self.shopping, match_type=CategorizationMatchType.REGEX, pattern="(?i)mall", priority=30),
+                CategorizationRule(user=self.user, category=self.big_ticket, match_type=CategorizationMatchType.CONTAINS, pattern="jeweler", priority=40),
+            ]
+        )
+        matcher = rules_matcher_for_user(self.user.pk)
+
+        self.assertEqual(matcher.match("Corner Coffee", Decimal("-4.00")), self.coffee.id)
+        self.assertEqual(matcher.match("Farmers Market", Decimal("-20.00")), self.groceries.id)
+        self.assertEqual(matcher.match("Outlet MALL", Decimal("-60.00")), self.shopping.id)
+        self.assertEqual(matcher.match("Downtown Jeweler", Decimal("-600.00")), self.big_ticket.id)
+        self.assertIsNone(matcher.match("Gas station", Decimal("-30.00")))
+
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("financial:account-transactions-new", args=[self.account.id]),
+            {
+                "posted_on": "2026-03-01",
+                "description": "Corner Coffee",
+                "transaction_type": TransactionType.EXPENSE,
+                "amount": "4.00",
+            },
+            HTTP_HX_REQUEST="true",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Transaction.objects.get(description="Corner Coffee").category_id, self.coffee.id)
+
+    def test_matcher_is_cached_until_rules_change(self):
+        self._rule(self.coffee, CategorizationMatchType.CONTAINS, "coffee")
+        rules_matcher_for_user(self.user.pk)
+
+        # Only the version check runs; the rules themselves come from the cache.
+        with self.assertNumQueries(1):
+            matcher = rules_matcher_for_user(self.user.pk)
+        self.assertIsNone(matcher.match("Tea house", Decimal("-3.00")))
+
+        self._rule(self.coffee, CategorizationMatchType.CONTAINS, "tea")
+        self.assertEqual(rules_matcher_for_user(self.user.pk).match("Tea house", Decimal("-3.00")), self.coffee.id)
+
+        self.coffee.delete()
+        self.assertFalse(rules_matcher_for_user(self.user.pk))
+
+    def test_rules_apply_on_create_bulk_entry_and_import(self):
+        self._standard_rules()
+        self.client.force_login(self.user)
+
+        self.client.post(
+            reverse("financial:account-transactions-new", args=[self.account.id]),
+            {
+                "posted_on": "2026-01-02",
+                "description": "Corner Coffee",
+                "transaction_type": TransactionType.EXPENSE,
+                "amount": "4.00",
+            },
+            HTTP_HX_REQUEST="true",
+        )
+        create_bulk_transactions(
+            self.account,
+            [
+                {"posted_on": date(2026, 1, 3), "description": "Whole Foods", "transaction_type": TransactionType.EXPENSE, "amount": Decimal("50.00"), "category": ""},
+                {"posted_on": date(2026, 1, 3), "description": "Whole Foods", "transaction_type": TransactionType.EXPENSE, "amount": Decimal("9.00"), "category": str(self.shopping.id)},
+            ],
+            user=self.user,
+        )
+        upload = SimpleUploadedFile("statement.csv", b"Date,Description,Amount\n2026-01-04,AMZN Mktp US,-25.00\n2026-01-05,Payroll,900.00\n")
+        import_transactions_from_csv(uploaded_file=upload, account=self.account, user=self.user)
+
+        self.assertEqual(
+            dict(Transaction.objects.for_account(self.account).values_list("amount", "category__name")),
+            {
+                Decimal("-4.00"): "Coffee",
+                Decimal("-50.00"): "Groceries",
+                Decimal("-9.00"): "Shopping",
+                Decimal("-25.00"): "Shopping",
+                Decimal("900.00"): "Big Ticket",
+            },
+        )
+
+    def test_recategorize_history_updates_rows_and_rollups_in_chunks(self):
+        for idx in range(5):
+            Transaction.objects.create(
+                account=self.account,
+                posted_on=date(2026, 2, idx + 1),
+                description=f"Coffee Shop {idx}",
+                transaction_type=TransactionType.EXPENSE,
+                amount=Decimal("5.00"),
+            )
+        Transaction.objects.create(
+            account=self.account,
+            posted_on=date(2026, 2, 9),
+            description="Coffee beans",
+            transaction_type=TransactionType.EXPENSE,
+            amount=Decimal("15.00"),
+            category=self.groceries,
+        )
+        self._rule(self.coffee, CategorizationMatchType.CONTAINS, "coffee")
+
+        self.assertEqual(recategorize_history(self.user.pk, chunk_size=2), 5)
+
+        rollups = dict(
+            CategoryMonthlyRollup.objects.filter(month=date(2026, 2, 1)).values_list("category__name", "transaction_count")
+        )
+        self.assertEqual(rollups, {"Coffee": 5, "Groceries": 1})
+        self.assertEqual(recategorize_history(self.user.pk, overwrite=True), 1)
+        self.assertEqual(Transaction.objects.filter(category=self.coffee).count(), 6)
+
+    def test_recategorize_command_reports_counts(self):
+        Transaction.objects.create(
+            account=self.account,
+            posted_on=date(2026, 2, 1),
+            description="Coffee",
+            transaction_type=TransactionType.EXPENSE,
+            amount=Decimal("5.00"),
+        )
+        self._rule(self.coffee, CategorizationMatchType.CONTAINS, "coffee")
+        out = StringIO()
+
+        call_command("recategorize_transactions", user="rules", stdout=out)
+
+        self.assertIn("Re-categorized 1 transactions for 1 users.", out.getvalue())
@@ -0,0 +1,189 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    Category,
+    CategoryMonthlyRollup,
+    Transaction,
+    TransactionType,
+    transaction_archive_horizon,
+)
+from financial.services.archive import archive_transactions
+from financial.services.rollups import category_spending, rebuild_category_rollups
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class CategoryMonthlyRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("rollup", "rollup@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Rollup Household", slug="rollup-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._create_account("Rollup Checking", AccountType.CHECKING)
+        self.card = self._create_account("Rollup Card", AccountType.CREDIT_CARD)
+        self.groceries = Category.objects.create(user=self.user, name="Groceries")
+        self.dining = Category.objects.create(user=self.user, name="Dining")
+
+    def _create_account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _create(self, account, amount, transaction_type, category, posted_on) -> Transaction:
+        return Transaction.objects.create(
+            account=account,
+            household=self.household,
+            posted_on=posted_on,
+            description="Rollup row",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+            category=category,
+        )
+
+    def _rollups(self) -> dict:
+        return {
+            (category_id, month, transaction_type): (total, count)
+            for category_id, month, transaction_type, total, count in CategoryMonthlyRollup.objects.for_household(
+                self.household
+            ).values_list("category_id", "month", "transaction_type", "total", "transaction_count")
+        }
+
+    def test_writes_edits_and_deletes_keep_rollups_current(self):
+        first = self._create(self.checking, "40.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+        self._create(self.checking, "10.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 20))
+        self.assertEqual(
+            self._rollups(),
+            {(self.groceries.id, date(2026, 1, 1), TransactionType.EXPENSE): (Decimal("-50.00"), 2)},
+        )
+
+        first.amount = Decimal("25.00")
+        first._signed_amount = False
+        first.save()
+        self.assertEqual(
+            self._rollups()[(self.groceries.id, date(2026, 1, 1), TransactionType.EXPENSE)],
+            (Decimal("-35.00"), 2),
+        )
+
+        first.category = self.dining
+        first.posted_on = date(2026, 2, 2)
+        first.save()
+        self.assertEqual(
+            self._rollups(),
+            {
+                (self.groceries.id, date(2026, 1, 1), TransactionType.EXPENSE): (Decimal("-10.00"), 1),
+                (self.dining.id, date(2026, 2, 1), TransactionType.EXPENSE): (Decimal("-25.00"), 1),
+            },
+        )
+
+        first.delete()
+        self.assertNotIn((self.dining.id, date(2026, 2, 1), TransactionType.EXPENSE), self._rollups())
+
+    def test_deleting_category_folds_rollups_into_uncategorized(self):
+        self._create(self.checking, "12.00", TransactionType.EXPENSE, self.dining, date(2026, 1, 5))
+        self._create(self.checking, "8.00", TransactionType.EXPENSE, None, date(2026, 1, 6))
+
+        self.dining.delete()
+
+        self.assertEqual(
+            self._rollups(),
+            {(None, date(2026, 1, 1), TransactionType.EXPENSE): (Decimal("-20.00"), 2)},
+        )
+
+    def test_deleting_an_account_removes_its_hot_and_archived_rows(self):
+        old_day = transaction_archive_horizon() - timedelta(days=40)
+        self._create(self.checking, "30.00", TransactionType.EXPENSE, self.groceries, old_day)
+        self._create(self.checking, "20.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+        self._create(self.card, "10.00", TransactionType.CHARGE, self.groceries, date(2026, 1, 6))
+        archive_transactions()
+
+        self.checking.delete()
+
+        self.assertEqual(
+            self._rollups(),
+            {(self.groceries.id, date(2026, 1, 1), TransactionType.CHARGE): (Decimal("10.00"), 1)},
+        )
+        expected = self._rollups()
+        rebuild_category_rollups([self.household.id])
+        self.assertEqual(self._rollups(), expected)
+
+    def test_spending_reads_rollups_in_one_query(self):
+        self._create(self.checking, "40.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+        self._create(self.card, "60.00", TransactionType.CHARGE, self.groceries, date(2026, 2, 5))
+        self._create(self.card, "15.00", TransactionType.CHARGE, self.dining, date(2026, 2, 9))
+        self._create(self.checking, "900.00", TransactionType.DEPOSIT, None, date(2026, 2, 1))
+
+        with CaptureQueriesContext(connection) as context:
+            report = category_spending(self.household, start=date(2026, 1, 1), end=date(2026, 2, 1))
+
+        self.assertEqual(len(context), 1)
+        self.assertEqual(report.months, [date(2026, 1, 1), date(2026, 2, 1)])
+        self.assertEqual(
+            [(row.label, row.monthly_displays, row.total_display, row.transaction_count) for row in report.rows],
+            [
+                ("Groceries", ["$40.00", "$60.00"], "$100.00", 2),
+                ("Dining", ["$0.00", "$15.00"], "$15.00", 1),
+            ],
+        )
+        self.assertEqual(report.total_display, "$115.00")
+
+    def test_rebuild_matches_incremental_maintenance(self):
+        self._create(self.checking, "40.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+        self._create(self.card, "60.00", TransactionType.CHARGE, None, date(2026, 2, 5))
+        expected = self._rollups()
+        CategoryMonthlyRollup.objects.all().delete()
+
+        self.assertEqual(rebuild_category_rollups([self.household.id]), 2)
+        self.assertEqual(self._rollups(), expected)
+
+        CategoryMonthlyRollup.objects.all().delete()
+        stdout = StringIO()
+        call_command("rebuild_category_rollups", stdout=stdout)
+        self.assertEqual(self._rollups(), expected)
+        self.assertIn("Rebuilt 2 category rollups", stdout.getvalue())
+
+    def test_rebuild_locks_the_households_accounts_before_aggregating(self):
+        self._create(self.checking, "12.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+
+        with CaptureQueriesContext(connection) as context:
+            rebuild_category_rollups([self.household.pk])
+
+        tables = [
+            table
+            for query in context.captured_queries
+            for table in (Account._meta.db_table, Transaction._meta.db_table)
+            if f'FROM "{table}"' in query["sql"]
+        ]
+        self.assertEqual(tables[0], Account._meta.db_table)
+        self.assertIn(Transaction._meta.db_table, tables)
+
+    def test_spending_page_renders_report(self):
+        self._create(self.checking, "40.00", TransactionType.EXPENSE, self.groceries, date(2026, 1, 5))
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("financial:spending-index"), {"start": "2026-01", "end": "2026-03"})
+        self.assertContains(response, "Groceries")
+        self.assertContains(response, "$40.00", count=3)
+
+        invalid = self.client.get(reverse("financial:spending-index"), {"start": "2026-04", "end": "2026-03"})
+        self.assertEqual(invalid.status_code, 400)
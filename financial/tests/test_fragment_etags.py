@@ -0,0 +1,168 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    Category,
+    MonthlyBillPayment,
+    Transaction,
+    TransactionType,
+)
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class FragmentETagTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("etags", "etags@example.com", "pass-1234")
+        self.household = Household.objects.create(name="ETag Household", slug="etag-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("ETag Checking", AccountType.CHECKING)
+        self.card = self._account("ETag Card", AccountType.CREDIT_CARD)
+        self.category = Category.objects.create(user=self.user, name="Groceries")
+        self._record("Groceries run", category=self.category)
+        self.client.force_login(self.user)
+
+    def _account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _record(self, description, *, category=None):
+        return Transaction.objects.create(
+            account=self.checking,
+            posted_on=date(2026, 3, 1),
+            description=description,
+            transaction_type=TransactionType.DEPOSIT,
+            amount=Decimal("25.00"),
+            category=category,
+        )
+
+    def _fragment_urls(self):
+        return (
+            reverse("financial:accounts-table"),
+            reverse("financial:bill-pay-table-body"),
+            reverse("financial:transactions-body"),
+            reverse("financial:account-transactions-body", args=[self.checking.pk]),
+        )
+
+    def _get(self, url, etag=None):
+        headers = {"HTTP_HX_REQUEST": "true"}
+        if etag is not None:
+            headers["HTTP_IF_NONE_MATCH"] = etag
+        return self.client.get(url, **headers)
+
+    def _data_version(self):
+        self.household.refresh_from_db(fields=["data_version"])
+        return self.household.data_version
+
+    def test_fragments_carry_a_revalidated_etag(self):
+        for url in self._fragment_urls():
+            with self.subTest(url=url):
+                response = self._get(url)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.headers["ETag"].startswith(f'"{self.household.pk}:'))
+                self.assertIn("no-cache", response.headers["Cache-Control"])
+                self.assertIn("private", response.headers["Cache-Control"])
+                self.assertIn("HX-Request", response.headers["Vary"])
+
+    def test_matching_etag_is_answered_before_the_view_runs(self):
+        for url in self._fragment_urls():
+            with self.subTest(url=url):
+                etag = self._get(url).headers["ETag"]
+
+                with CaptureQueriesContext(connection) as context:
+                    response = self._get(url, etag)
+
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response.headers["ETag"], etag)
+                tables = " ".join(query["sql"] for query in context.captured_queries)
+                self.assertNotIn(Account._meta.db_table, tables)
+                self.assertNotIn(Transaction._meta.db_table, tables)
+
+    def test_transaction_writes_change_the_etag(self):
+        url = reverse("financial:account-transactions-body", args=[self.checking.pk])
+        etag = self._get(url).headers["ETag"]
+        version = self._data_version()
+
+        self._record("Paycheck")
+
+        self.assertEqual(self._data_version(), version + 1)
+        response = self._get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertContains(response, "Paycheck")
+
+    def test_bill_pay_entries_change_the_etag(self):
+        url = reverse("financial:bill-pay-table-body")
+        etag = self._get(url).headers["ETag"]
+
+        MonthlyBillPayment.objects.create(
+            account=self.card,
+            month=date(2026, 3, 1),
+            actual_payment_amount=Decimal("40.00"),
+        )
+
+        self.assertEqual(self._get(url, etag).status_code, 200)
+
+    def test_account_edits_change_the_etag(self):
+        url = reverse("financial:accounts-table")
+        etag = self._get(url).headers["ETag"]
+
+        self.card.refresh_from_db()
+        self.card.name = "ETag Rewards Card"
+        self.card.save()
+
+        response = self._get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "ETag Rewards Card")
+
+    def test_category_renames_change_the_etag(self):
+        url = reverse("financial:transactions-body")
+        etag = self._get(url).headers["ETag"]
+
+        self.category.name = "Food"
+        self.category.save()
+
+        self.assertEqual(self._get(url, etag).status_code, 200)
+
+    def test_other_households_keep_their_etag(self):
+        other = Household.objects.create(name="Other Household", slug="other-household", created_by=self.user)
+        url = reverse("financial:accounts-table")
+        etag = self._get(url).headers["ETag"]
+
+        Account.objects.create(
+            user=self.user,
+            household=other,
+            name="Elsewhere",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+
+        self.assertEqual(self._get(url, etag).status_code, 304)
+
+    def test_accounts_table_refreshes_itself_when_the_tab_returns(self):
+        response = self.client.get(reverse("financial:accounts-index"))
+
+        self.assertContains(response, f'hx-get="{reverse("financial:accounts-table")}"')
+        self.assertContains(response, "visibilitychange")
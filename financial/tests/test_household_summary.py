@@ -0,0 +1,144 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.summary import build_household_summary, household_summary, household_summary_cache_key
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class HouseholdSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user("summary", "summary@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Summary Household", slug="summary-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("Summary Checking", AccountType.CHECKING)
+        self.savings = self._account("Summary Savings", AccountType.SAVINGS)
+        self.card = self._account("Summary Card", AccountType.CREDIT_CARD, credit_limit_or_principal=Decimal("2000.00"))
+        self.loan = self._account("Summary Loan", AccountType.LOAN, credit_limit_or_principal=Decimal("9000.00"))
+        self._record(self.checking, TransactionType.DEPOSIT, "1500.00")
+        self._record(self.savings, TransactionType.DEPOSIT, "500.00")
+        self._record(self.card, TransactionType.CHARGE, "500.00")
+        self._record(self.loan, TransactionType.CHARGE, "4000.00")
+
+    def _account(self, name, account_type, **extra):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+            **extra,
+        )
+
+    def _record(self, account, transaction_type, amount):
+        return Transaction.objects.create(
+            account=account,
+            posted_on=date(2026, 3, 1),
+            description=f"{account.name} {transaction_type}",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+        )
+
+    def test_totals_come_from_one_grouped_query(self):
+        with CaptureQueriesContext(connection) as context:
+            summary = build_household_summary(self.household)
+
+        self.assertEqual(len(context), 1)
+        self.assertIn("GROUP BY", context.captured_queries[0]["sql"])
+        self.assertEqual(summary.assets, Decimal("2000.00"))
+        self.assertEqual(summary.liabilities, Decimal("4500.00"))
+        self.assertEqual(summary.net_worth, Decimal("-2500.00"))
+        self.assertEqual(summary.credit_limit, Decimal("2000.00"))
+        self.assertEqual(summary.utilization, Decimal("0.2500"))
+        self.assertEqual(summary.utilization_display, "25%")
+        self.assertEqual(
+            [(total.account_type, total.balance) for total in summary.totals],
+            [
+                (AccountType.CHECKING, Decimal("1500.00")),
+                (AccountType.SAVINGS, Decimal("500.00")),
+                (AccountType.CREDIT_CARD, Decimal("500.00")),
+                (AccountType.LOAN, Decimal("4000.00")),
+            ],
+        )
+
+    def test_closed_accounts_and_other_households_are_left_out(self):
+        self.savings.status = AccountStatus.CLOSED
+        self.savings.save()
+        other = Household.objects.create(name="Other Household", slug="other-household", created_by=self.user)
+        Account.objects.create(user=self.user, household=other, name="Other Checking", account_type=AccountType.CHECKING)
+
+        summary = build_household_summary(self.household)
+
+        self.assertEqual(summary.assets, Decimal("1500.00"))
+        self.assertNotIn(AccountType.SAVINGS, [total.account_type for total in summary.totals])
+
+    def _summary(self):
+        # Requests load the household afresh, so they see the bumped data_version.
+        self.household.refresh_from_db()
+        return household_summary(self.household)
+
+    def test_cached_until_an_account_or_transaction_changes(self):
+        household_summary(self.household)
+        with CaptureQueriesContext(connection) as context:
+            cached = household_summary(self.household)
+        self.assertEqual(len(context), 0)
+        self.assertEqual(cached.net_worth, Decimal("-2500.00"))
+
+        payment = self._record(self.card, TransactionType.PAYMENT, "500.00")
+        self.assertEqual(self._summary().utilization, Decimal("0.0000"))
+
+        payment.delete()
+        self.assertEqual(self._summary().liabilities, Decimal("4500.00"))
+
+        self.card.refresh_from_db()
+        self.card.credit_limit_or_principal = Decimal("5000.00")
+        self.card.save()
+        self.assertEqual(self._summary().utilization_display, "10%")
+
+        Transaction.objects.bulk_record(
+            [
+                Transaction(
+                    account=self.checking,
+                    household=self.household,
+                    posted_on=date(2026, 3, 2),
+                    description="Bulk deposit",
+                    transaction_type=TransactionType.DEPOSIT,
+                    amount=Decimal("250.00"),
+                )
+            ]
+        )
+        self.assertEqual(self._summary().assets, Decimal("2250.00"))
+
+    def test_accounts_index_and_household_home_show_the_summary(self):
+        self.client.force_login(self.user)
+
+        for url in (reverse("financial:accounts-index"), reverse("household:home")):
+            response = self.client.get(url)
+            self.assertContains(response, 'id="household-summary"')
+            self.assertContains(response, "-$2,500.00")
+            self.assertContains(response, "25%")
+
+    def test_entries_are_keyed_by_data_version_rather_than_deleted(self):
+        stale = household_summary(self.household)
+
+        self._record(self.checking, TransactionType.DEPOSIT, "100.00")
+
+        # Another worker's copy of the old entry survives but is never read again.
+        self.assertEqual(cache.get(household_summary_cache_key(self.household)), stale)
+        self.assertEqual(self._summary().assets, stale.assets + Decimal("100.00"))
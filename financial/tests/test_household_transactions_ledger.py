@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.transactions import TRANSACTIONS_PAGE_SIZE, paginate_transactions
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class HouseholdTransactionsLedgerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ledger", "ledger@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Ledger Household", slug="ledger-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.other_household = Household.objects.create(name="Other Household", slug="other-household", created_by=self.user)
+        self.accounts = [self._create_account(self.household, f"Ledger Account {idx}") for idx in range(3)]
+        self.outsider = self._create_account(self.other_household, "Outside Account")
+        self.index_url = reverse("financial:transactions-index")
+        self.body_url = reverse("financial:transactions-body")
+
+    def _create_account(self, household, name):
+        return Account.objects.create(
+            user=self.user,
+            household=household,
+            name=name,
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _create_transactions(self, account, count, *, start=date(2025, 1, 1)):
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=account,
+                    household=account.household,
+                    posted_on=start + timedelta(days=idx),
+                    description=f"{account.name} row {idx}",
+                    transaction_type=TransactionType.EXPENSE,
+                    amount=Decimal("-1.00"),
+                )
+                for idx in range(count)
+            ]
+        )
+
+    def test_pages_merge_accounts_in_posted_order_with_account_names(self):
+        for offset, account in enumerate(self.accounts):
+            self._create_transactions(account, 30, start=date(2025, 1, 1) + timedelta(days=offset))
+        self._create_transactions(self.outsider, 5)
+        expected = list(
+            Transaction.objects.for_household(self.household).ordered().values_list("id", flat=True)
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            page = paginate_transactions(
+                Transaction.objects.for_household(self.household),
+                cursor=cursor,
+                extra_fields=("account__name",),
+            )
+            seen.extend(page.rows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual([row.id for row in seen], [str(pk) for pk in expected])
+        self.assertTrue(all(row.account_name.startswith("Ledger Account") for row in seen))
+        self.assertEqual(seen[0].account_name, "Ledger Account 2")
+
+    def test_page_query_count_is_independent_of_account_count(self):
+        # A full page of rows newer than the archive horizon never reads the archive.
+        self._create_transactions(self.accounts[0], TRANSACTIONS_PAGE_SIZE + 1)
+        self.client.force_login(self.user)
+        self.client.get(self.body_url, HTTP_HX_REQUEST="true")
+        with CaptureQueriesContext(connection) as small_context:
+            self.client.get(self.body_url, HTTP_HX_REQUEST="true")
+
+        for idx in range(5):
+            self._create_transactions(self._create_account(self.household, f"Extra {idx}"), 10)
+        with CaptureQueriesContext(connection) as large_context:
+            response = self.client.get(self.body_url, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-transaction-id", count=TRANSACTIONS_PAGE_SIZE)
+        self.assertEqual(len(small_context), len(large_context))
+
+    def test_ledger_page_uses_household_index(self):
+        plan = Transaction.objects.for_household(self.household).ordered().explain()
+        self.assertIn("fin_txn_hh_posted_created_id", plan)
+
+    def test_index_renders_first_page_and_load_more(self):
+        self._create_transactions(self.accounts[0], TRANSACTIONS_PAGE_SIZE + 3)
+        self._create_transactions(self.outsider, 2)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.index_url)
+        self.assertContains(response, "Household Ledger")
+        self.assertContains(response, "data-transaction-id", count=TRANSACTIONS_PAGE_SIZE)
+        self.assertNotContains(response, "Outside Account")
+
+        second = self.client.get(response.context["transactions_next_page_url"], HTTP_HX_REQUEST="true")
+        self.assertContains(second, "data-transaction-id", count=3)
+        self.assertNotContains(second, "household_transactions_table")
+
+    def test_body_rejects_invalid_cursor(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.body_url, {"cursor": "%%%"}, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,107 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Sum
+from django.test import SimpleTestCase, TestCase
+
+from financial.models import Account, AccountBalanceSnapshot, AccountStatus, AccountType, Transaction, TransactionType
+from financial.money import Money, from_minor_units, to_minor_units
+from financial.services.formatters import format_usd
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class MoneyValueTests(SimpleTestCase):
+    def test_minor_unit_conversion_rounds_half_up(self):
+        self.assertEqual(to_minor_units(Decimal("12.34")), 1234)
+        self.assertEqual(to_minor_units(Decimal("-0.005")), -1)
+        self.assertEqual(to_minor_units("1.005"), 101)
+        self.assertEqual(from_minor_units(-123457), Decimal("-1234.57"))
+        self.assertEqual(str(from_minor_units(0)), "0.00")
+
+    def test_formatting_stays_in_integer_cents(self):
+        self.assertEqual(Money(123456789).format(), "$1,234,567.89")
+        self.assertEqual(Money(-5).format(), "-$0.05")
+        self.assertEqual(Money.from_decimal("1.005").format(), "$1.01")
+        self.assertEqual(format_usd(Decimal("2.675")), "$2.68")
+
+    def test_arithmetic_stays_in_minor_units(self):
+        self.assertEqual(Money(150) + Money(-50), Money(100))
+        self.assertEqual(Money(150) - Money(200), Money(-50))
+        self.assertEqual((-Money(25)).amount, Decimal("-0.25"))
+
+
+class MoneyFieldTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("money", "money@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Money Household", slug="money-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Money Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+            current_balance=Decimal("2450.75"),
+        )
+
+    def _record(self, transaction_type, amount, posted_on=date(2026, 5, 1)):
+        return Transaction.objects.create(
+            account=self.account,
+            posted_on=posted_on,
+            description="Money row",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+        )
+
+    def _raw(self, sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
+
+    def test_amounts_are_stored_as_integer_minor_units(self):
+        row = self._record(TransactionType.EXPENSE, "19.99")
+
+        self.assertEqual(self._raw("SELECT amount FROM financial_transaction WHERE id = %s", [row.pk.hex]), -1999)
+        self.assertEqual(
+            self._raw("SELECT current_balance FROM financial_account WHERE id = %s", [self.account.pk.hex]),
+            245075,
+        )
+        row.refresh_from_db()
+        self.assertEqual(row.amount, Decimal("-19.99"))
+
+    def test_derived_balances_and_aggregates_stay_exact(self):
+        self._record(TransactionType.DEPOSIT, "0.10")
+        self._record(TransactionType.DEPOSIT, "0.20")
+        self._record(TransactionType.EXPENSE, "0.30", posted_on=date(2026, 6, 1))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.ledger_balance, Decimal("0.00"))
+        total = Transaction.objects.filter(account=self.account).aggregate(total=Sum("amount"))["total"]
+        self.assertEqual(total, Decimal("0.00"))
+        self.assertEqual(
+            AccountBalanceSnapshot.objects.for_account(self.account).closing_balance(date(2026, 5, 1)),
+            Decimal("0.30"),
+        )
+        balances = list(
+            Transaction.objects.for_account(self.account)
+            .ordered()
+            .with_running_balance(Decimal("0.00"))
+            .values_list("running_balance", flat=True)
+        )
+        self.assertEqual(balances, [Decimal("0.00"), Decimal("0.30"), Decimal("0.10")])
+
+    def test_lookups_compare_in_minor_units(self):
+        self._record(TransactionType.EXPENSE, "12.50")
+
+        self.assertTrue(Transaction.objects.filter(amount=Decimal("-12.50")).exists())
+        self.assertTrue(Transaction.objects.filter(amount__lte=Decimal("-12.5")).exists())
+        self.assertFalse(Transaction.objects.filter(amount__lt=Decimal("-12.50")).exists())
@@ -0,0 +1,163 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    RecurrenceFrequency,
+    RecurringTransaction,
+    Transaction,
+    TransactionType,
+)
+from financial.services.recurring import materialize_recurring_transactions
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class RecurringTransactionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("recurring", "recurring@example.com", "pass-1234")
+        self.household = self._household("Recurring Household", "recurring-household", self.user)
+        self.checking = self._account(self.household, "Recurring Checking", AccountType.CHECKING)
+        self.card = self._account(self.household, "Recurring Card", AccountType.CREDIT_CARD)
+
+        self.other_user = User.objects.create_user("recurring-2", "recurring-2@example.com", "pass-1234")
+        self.other_household = self._household("Other Household", "other-household", self.other_user)
+        self.other_checking = self._account(self.other_household, "Other Checking", AccountType.CHECKING, user=self.other_user)
+
+    def _household(self, name, slug, user):
+        household = Household.objects.create(name=name, slug=slug, created_by=user)
+        HouseholdMember.objects.create(household=household, user=user, role=HouseholdMember.Role.OWNER, is_primary=True)
+        return household
+
+    def _account(self, household, name, account_type, user=None):
+        return Account.objects.create(
+            user=user or self.user,
+            household=household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _schedule(self, account, description, amount, transaction_type, starts_on, **kwargs):
+        return RecurringTransaction.objects.create(
+            account=account,
+            description=description,
+            amount=Decimal(amount),
+            transaction_type=transaction_type,
+            starts_on=starts_on,
+            **kwargs,
+        )
+
+    def test_following_occurrence_keeps_monthly_anchor_day(self):
+        schedule = self._schedule(self.checking, "Rent", "1500.00", TransactionType.EXPENSE, date(2026, 1, 31))
+
+        february = schedule.following_occurrence(date(2026, 1, 31))
+        self.assertEqual(february, date(2026, 2, 28))
+        self.assertEqual(schedule.following_occurrence(february), date(2026, 3, 31))
+
+        schedule.frequency, schedule.interval = RecurrenceFrequency.WEEKLY, 2
+        self.assertEqual(schedule.following_occurrence(date(2026, 1, 31)), date(2026, 2, 14))
+        schedule.frequency, schedule.interval = RecurrenceFrequency.YEARLY, 1
+        self.assertEqual(schedule.following_occurrence(date(2028, 2, 29)), date(2029, 2, 28))
+
+    def test_schedule_rejects_types_the_account_does_not_allow(self):
+        with self.assertRaises(ValidationError):
+            self._schedule(self.card, "Paycheck", "10.00", TransactionType.DEPOSIT, date(2026, 1, 1))
+
+    def test_materializes_due_occurrences_for_every_household(self):
+        rent = self._schedule(self.checking, "Rent", "1500.00", TransactionType.EXPENSE, date(2026, 1, 1))
+        self._schedule(self.card, "Streaming", "15.99", TransactionType.CHARGE, date(2026, 2, 15))
+        self._schedule(self.other_checking, "Payroll", "2000.00", TransactionType.DEPOSIT, date(2026, 3, 6), frequency=RecurrenceFrequency.WEEKLY, interval=2)
+
+        result = materialize_recurring_transactions(through=date(2026, 3, 31))
+
+        self.assertEqual((result.schedules, result.transactions), (3, 7))
+        self.assertEqual(
+            list(Transaction.objects.for_account(self.checking).order_by("posted_on").values_list("posted_on", "amount")),
+            [(date(2026, 1, 1), Decimal("-1500.00")), (date(2026, 2, 1), Decimal("-1500.00")), (date(2026, 3, 1), Decimal("-1500.00"))],
+        )
+        self.assertEqual(Transaction.objects.for_account(self.card).get(posted_on=date(2026, 3, 15)).amount, Decimal("15.99"))
+        self.assertEqual(Transaction.objects.for_account(self.other_checking).count(), 2)
+        rent.refresh_from_db()
+        self.assertEqual(rent.next_occurrence, date(2026, 4, 1))
+        self.checking.refresh_from_db()
+        self.assertEqual(self.checking.ledger_balance, Decimal("-4500.00"))
+
+    def test_rerun_and_stale_runner_never_duplicate_occurrences(self):
+        rent = self._schedule(self.checking, "Rent", "1500.00", TransactionType.EXPENSE, date(2026, 1, 1))
+        materialize_recurring_transactions(through=date(2026, 2, 28))
+
+        self.assertEqual(materialize_recurring_transactions(through=date(2026, 2, 28)).transactions, 0)
+        # A concurrent runner that read the schedule before the first committed.
+        RecurringTransaction.objects.filter(pk=rent.pk).update(next_occurrence=date(2026, 1, 1))
+        result = materialize_recurring_transactions(through=date(2026, 3, 31))
+
+        self.assertEqual(result.transactions, 1)
+        self.assertEqual(Transaction.objects.for_account(self.checking).count(), 3)
+        self.checking.refresh_from_db()
+        self.assertEqual(self.checking.ledger_balance, Decimal("-4500.00"))
+
+    def test_schedule_deactivates_after_end_date(self):
+        gym = self._schedule(
+            self.checking, "Gym", "40.00", TransactionType.EXPENSE, date(2026, 1, 10), ends_on=date(2026, 2, 20)
+        )
+
+        materialize_recurring_transactions(through=date(2026, 6, 30))
+
+        gym.refresh_from_db()
+        self.assertFalse(gym.is_active)
+        self.assertEqual(Transaction.objects.for_account(self.checking).count(), 2)
+
+    def test_schedules_the_account_type_no_longer_allows_are_skipped_and_deactivated(self):
+        salary = self._schedule(self.checking, "Salary", "900.00", TransactionType.DEPOSIT, date(2026, 1, 1))
+        self._schedule(self.other_checking, "Other Rent", "700.00", TransactionType.EXPENSE, date(2026, 1, 1))
+        # Changed without Account.clean(), e.g. by a data fix.
+        Account.objects.filter(pk=self.checking.pk).update(account_type=AccountType.CREDIT_CARD)
+
+        with self.assertLogs("financial.services.recurring", level="WARNING") as logs:
+            result = materialize_recurring_transactions(through=date(2026, 1, 31))
+
+        self.assertEqual(result.transactions, 1)
+        self.assertEqual(Transaction.objects.for_account(self.other_checking).count(), 1)
+        salary.refresh_from_db()
+        self.assertFalse(salary.is_active)
+        self.assertIn(str(salary.pk), logs.output[0])
+
+    def test_account_type_change_is_rejected_while_schedules_need_the_old_type(self):
+        self._schedule(self.checking, "Salary", "900.00", TransactionType.DEPOSIT, date(2026, 1, 1))
+        self.checking.account_type = AccountType.CREDIT_CARD
+
+        with self.assertRaises(ValidationError) as raised:
+            self.checking.full_clean()
+        self.assertIn("account_type", raised.exception.message_dict)
+
+    def test_materialization_inserts_in_bulk(self):
+        for idx in range(30):
+            self._schedule(self.checking, f"Subscription {idx}", "5.00", TransactionType.EXPENSE, date(2026, 1, idx % 28 + 1))
+
+        with CaptureQueriesContext(connection) as context:
+            result = materialize_recurring_transactions(through=date(2026, 2, 28))
+
+        self.assertEqual(result.transactions, 60)
+        inserts = [query for query in context.captured_queries if 'INTO "financial_transaction" ' in query["sql"]]
+        self.assertEqual(len(inserts), 1)
+        self.assertLess(len(context.captured_queries), 40)
+
+    def test_command_reports_materialized_counts(self):
+        self._schedule(self.checking, "Rent", "1500.00", TransactionType.EXPENSE, date(2026, 1, 1))
+        out = StringIO()
+
+        call_command("materialize_recurring_transactions", through="2026-02-01", stdout=out)
+
+        self.assertIn("Materialized 2 transactions from 1 recurring schedules.", out.getvalue())
@@ -0,0 +1,45 @@
+import uuid
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.test.utils import override_script_prefix
+from django.urls import reverse
+
+from financial.services.routes import route_template, route_url
+
+
+class RouteTemplateTests(SimpleTestCase):
+    def test_substituted_urls_match_reverse(self):
+        account_id, transaction_id = uuid.uuid4(), uuid.uuid4()
+
+        self.assertEqual(
+            route_url("financial:accounts-edit", account_id),
+            reverse("financial:accounts-edit", args=[account_id]),
+        )
+        self.assertEqual(
+            route_url("financial:account-transactions-edit", account_id, str(transaction_id)),
+            reverse("financial:account-transactions-edit", args=[account_id, transaction_id]),
+        )
+
+    def test_routes_are_resolved_once(self):
+        first = route_template("financial:bill-pay-row", 1)
+
+        self.assertIs(route_template("financial:bill-pay-row", 1), first)
+
+    def test_script_prefix_is_part_of_the_template(self):
+        account_id = uuid.uuid4()
+
+        with override_script_prefix("/home/"):
+            self.assertEqual(route_url("financial:accounts-preview", account_id), f"/home/household/finance/{account_id}/preview/")
+
+    def test_missing_routes_render_a_placeholder(self):
+        self.assertEqual(route_url("financial:no-such-route", uuid.uuid4()), "#")
+
+    def test_benchmark_reports_every_serializer(self):
+        output = StringIO()
+
+        call_command("benchmark_row_urls", rows=50, repeat=1, stdout=output)
+
+        for label in ("account rows", "transaction rows", "bill-pay rows"):
+            self.assertIn(label, output.getvalue())
@@ -0,0 +1,103 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from financial.fragments import (
+    ACCOUNT_ROW_FRAGMENT,
+    fragment_cache,
+    fragment_cache_stats,
+    fragment_key,
+    reset_fragment_cache_stats,
+)
+from financial.models import Account, AccountStatus, AccountType, MonthlyBillPayment
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class RowFragmentCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("fragments", "fragments@example.com", "pass-1234")
+        self.household = Household.objects.create(
+            name="Fragment Household",
+            slug="fragment-household",
+            created_by=self.user,
+        )
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("Fragment Checking", AccountType.CHECKING)
+        self.card = self._account("Fragment Card", AccountType.CREDIT_CARD)
+        self.client.force_login(self.user)
+        reset_fragment_cache_stats()
+        self.addCleanup(reset_fragment_cache_stats)
+
+    def _account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+            current_balance=Decimal("10.00"),
+        )
+
+    def test_accounts_index_reuses_rendered_rows_until_an_account_changes(self):
+        self.client.get(reverse("financial:accounts-index"))
+        self.assertEqual(fragment_cache_stats().misses, 2)
+
+        response = self.client.get(reverse("financial:accounts-index"))
+        self.assertEqual(fragment_cache_stats().hits, 2)
+        self.assertContains(response, f'id="account-row-{self.checking.id}"')
+        self.assertEqual([row.name for row in response.context["account_rows"]], ["Fragment Checking", "Fragment Card"])
+
+        rendered_key = fragment_key(ACCOUNT_ROW_FRAGMENT, self.checking.pk, self.checking.updated_at)
+        self.checking.current_balance = Decimal("99.00")
+        self.checking.save()
+        self.assertIsNone(fragment_cache().get(rendered_key))
+        response = self.client.get(reverse("financial:accounts-index"))
+
+        stats = fragment_cache_stats()
+        self.assertEqual((stats.hits, stats.misses), (3, 3))
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+        self.assertContains(response, "$99.00")
+
+    def test_deleted_accounts_drop_out_of_the_table(self):
+        self.client.get(reverse("financial:accounts-index"))
+
+        self.card.delete()
+        response = self.client.get(reverse("financial:accounts-index"))
+
+        self.assertNotContains(response, "Fragment Card")
+        self.assertEqual(fragment_cache_stats().hits, 1)
+
+    def test_bill_pay_rows_follow_payment_edits(self):
+        url = reverse("financial:bill-pay-index") + "?month=2026-05"
+        self.client.get(url)
+        self.client.get(url)
+        self.assertEqual((fragment_cache_stats().hits, fragment_cache_stats().misses), (1, 1))
+
+        MonthlyBillPayment.objects.create(
+            account=self.card,
+            funding_account=self.checking,
+            month=date(2026, 5, 1),
+            actual_payment_amount=Decimal("42.00"),
+        )
+        response = self.client.get(url)
+
+        self.assertContains(response, "$42.00")
+        self.assertContains(response, "Fragment Checking")
+        self.assertEqual(fragment_cache_stats().misses, 2)
+
+        self.checking.name = "Renamed Checking"
+        self.checking.save()
+        response = self.client.get(url)
+
+        self.assertContains(response, "Renamed Checking")
+        self.assertEqual(fragment_cache_stats().misses, 3)
@@ -0,0 +1,261 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    ArchivedTransaction,
+    Transaction,
+    TransactionType,
+    assign_transaction_fingerprints,
+    transaction_archive_horizon,
+)
+from financial.services.archive import archive_transactions
+from financial.services.search import search_transactions
+from financial.services.transaction_export import iter_transaction_csv
+from financial.services.transaction_filters import TransactionFilters, transaction_facets
+from financial.services.transactions import paginate_transactions
+from financial.services.transfers import record_transfer
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class TransactionArchiveTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("archive", "archive@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Archive Household", slug="archive-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("Archive Checking", AccountType.CHECKING)
+        self.savings = self._account("Archive Savings", AccountType.SAVINGS)
+        self.horizon = transaction_archive_horizon()
+        self.old_day = self.horizon - timedelta(days=30)
+        self.recent_day = timezone.localdate() - timedelta(days=3)
+
+    def _account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _rows(self, posted_on, count, *, amount="10.00"):
+        rows = [
+            Transaction(
+                account=self.checking,
+                household=self.household,
+                posted_on=posted_on,
+                description=f"Archive row {idx}",
+                transaction_type=TransactionType.DEPOSIT,
+                amount=Decimal(amount),
+            )
+            for idx in range(count)
+        ]
+        assign_transaction_fingerprints(rows)
+        return Transaction.objects.bulk_record(rows)
+
+    def test_archiving_moves_old_rows_in_batches_and_keeps_derived_data(self):
+        self._rows(self.old_day, 5)
+        self._rows(self.recent_day, 2)
+        legs = record_transfer(
+            from_account=self.checking,
+            to_account=self.savings,
+            amount=Decimal("4.00"),
+            posted_on=self.old_day,
+        )
+
+        result = archive_transactions(batch_size=3)
+
+        self.assertEqual(result.transactions, 7)
+        self.assertGreater(result.batches, 1)
+        self.assertEqual(Transaction.objects.count(), 2)
+        self.assertEqual(ArchivedTransaction.objects.count(), 7)
+        archived_leg = ArchivedTransaction.objects.get(pk=legs.outgoing.pk)
+        self.assertEqual(archived_leg.transfer_counterpart_id, legs.incoming.pk)
+
+        self.checking.refresh_from_db()
+        self.assertEqual(self.checking.ledger_balance, Decimal("66.00"))
+        output = StringIO()
+        call_command("recompute_ledger_balances", stdout=output)
+        self.assertIn("0 drifted", output.getvalue())
+
+    def test_ranges_newer_than_the_horizon_never_read_the_archive(self):
+        self._rows(self.old_day, 3)
+        self._rows(self.recent_day, 2)
+        archive_transactions()
+        archived = ArchivedTransaction.objects.for_account(self.checking)
+
+        self.assertIsNone(TransactionFilters(start=self.horizon).apply_to_archive(archived))
+        old = TransactionFilters(start=self.old_day, end=self.old_day).apply_to_archive(archived)
+        self.assertEqual(old.count(), 3)
+        self.assertEqual(set(old.values_list("amount", flat=True)), {Decimal("10.00")})
+
+    def test_full_hot_pages_newer_than_the_horizon_skip_the_archive(self):
+        self._rows(self.old_day, 2)
+        self._rows(self.recent_day, 6)
+        archive_transactions()
+
+        with CaptureQueriesContext(connection) as context:
+            page = paginate_transactions(
+                Transaction.objects.for_account(self.checking),
+                archived=ArchivedTransaction.objects.for_account(self.checking),
+                page_size=5,
+            )
+
+        self.assertEqual(len(page.rows), 5)
+        self.assertEqual(len(context), 1)
+        self.assertNotIn(ArchivedTransaction._meta.db_table, context.captured_queries[0]["sql"])
+
+    def test_pages_continue_into_the_archive(self):
+        self._rows(self.old_day, 4)
+        self._rows(self.recent_day, 3)
+        archive_transactions()
+        # An old row the archiver has not reached yet sorts among the archived ones.
+        self._rows(self.old_day - timedelta(days=1), 1, amount="5.00")
+        queryset = Transaction.objects.for_account(self.checking)
+        archived = ArchivedTransaction.objects.for_account(self.checking)
+
+        first = paginate_transactions(queryset, archived=archived, page_size=5, closing_balance=Decimal("75.00"))
+        second = paginate_transactions(queryset, archived=archived, cursor=first.next_cursor, page_size=5)
+
+        self.assertEqual(len(first.rows), 5)
+        self.assertEqual(
+            [row.balance_display for row in first.rows],
+            ["$75.00", "$65.00", "$55.00", "$45.00", "$35.00"],
+        )
+        self.assertEqual([row.balance_display for row in second.rows], ["$25.00", "$15.00", "$5.00"])
+        self.assertEqual(second.rows[-1].amount_display, "+$5.00")
+        self.assertIsNone(second.next_cursor)
+
+    def test_facets_and_exports_include_archived_rows(self):
+        self._rows(self.old_day, 2)
+        self._rows(self.recent_day, 1, amount="7.00")
+        archive_transactions()
+        queryset = Transaction.objects.for_account(self.checking)
+        archived = ArchivedTransaction.objects.for_account(self.checking)
+
+        self.assertEqual(transaction_facets(queryset, TransactionFilters(), archived=archived).total, 3)
+        recent = TransactionFilters(start=self.horizon)
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(transaction_facets(queryset, recent, archived=archived).total, 1)
+        self.assertEqual(len(context), 1)
+
+        lines = list(iter_transaction_csv(queryset, archived=archived, chunk_size=1))
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith(self.old_day.isoformat()))
+        self.assertTrue(lines[-1].startswith(self.recent_day.isoformat()))
+
+    def test_admin_cannot_edit_archived_rows(self):
+        model_admin = admin.site._registry[ArchivedTransaction]
+        request = RequestFactory().get("/")
+        request.user = User.objects.create_superuser("archive-admin", "archive-admin@example.com", "pass-1234")
+
+        self.assertFalse(model_admin.has_add_permission(request))
+        self.assertFalse(model_admin.has_change_permission(request))
+        self.assertFalse(model_admin.has_delete_permission(request))
+
+    def test_reimporting_archived_rows_is_skipped(self):
+        self._rows(self.old_day, 2)
+        archive_transactions()
+
+        again = [
+            Transaction(
+                account=self.checking,
+                household=self.household,
+                posted_on=self.old_day,
+                description=f"Archive row {idx}",
+                transaction_type=TransactionType.DEPOSIT,
+                amount=Decimal("10.00"),
+            )
+            for idx in range(3)
+        ]
+        assign_transaction_fingerprints(again)
+        created = Transaction.objects.bulk_record(again, skip_duplicates=True)
+
+        self.assertEqual([row.description for row in created], ["Archive row 2"])
+        self.assertEqual(Transaction.objects.count() + ArchivedTransaction.objects.count(), 3)
+
+    def test_household_ledger_lists_archived_rows(self):
+        self._rows(self.old_day, 1, amount="12.34")
+        archive_transactions()
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("financial:transactions-body"), HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-transaction-id", count=1)
+        self.assertContains(response, "$12.34")
+
+    def test_search_includes_archived_rows(self):
+        self._rows(self.old_day, 3)
+        self._rows(self.recent_day, 2)
+        archive_transactions()
+        queryset = Transaction.objects.for_account(self.checking)
+        archived = ArchivedTransaction.objects.for_account(self.checking)
+
+        seen = []
+        cursor = None
+        while True:
+            page = search_transactions(queryset, "archive", archived=archived, cursor=cursor, page_size=2)
+            seen.extend(row.id for row in page.rows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(
+            set(seen),
+            {str(pk) for pk in Transaction.objects.values_list("id", flat=True)}
+            | {str(pk) for pk in ArchivedTransaction.objects.values_list("id", flat=True)},
+        )
+
+    def test_household_search_lists_archived_rows(self):
+        self._rows(self.old_day, 1, amount="12.34")
+        archive_transactions()
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("financial:transactions-search"), {"q": "archive"}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-transaction-id", count=1)
+        self.assertContains(response, "$12.34")
+
+    def test_archived_rows_have_no_edit_link(self):
+        self._rows(self.old_day, 1)
+        self._rows(self.recent_day, 1)
+        archive_transactions()
+        queryset = Transaction.objects.for_account(self.checking)
+        archived = ArchivedTransaction.objects.for_account(self.checking)
+        hot_id = str(Transaction.objects.get().id)
+
+        page = paginate_transactions(queryset, archived=archived)
+
+        self.assertEqual([bool(row.edit_url) for row in page.rows], [True, False])
+        self.assertEqual(page.rows[0].id, hot_id)
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("financial:account-transactions-body", args=[self.checking.pk]), HTTP_HX_REQUEST="true"
+        )
+        self.assertContains(response, "data-transaction-id", count=2)
+        self.assertContains(response, "Edit", count=1)
+        self.assertContains(response, "Archived")
+
+    def test_archiving_is_limited_to_the_horizon(self):
+        with self.assertRaises(ValueError):
+            archive_transactions(before=self.horizon + timedelta(days=1))
@@ -0,0 +1,117 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    CategoryMonthlyRollup,
+    Transaction,
+    TransactionType,
+    transaction_fingerprint,
+)
+from financial.services.transaction_import import import_transactions_from_csv
+from financial.services.transactions import create_bulk_transactions
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+JANUARY = "Date,Description,Amount\n2026-01-05,Coffee,-4.50\n2026-01-05,Coffee,-4.50\n2026-01-09,Payroll,1000.00\n"
+JANUARY_AND_FEBRUARY = (
+    "Date,Description,Amount\n"
+    "01/05/2026,COFFEE ,-4.50\n"
+    "01/05/2026,Coffee,-4.50\n"
+    "01/09/2026,Payroll,1000.00\n"
+    "02/02/2026,Rent,-800.00\n"
+)
+
+
+def _upload(content: str) -> SimpleUploadedFile:
+    return SimpleUploadedFile("statement.csv", content.encode("utf-8"), content_type="text/csv")
+
+
+class TransactionFingerprintTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("dedupe", "dedupe@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Dedupe Household", slug="dedupe-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name="Dedupe Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def test_fingerprint_normalizes_description_and_numbers_repeats(self):
+        first = transaction_fingerprint(self.account.id, date(2026, 1, 5), Decimal("-4.5"), "  Coffee  Shop", 1)
+        self.assertEqual(first, transaction_fingerprint(self.account.id, date(2026, 1, 5), Decimal("-4.50"), "coffee shop", 1))
+        self.assertNotEqual(first, transaction_fingerprint(self.account.id, date(2026, 1, 5), Decimal("-4.50"), "coffee shop", 2))
+
+    def test_reimporting_overlapping_statement_skips_existing_rows(self):
+        first = import_transactions_from_csv(uploaded_file=_upload(JANUARY), account=self.account)
+        self.assertEqual((first.imported_rows, first.duplicate_rows), (3, 0))
+
+        second = import_transactions_from_csv(uploaded_file=_upload(JANUARY_AND_FEBRUARY), account=self.account)
+
+        self.assertEqual((second.imported_rows, second.duplicate_rows), (1, 3))
+        self.assertEqual(Transaction.objects.for_account(self.account).filter(description__iexact="coffee").count(), 2)
+        self.assertEqual(Transaction.objects.for_account(self.account).count(), 4)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.ledger_balance, Decimal("191.00"))
+        coffee = CategoryMonthlyRollup.objects.get(month=date(2026, 1, 1), transaction_type=TransactionType.EXPENSE)
+        self.assertEqual((coffee.total, coffee.transaction_count), (Decimal("-9.00"), 2))
+
+    def test_duplicates_are_skipped_by_the_insert_without_lookups(self):
+        import_transactions_from_csv(uploaded_file=_upload(JANUARY), account=self.account)
+
+        with CaptureQueriesContext(connection) as context:
+            result = import_transactions_from_csv(uploaded_file=_upload(JANUARY), account=self.account)
+
+        self.assertEqual(result.imported_rows, 0)
+        transaction_queries = [query["sql"] for query in context.captured_queries if '"financial_transaction"' in query["sql"]]
+        self.assertEqual(len(transaction_queries), 2)
+        self.assertTrue(transaction_queries[0].startswith('INSERT'))
+
+    def test_bulk_grid_entries_are_not_fingerprinted(self):
+        rows = [
+            {"posted_on": date(2026, 3, 1), "description": "Lunch", "transaction_type": TransactionType.EXPENSE, "amount": Decimal("12.00")},
+            {"posted_on": date(2026, 3, 1), "description": "Lunch", "transaction_type": TransactionType.EXPENSE, "amount": Decimal("12.00")},
+        ]
+
+        self.assertEqual(len(create_bulk_transactions(self.account, rows)), 2)
+        self.assertEqual(len(create_bulk_transactions(self.account, rows[:1])), 1)
+
+        self.assertEqual(Transaction.objects.for_account(self.account).filter(fingerprint__isnull=True).count(), 3)
+        self.assertEqual(self.account.ledger_balance, Decimal("-36.00"))
+
+    def test_manual_transactions_are_not_fingerprinted(self):
+        manual = Transaction.objects.create(
+            account=self.account,
+            posted_on=date(2026, 1, 5),
+            description="Coffee",
+            transaction_type=TransactionType.EXPENSE,
+            amount=Decimal("4.50"),
+        )
+        self.assertIsNone(manual.fingerprint)
+
+    def test_import_summary_reports_skipped_rows(self):
+        self.client.force_login(self.user)
+        url = reverse("financial:account-transactions-import", args=[self.account.id])
+        self.client.post(url, {"import_file": _upload(JANUARY)}, HTTP_HX_REQUEST="true")
+
+        response = self.client.post(url, {"import_file": _upload(JANUARY_AND_FEBRUARY)}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "Imported 1 of 4 rows. Skipped 3 already imported.")
@@ -0,0 +1,166 @@
+import csv
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionQuerySet, TransactionType
+from financial.services.transaction_import import TransactionImportValidationError, import_transactions_from_csv
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+def _upload(content: str, name: str = "statement.csv") -> SimpleUploadedFile:
+    return SimpleUploadedFile(name, content.encode("utf-8"), content_type="text/csv")
+
+
+class TransactionImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("importer", "importer@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Import Household", slug="import-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._create_account("Import Checking", AccountType.CHECKING)
+        self.card = self._create_account("Import Card", AccountType.CREDIT_CARD)
+
+    def _create_account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _imported(self, account):
+        return list(
+            Transaction.objects.for_account(account)
+            .order_by("posted_on", "description")
+            .values_list("posted_on", "description", "transaction_type", "amount")
+        )
+
+    def test_maps_columns_and_applies_sign_rules(self):
+        csv_text = (
+            "﻿Posting Date,Description,Amount,Balance\n"
+            "01/05/2026,Coffee,-4.50,95.50\n"
+            "2026-01-06,Payroll,\"1,200.00\",1295.50\n"
+            "01/07/26,Refund,($3.25),1292.25\n"
+        )
+
+        result = import_transactions_from_csv(uploaded_file=_upload(csv_text), account=self.checking)
+
+        self.assertEqual((result.total_rows, result.imported_rows), (3, 3))
+        self.assertEqual(
+            self._imported(self.checking),
+            [
+                (date(2026, 1, 5), "Coffee", TransactionType.EXPENSE, Decimal("-4.50")),
+                (date(2026, 1, 6), "Payroll", TransactionType.DEPOSIT, Decimal("1200.00")),
+                (date(2026, 1, 7), "Refund", TransactionType.EXPENSE, Decimal("-3.25")),
+            ],
+        )
+        self.checking.refresh_from_db()
+        self.assertEqual(self.checking.ledger_balance, Decimal("1192.25"))
+
+    def test_debit_credit_columns_on_liability_account(self):
+        csv_text = "Date,Memo,Debit,Credit\n2026-02-01,Groceries,25.00,\n2026-02-03,Autopay,,100.00\n"
+
+        import_transactions_from_csv(uploaded_file=_upload(csv_text), account=self.card)
+
+        self.assertEqual(
+            self._imported(self.card),
+            [
+                (date(2026, 2, 1), "Groceries", TransactionType.CHARGE, Decimal("25.00")),
+                (date(2026, 2, 3), "Autopay", TransactionType.PAYMENT, Decimal("-100.00")),
+            ],
+        )
+
+    def test_row_errors_roll_back_the_whole_import(self):
+        csv_text = "Date,Description,Amount\n2026-01-01,Good,-1.00\nnot-a-date,Bad date,-1.00\n2026-01-02,,-1.00\n2026-01-03,Zero,0\n"
+
+        with self.assertRaises(TransactionImportValidationError) as ctx:
+            import_transactions_from_csv(uploaded_file=_upload(csv_text), account=self.checking)
+
+        self.assertEqual(
+            ctx.exception.errors,
+            [
+                'Row 3: unrecognized date "not-a-date".',
+                "Row 4: description is required.",
+                "Row 5: amount must not be zero.",
+            ],
+        )
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_missing_columns_are_reported(self):
+        with self.assertRaises(TransactionImportValidationError) as ctx:
+            import_transactions_from_csv(uploaded_file=_upload("When,What\n"), account=self.checking)
+        self.assertEqual(len(ctx.exception.errors), 3)
+
+    def test_files_that_are_not_utf8_are_reported(self):
+        upload = SimpleUploadedFile(
+            "statement.csv",
+            "Date,Description,Amount\n2026-01-01,Caf\u00e9 du Monde,-4.50\n".encode("cp1252"),
+            content_type="text/csv",
+        )
+
+        with self.assertRaises(TransactionImportValidationError) as ctx:
+            import_transactions_from_csv(uploaded_file=upload, account=self.checking)
+
+        self.assertIn("UTF-8", ctx.exception.errors[0])
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_malformed_csv_is_reported(self):
+        oversized = "x" * (csv.field_size_limit() + 1)
+        csv_text = f'Date,Description,Amount\n2026-01-01,Coffee,-4.50\n2026-01-02,"{oversized}",-1.00\n'
+        self.client.force_login(self.user)
+        url = reverse("financial:account-transactions-import", args=[self.checking.id])
+
+        response = self.client.post(url, {"import_file": _upload(csv_text)}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "Row 3: the file is not valid CSV", status_code=422)
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_large_statement_inserts_in_chunks(self):
+        row_count = 125
+        lines = ["Date,Description,Amount"]
+        lines.extend(f"2026-03-{(idx % 28) + 1:02d},Row {idx},-{idx % 50 + 1}.00" for idx in range(row_count))
+
+        bulk_record = TransactionQuerySet.bulk_record
+        with (
+            mock.patch("financial.services.transaction_import.IMPORT_BATCH_SIZE", 50),
+            mock.patch.object(TransactionQuerySet, "bulk_record", autospec=True, side_effect=bulk_record) as recorder,
+            CaptureQueriesContext(connection) as context,
+        ):
+            result = import_transactions_from_csv(uploaded_file=_upload("\n".join(lines)), account=self.checking)
+
+        self.assertEqual(result.imported_rows, row_count)
+        self.assertEqual([len(call.args[1]) for call in recorder.call_args_list], [50, 50, 25])
+        self.assertEqual(Transaction.objects.for_account(self.checking).count(), row_count)
+        self.assertLess(len(context.captured_queries), row_count // 2)
+        self.checking.refresh_from_db()
+        expected = -sum(Decimal(idx % 50 + 1) for idx in range(row_count))
+        self.assertEqual(self.checking.ledger_balance, expected)
+
+    def test_import_endpoint_reports_summary_and_errors(self):
+        self.client.force_login(self.user)
+        url = reverse("financial:account-transactions-import", args=[self.checking.id])
+
+        form = self.client.get(url, HTTP_HX_REQUEST="true")
+        self.assertContains(form, "Statement CSV")
+
+        ok = self.client.post(url, {"import_file": _upload("Date,Description,Amount\n2026-01-01,Coffee,-4.50\n")}, HTTP_HX_REQUEST="true")
+        self.assertContains(ok, "Imported 1 of 1 rows.")
+
+        bad = self.client.post(url, {"import_file": _upload("Date,Description\n")}, HTTP_HX_REQUEST="true")
+        self.assertEqual(bad.status_code, 422)
+        self.assertContains(bad, "Missing an", status_code=422)
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from financial.models import Account, AccountStatus, AccountType, Category, Transaction, TransactionType
+from financial.services.transactions import (
+    serialize_transaction_rows,
+    serialize_transaction_values,
+    transaction_row_values,
+)
+
+User = get_user_model()
+
+
+class TransactionRowSerializerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("rows", "rows@example.com", "pass-1234")
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Rows Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        groceries = Category.objects.create(user=self.user, name="Groceries")
+        for idx in range(6):
+            Transaction.objects.create(
+                account=self.account,
+                posted_on=date(2026, 1, idx + 1),
+                description=f"Row {idx}",
+                transaction_type=TransactionType.EXPENSE if idx % 2 else TransactionType.DEPOSIT,
+                amount=Decimal("10.00") + idx,
+                category=groceries if idx % 3 else None,
+            )
+
+    def test_values_rows_match_instance_rows(self):
+        queryset = Transaction.objects.for_account(self.account).ordered()
+
+        self.assertEqual(
+            serialize_transaction_values(transaction_row_values(queryset)),
+            serialize_transaction_rows(queryset),
+        )
+
+    def test_values_rows_use_a_single_query(self):
+        queryset = Transaction.objects.for_account(self.account).ordered()
+
+        with CaptureQueriesContext(connection) as context:
+            rows = serialize_transaction_values(transaction_row_values(queryset))
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len(context), 1)
+        self.assertIn("JOIN", context.captured_queries[0]["sql"])
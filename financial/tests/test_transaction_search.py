@@ -0,0 +1,171 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.search import (
+    SQLITE_FTS_KEYS_TABLE,
+    SQLITE_FTS_TABLE,
+    SQLITE_FTS_TRIGGERS,
+    ensure_sqlite_search_index,
+    rank_transactions,
+    search_transactions,
+)
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class TransactionSearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("searcher", "searcher@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Search Household", slug="search-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._create_account("Search Checking")
+        self.savings = self._create_account("Search Savings")
+        self.search_url = reverse("financial:account-transactions-search", args=[self.checking.id])
+        self.household_search_url = reverse("financial:transactions-search")
+
+    def _create_account(self, name: str) -> Account:
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _create_transaction(self, account: Account, description: str, *, notes: str = "", posted_on=None) -> Transaction:
+        return Transaction.objects.create(
+            account=account,
+            household=self.household,
+            posted_on=posted_on or date(2025, 3, 1),
+            description=description,
+            notes=notes,
+            transaction_type=TransactionType.EXPENSE,
+            amount=Decimal("10.00"),
+        )
+
+    def _matching_descriptions(self, queryset, query: str) -> list[str]:
+        return list(rank_transactions(queryset, query).values_list("description", flat=True))
+
+    def test_matches_description_and_notes_by_word_prefix(self):
+        self._create_transaction(self.checking, "Corner Grocery Market")
+        self._create_transaction(self.checking, "Gas Station", notes="grocery run on the way home")
+        self._create_transaction(self.checking, "Electric Utility")
+
+        matches = self._matching_descriptions(Transaction.objects.for_account(self.checking), "groc")
+
+        self.assertCountEqual(matches, ["Corner Grocery Market", "Gas Station"])
+
+    def test_index_stays_in_sync_with_updates_deletes_and_bulk_inserts(self):
+        renamed = self._create_transaction(self.checking, "Coffee Shop")
+        removed = self._create_transaction(self.checking, "Coffee Roasters")
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=self.checking,
+                    household=self.household,
+                    posted_on=date(2025, 3, 2),
+                    description="Bulk Coffee Beans",
+                    transaction_type=TransactionType.EXPENSE,
+                    amount=Decimal("-5.00"),
+                )
+            ]
+        )
+        renamed.description = "Tea House"
+        renamed.save()
+        removed.delete()
+        queryset = Transaction.objects.for_account(self.checking)
+
+        self.assertEqual(self._matching_descriptions(queryset, "coffee"), ["Bulk Coffee Beans"])
+        self.assertEqual(self._matching_descriptions(queryset, "tea"), ["Tea House"])
+
+    def test_index_loads_rows_that_existed_before_it(self):
+        with connection.cursor() as cursor:
+            for trigger in SQLITE_FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER {trigger}")
+            cursor.execute(f"DROP TABLE {SQLITE_FTS_TABLE}")
+            cursor.execute(f"DROP TABLE {SQLITE_FTS_KEYS_TABLE}")
+        self._create_transaction(self.checking, "Bakery Bread")
+
+        ensure_sqlite_search_index()
+
+        queryset = Transaction.objects.for_account(self.checking)
+        self.assertEqual(self._matching_descriptions(queryset, "bakery"), ["Bakery Bread"])
+
+    def test_matches_survive_renumbered_rowids(self):
+        self._create_transaction(self.checking, "Bakery Bread")
+        self._create_transaction(self.checking, "Butcher Shop")
+        with connection.cursor() as cursor:
+            # Stand-in for VACUUM or a table rebuild giving rows new implicit rowids.
+            cursor.execute(f"UPDATE {Transaction._meta.db_table} SET rowid = 1000 - rowid")
+
+        queryset = Transaction.objects.for_account(self.checking)
+        self.assertEqual(self._matching_descriptions(queryset, "bakery"), ["Bakery Bread"])
+        self.assertEqual(self._matching_descriptions(queryset, "butcher"), ["Butcher Shop"])
+
+    def test_results_are_ranked_and_keyset_paginated(self):
+        for idx in range(7):
+            self._create_transaction(
+                self.checking,
+                f"Rent payment {idx}",
+                posted_on=date(2025, 1, 1) + timedelta(days=idx),
+            )
+        self._create_transaction(self.checking, "Rent rent rent deposit", posted_on=date(2024, 1, 1))
+        queryset = Transaction.objects.for_account(self.checking)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = search_transactions(queryset, "rent", cursor=cursor, page_size=3)
+            seen.extend(row.description for row in page.rows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(len(seen), 8)
+        self.assertEqual(len(set(seen)), 8)
+        self.assertEqual(seen[0], "Rent rent rent deposit")
+
+    def test_query_syntax_is_treated_as_plain_text(self):
+        self._create_transaction(self.checking, "AND OR NOT (quoted)")
+
+        matches = self._matching_descriptions(Transaction.objects.for_account(self.checking), 'quoted" OR *')
+
+        self.assertEqual(matches, ["AND OR NOT (quoted)"])
+
+    def test_account_endpoint_is_scoped_and_empty_query_returns_panel(self):
+        self._create_transaction(self.checking, "Hardware Store")
+        self._create_transaction(self.savings, "Hardware Outlet")
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.search_url, {"q": "hardware"}, HTTP_HX_REQUEST="true")
+        self.assertContains(response, "Hardware Store")
+        self.assertNotContains(response, "Hardware Outlet")
+
+        empty = self.client.get(self.search_url, {"q": "  "}, HTTP_HX_REQUEST="true")
+        self.assertContains(empty, "data-transaction-id", count=1)
+
+        missing = self.client.get(self.search_url, {"q": "zebra"}, HTTP_HX_REQUEST="true")
+        self.assertContains(missing, "No matching transactions")
+
+    def test_household_endpoint_lists_account_names(self):
+        self._create_transaction(self.checking, "Hardware Store")
+        self._create_transaction(self.savings, "Hardware Outlet")
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.household_search_url, {"q": "hardware"}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "data-transaction-id", count=2)
+        self.assertContains(response, "Search Checking")
+        self.assertContains(response, "Search Savings")
@@ -0,0 +1,156 @@
+from datetime import date
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from financial.models import Account, AccountStatus, AccountType, Transaction, TransactionType
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class TransactionSignConstraintTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("signs", "signs@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Sign Household", slug="sign-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account("Sign Checking", AccountType.CHECKING)
+        self.card = self._account("Sign Card", AccountType.CREDIT_CARD)
+
+    def _account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _row(self, account, transaction_type, amount):
+        return Transaction(
+            account=account,
+            household=self.household,
+            posted_on=date(2026, 4, 1),
+            description="Constraint row",
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+        )
+
+    def test_database_rejects_bulk_rows_that_break_sign_rules(self):
+        for account, transaction_type, amount in (
+            (self.checking, TransactionType.EXPENSE, "12.00"),
+            (self.card, TransactionType.CHARGE, "-12.00"),
+            (self.card, TransactionType.DEPOSIT, "12.00"),
+            (self.checking, TransactionType.DEPOSIT, "0.00"),
+        ):
+            with self.subTest(account=account.account_type, transaction_type=transaction_type, amount=amount):
+                with self.assertRaises(IntegrityError), transaction.atomic():
+                    Transaction.objects.bulk_create([self._row(account, transaction_type, amount)])
+
+    def test_bulk_create_fills_account_type(self):
+        Transaction.objects.bulk_create(
+            [self._row(self.checking, TransactionType.EXPENSE, "-3.00"), self._row(self.card, TransactionType.CHARGE, "3.00")]
+        )
+
+        self.assertEqual(
+            sorted(Transaction.objects.values_list("account_type", flat=True)),
+            [AccountType.CHECKING, AccountType.CREDIT_CARD],
+        )
+
+    def test_single_save_skips_validation_queries(self):
+        row = self._row(self.checking, TransactionType.EXPENSE, "8.00")
+
+        with CaptureQueriesContext(connection) as context:
+            row.save()
+
+        self.assertEqual((row.account_type, row.amount), (AccountType.CHECKING, Decimal("-8.00")))
+        # No unique, constraint or foreign-key validation reads before the insert.
+        lookups = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT")
+            and any(table in query["sql"] for table in ('FROM "financial_transaction"', 'FROM "households_household"'))
+        ]
+        self.assertEqual(lookups, [])
+
+    def test_save_still_rejects_disallowed_types_before_hitting_the_database(self):
+        with self.assertRaises(ValidationError):
+            self._row(self.card, TransactionType.DEPOSIT, "5.00").save()
+        with self.assertRaises(ValidationError):
+            self._row(self.checking, TransactionType.DEPOSIT, "-5.00").save()
+
+    def test_account_type_changes_follow_to_transactions(self):
+        Transaction.objects.create(
+            account=self.checking,
+            posted_on=date(2026, 4, 2),
+            description="Paycheck",
+            transaction_type=TransactionType.DEPOSIT,
+            amount=Decimal("100.00"),
+        )
+
+        self.checking.account_type = AccountType.SAVINGS
+        self.checking.full_clean()
+        self.checking.save()
+        self.assertEqual(Transaction.objects.get().account_type, AccountType.SAVINGS)
+
+        self.checking.account_type = AccountType.CREDIT_CARD
+        with self.assertRaises(ValidationError):
+            self.checking.full_clean()
+
+
+class SignRulesMigrationTests(TransactionTestCase):
+    migrate_from = [("financial", "0021_transaction_transfer_counterpart"), ("households", "0001_initial")]
+    migrate_to = [("financial", "0022_transaction_account_type_sign_rules"), ("households", "0001_initial")]
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.latest = self.executor.loader.graph.leaf_nodes()
+        self.executor.migrate(self.migrate_from)
+        self.executor.loader.build_graph()
+        apps = self.executor.loader.project_state(self.migrate_from).apps
+
+        user = apps.get_model(*settings.AUTH_USER_MODEL.split(".")).objects.create(username="legacy")
+        household = apps.get_model("households", "Household").objects.create(
+            name="Legacy Household",
+            slug="legacy-household",
+            created_by=user,
+        )
+        # The account was a checking account when this charge was recorded.
+        card = apps.get_model("financial", "Account").objects.create(
+            user=user,
+            household=household,
+            name="Legacy Card",
+            account_type=AccountType.CREDIT_CARD,
+            status=AccountStatus.ACTIVE,
+        )
+        self.legacy = apps.get_model("financial", "Transaction").objects.create(
+            account=card,
+            household=household,
+            posted_on=date(2025, 11, 3),
+            description="Legacy deposit",
+            transaction_type=TransactionType.DEPOSIT,
+            amount=Decimal("40.00"),
+        )
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        apps = executor.loader.project_state(self.migrate_from).apps
+        apps.get_model("financial", "Transaction").objects.all().delete()
+        executor.migrate(self.latest)
+
+    def test_migration_lists_rows_that_break_the_sign_rules(self):
+        self.executor.loader.build_graph()
+
+        with self.assertRaisesMessage(RuntimeError, str(self.legacy.pk)):
+            self.executor.migrate(self.migrate_to)
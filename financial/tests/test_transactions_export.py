@@ -0,0 +1,103 @@
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.urls import reverse
+
+from financial.models import Account, AccountStatus, AccountType, Category, Transaction, TransactionType
+from financial.services.transaction_export import EXPORT_HEADER, format_export_amount, iter_transaction_csv
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class TransactionsExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("exporter", "exporter@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Export Household", slug="export-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._create_account("Export Checking", AccountType.CHECKING)
+        self.card = self._create_account("Export Card", AccountType.CREDIT_CARD)
+        self.groceries = Category.objects.create(user=self.user, name="Groceries")
+
+        self._create(self.checking, "Paycheck", "2500.00", TransactionType.DEPOSIT, date(2025, 1, 1))
+        self._create(self.checking, "=HYPERLINK(\"x\")", "12.34", TransactionType.EXPENSE, date(2025, 1, 3), self.groceries)
+        self._create(self.card, "Card purchase", "40.00", TransactionType.CHARGE, date(2025, 1, 2))
+
+    def _create_account(self, name, account_type):
+        return Account.objects.create(
+            user=self.user,
+            household=self.household,
+            name=name,
+            account_type=account_type,
+            status=AccountStatus.ACTIVE,
+        )
+
+    def _create(self, account, description, amount, transaction_type, posted_on, category=None):
+        return Transaction.objects.create(
+            account=account,
+            household=self.household,
+            posted_on=posted_on,
+            description=description,
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+            category=category,
+        )
+
+    def _read_csv(self, response) -> list[list[str]]:
+        self.assertIsInstance(response, StreamingHttpResponse)
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_amounts_follow_signed_amount_convention(self):
+        self.assertEqual(format_export_amount(Decimal("-12.345")), "-12.35")
+        self.assertEqual(format_export_amount(Decimal("0")), "+0.00")
+        self.assertEqual(format_export_amount(Decimal("2500")), "+2500.00")
+
+    def test_account_export_streams_rows_oldest_first(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("financial:account-transactions-export", args=[self.checking.id]))
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="export-checking-transactions.csv"', response["Content-Disposition"])
+        rows = self._read_csv(response)
+        self.assertEqual(tuple(rows[0]), EXPORT_HEADER)
+        self.assertEqual(
+            rows[1:],
+            [
+                ["2025-01-01", "Export Checking", "Paycheck", "", "Deposit", "+2500.00", ""],
+                ["2025-01-03", "Export Checking", "'=HYPERLINK(\"x\")", "Groceries", "Expense", "-12.34", ""],
+            ],
+        )
+
+    def test_household_export_includes_every_account(self):
+        self.client.force_login(self.user)
+
+        rows = self._read_csv(self.client.get(reverse("financial:transactions-export")))
+
+        self.assertEqual([row[1] for row in rows[1:]], ["Export Checking", "Export Card", "Export Checking"])
+
+    def test_export_reads_in_chunks(self):
+        lines = iter_transaction_csv(Transaction.objects.for_household(self.household), chunk_size=1)
+        self.assertEqual(next(lines).strip(), ",".join(EXPORT_HEADER))
+        self.assertEqual(len(list(lines)), 3)
+
+    def test_account_export_is_scoped_to_current_household(self):
+        outsider = User.objects.create_user("outsider", "outsider@example.com", "pass-1234")
+        other = Household.objects.create(name="Other", slug="other-export", created_by=outsider)
+        HouseholdMember.objects.create(household=other, user=outsider, role=HouseholdMember.Role.OWNER, is_primary=True)
+        self.client.force_login(outsider)
+
+        response = self.client.get(reverse("financial:account-transactions-export", args=[self.checking.id]))
+
+        self.assertEqual(response.status_code, 404)
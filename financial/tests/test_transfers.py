@@ -0,0 +1,140 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from financial.models import Account, AccountBalanceSnapshot, AccountStatus, AccountType, Transaction, TransactionType
+from financial.services.transfers import TransferError, record_transfer
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class TransferTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("transfers", "transfers@example.com", "pass-1234")
+        self.household = Household.objects.create(name="Transfer Household", slug="transfer-household", created_by=self.user)
+        HouseholdMember.objects.create(
+            household=self.household,
+            user=self.user,
+            role=HouseholdMember.Role.OWNER,
+            is_primary=True,
+        )
+        self.checking = self._account(self.household, "Transfer Checking", AccountType.CHECKING)
+        self.savings = self._account(self.household, "Transfer Savings", AccountType.SAVINGS)
+        self.card = self._account(self.household, "Transfer Card", AccountType.CREDIT_CARD)
+
+    def _account(self, household, name, account_type, status=AccountStatus.ACTIVE):
+        return Account.objects.create(
+            user=self.user,
+            household=household,
+            name=name,
+            account_type=account_type,
+            status=status,
+        )
+
+    def test_card_payment_writes_linked_legs_in_one_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            legs = record_transfer(
+                from_account=self.checking,
+                to_account=self.card,
+                amount=Decimal("250.00"),
+                posted_on=date(2026, 3, 5),
+            )
+
+        inserts = [query for query in context.captured_queries if 'INTO "financial_transaction" ' in query["sql"]]
+        self.assertEqual(len(inserts), 1)
+        outgoing = Transaction.objects.get(pk=legs.outgoing.pk)
+        incoming = Transaction.objects.get(pk=legs.incoming.pk)
+        self.assertEqual(
+            (outgoing.transaction_type, outgoing.amount, outgoing.description),
+            (TransactionType.TRANSFER, Decimal("-250.00"), "Transfer to Transfer Card"),
+        )
+        self.assertEqual((incoming.transaction_type, incoming.amount), (TransactionType.PAYMENT, Decimal("-250.00")))
+        self.assertEqual(outgoing.transfer_counterpart_id, incoming.pk)
+        self.assertEqual(incoming.transfer_counterpart_id, outgoing.pk)
+        self.assertEqual(self.checking.ledger_balance, Decimal("-250.00"))
+        self.assertEqual(self.card.ledger_balance, Decimal("-250.00"))
+        self.assertEqual(
+            AccountBalanceSnapshot.objects.get(account=self.card, month=date(2026, 3, 1)).closing_balance,
+            Decimal("-250.00"),
+        )
+
+    def test_transfer_out_of_a_liability_increases_its_balance(self):
+        record_transfer(from_account=self.card, to_account=self.savings, amount=Decimal("80.00"), posted_on=date(2026, 3, 5))
+
+        self.assertEqual(self.card.ledger_balance, Decimal("80.00"))
+        self.assertEqual(self.savings.ledger_balance, Decimal("80.00"))
+        self.assertEqual(
+            Transaction.objects.for_account(self.savings).get().transaction_type,
+            TransactionType.DEPOSIT,
+        )
+
+    def test_invalid_transfers_are_rejected(self):
+        other_household = Household.objects.create(name="Elsewhere", slug="elsewhere", created_by=self.user)
+        outsider = self._account(other_household, "Outside Checking", AccountType.CHECKING)
+        closed = self._account(self.household, "Closed Savings", AccountType.SAVINGS, status=AccountStatus.CLOSED)
+
+        for to_account, amount in ((self.checking, "10.00"), (outsider, "10.00"), (closed, "10.00"), (self.savings, "0")):
+            with self.assertRaises(TransferError):
+                record_transfer(from_account=self.checking, to_account=to_account, amount=Decimal(amount), posted_on=date(2026, 3, 5))
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_deleting_one_leg_removes_the_pair(self):
+        legs = record_transfer(from_account=self.checking, to_account=self.savings, amount=Decimal("40.00"), posted_on=date(2026, 3, 5))
+
+        Transaction.objects.get(pk=legs.incoming.pk).delete()
+
+        self.assertFalse(Transaction.objects.exists())
+        self.checking.refresh_from_db()
+        self.savings.refresh_from_db()
+        self.assertEqual((self.checking.ledger_balance, self.savings.ledger_balance), (Decimal("0.00"), Decimal("0.00")))
+
+    def test_legs_cannot_drift_apart(self):
+        legs = record_transfer(from_account=self.checking, to_account=self.savings, amount=Decimal("40.00"), posted_on=date(2026, 3, 5))
+        outgoing = Transaction.objects.get(pk=legs.outgoing.pk)
+
+        # Edits arrive as the positive amount the user typed, like the edit form.
+        outgoing.amount = Decimal("40.00")
+        outgoing.description = "Rainy day fund"
+        outgoing.save()
+        outgoing = Transaction.objects.get(pk=legs.outgoing.pk)
+        outgoing.amount = Decimal("45.00")
+        with self.assertRaises(ValidationError):
+            outgoing.save()
+
+        self.savings.refresh_from_db()
+        self.assertEqual(self.savings.ledger_balance, Decimal("40.00"))
+
+    def test_household_ledger_pairs_transfer_legs(self):
+        record_transfer(from_account=self.checking, to_account=self.card, amount=Decimal("25.00"), posted_on=date(2026, 3, 5))
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("financial:transactions-body"), HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "Transfer · Transfer Card")
+        self.assertContains(response, "Transfer · Transfer Checking")
+
+    def test_transfer_endpoint_records_both_legs(self):
+        self.client.force_login(self.user)
+        url = reverse("financial:account-transactions-transfer", args=[self.checking.id])
+
+        form = self.client.get(url, HTTP_HX_REQUEST="true")
+        self.assertContains(form, "Transfer Savings")
+        self.assertNotContains(form, '<option value="{}"'.format(self.checking.id))
+
+        invalid = self.client.post(url, {"to_account": self.savings.id, "posted_on": "2026-03-05", "amount": "0"}, HTTP_HX_REQUEST="true")
+        self.assertEqual(invalid.status_code, 422)
+
+        response = self.client.post(
+            url,
+            {"to_account": self.savings.id, "posted_on": "2026-03-05", "amount": "60.00"},
+            HTTP_HX_REQUEST="true",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Transaction.objects.filter(transfer_counterpart__isnull=False).count(), 2)
@@ -0,0 +1,63 @@
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from financial.ids import uuid7, uuid7_timestamp_millis
+from financial.models import Account, AccountStatus, AccountType, Category, Transaction, TransactionType
+from households.models import Household, HouseholdMember
+
+User = get_user_model()
+
+
+class Uuid7Tests(SimpleTestCase):
+    def test_version_variant_and_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+        self.assertTrue(before <= uuid7_timestamp_millis(value) <= after + 1)
+
+    def test_keys_from_one_process_strictly_increase(self):
+        values = [uuid7() for _ in range(10_000)]
+
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+        self.assertEqual([value.hex for value in values], sorted(value.hex for value in values))
+
+
+class Uuid7DefaultTests(TestCase):
+    def test_new_rows_get_time_ordered_keys(self):
+        user = User.objects.create_user("keys", "keys@example.com", "pass-1234")
+        household = Household.objects.create(name="Key Household", slug="key-household", created_by=user)
+        HouseholdMember.objects.create(household=household, user=user, role=HouseholdMember.Role.OWNER, is_primary=True)
+        account = Account.objects.create(
+            user=user,
+            household=household,
+            name="Key Checking",
+            account_type=AccountType.CHECKING,
+            status=AccountStatus.ACTIVE,
+        )
+        category = Category.objects.create(user=user, name="Keys")
+        rows = Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=account,
+                    household=household,
+                    posted_on=date(2026, 5, 1),
+                    description=f"Key row {idx}",
+                    transaction_type=TransactionType.DEPOSIT,
+                    amount=Decimal("1.00"),
+                )
+                for idx in range(50)
+            ]
+        )
+
+        for instance in (account, category, *rows):
+            self.assertEqual(instance.pk.version, 7)
+        self.assertLess(account.pk, rows[0].pk)
+        self.assertEqual([row.pk for row in rows], sorted(row.pk for row in rows))
@@ -8,11 +8,17 @@ app_name = "financial"
 
 urlpatterns = [
     path("", views.AccountsIndexView.as_view(), name="accounts-index"),
+    path("table/", views.accounts_table, name="accounts-table"),
     path("bill-pay/", views.bill_pay_index, name="bill-pay-index"),
     path("bill-pay/print/", views.bill_pay_print, name="bill-pay-print"),
     path("bill-pay/table-body/", views.bill_pay_table_body, name="bill-pay-table-body"),
     path("bill-pay/<uuid:account_id>/row/", views.bill_pay_row, name="bill-pay-row"),
     path("bill-pay/sync-google/", views.bill_pay_sync_google, name="bill-pay-sync-google"),
+    path("spending/", views.spending_index, name="spending-index"),
+    path("transactions/", views.transactions_index, name="transactions-index"),
+    path("transactions/body/", views.transactions_body, name="transactions-body"),
+    path("transactions/search/", views.transactions_search, name="transactions-search"),
+    path("transactions/export.csv", views.transactions_export, name="transactions-export"),
     path("import/", views.account_import_page, name="accounts-import"),
     path("import/panel/", views.account_import_panel, name="accounts-import-panel"),
     path("import/template/", views.account_import_template, name="accounts-import-template"),
@@ -26,10 +32,35 @@ urlpatterns = [
         views.account_transactions_body,
         name="account-transactions-body",
     ),
+    path(
+        "<uuid:pk>/transactions/search/",
+        views.account_transactions_search,
+        name="account-transactions-search",
+    ),
+    path(
+        "<uuid:pk>/transactions/export.csv",
+        views.account_transactions_export,
+        name="account-transactions-export",
+    ),
     path(
         "<uuid:pk>/transactions/new/",
         views.account_transactions_new,
         name="account-transactions-new",
+    ),
+    path(
+        "<uuid:pk>/transactions/bulk/",
+        views.account_transactions_bulk,
+        name="account-transactions-bulk",
+    ),
+    path(
+        "<uuid:pk>/transactions/import/",
+        views.account_transactions_import,
+        name="account-transactions-import",
+    ),
+    path(
+        "<uuid:pk>/transactions/transfer/",
+        views.account_transactions_transfer,
+        name="account-transactions-transfer",
     ),
         path(
             "<uuid:pk>/transactions/<uuid:transaction_id>/edit/",
@@ -1,20 +1,35 @@
+from datetime import date
+from functools import wraps
 from pathlib import Path
 import json
+from urllib.parse import urlencode
 from decimal import Decimal, InvalidOperation
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import FileResponse, Http404, HttpResponse
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from django.utils.text import slugify
 from django.views.decorators.http import require_http_methods
 from django.views.generic import CreateView, DetailView, ListView
 
-from financial.forms import AccountForm, AccountImportForm, BillPayRowForm, CategoryForm, TransactionForm
-from financial.models import Account, Transaction, UserAccountQuerysetMixin
+from financial.forms import (
+    AccountForm,
+    AccountImportForm,
+    BillPayRowForm,
+    CategoryForm,
+    TransactionForm,
+    TransactionImportForm,
+    TransferForm,
+    bulk_transaction_formset,
+)
+from financial.models import Account, ArchivedTransaction, Transaction, UserAccountQuerysetMixin
 from django.conf import settings
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
@@ -29,9 +44,10 @@ from financial.integrations.google_calendar.client import GoogleCalendarClient,
 from households.services.households import resolve_current_household
 from financial.services.account_import import AccountImportValidationError, import_accounts_from_csv
 from financial.services.accounts import (
-    AccountSummaryRow,
+    account_order_key,
+    account_row_fragments,
     build_account_preview,
-    serialize_account_rows,
+    diff_account_rows,
 )
 from financial.services.bill_pay import (
     BILL_PAY_DEFAULT_FOCUS_FIELD,
@@ -41,6 +57,7 @@ from financial.services.bill_pay import (
     build_next_unpaid_row_instruction,
     build_bill_pay_row,
     build_bill_pay_rows,
+    bill_pay_row_fragments,
     get_or_initialize_monthly_payment,
     liability_accounts_for_household,
     month_to_query_value,
@@ -50,10 +67,19 @@ from financial.services.bill_pay import (
     serialize_next_row_instruction,
     upsert_monthly_payment,
 )
-from financial.services.transactions import serialize_transaction_rows
+from financial.services.rollups import category_spending
+from financial.services.search import normalize_search_query, search_transactions
+from financial.services.summary import household_summary
+from financial.services.transaction_export import iter_transaction_csv
+from financial.services.transaction_import import TransactionImportValidationError, import_transactions_from_csv
+from financial.services.transaction_filters import TransactionFilterError, TransactionFilters, transaction_facets
+from financial.services.transactions import TransactionCursorError, create_bulk_transactions, paginate_transactions
+from financial.services.transfers import TransferError, record_transfer
 from financial.services.formatters import format_usd
 
 
+# Cross-account listings join the account name and the other transfer leg's account.
+HOUSEHOLD_ROW_FIELDS = ("account__name", "transfer_counterpart__account__name")
 ACCOUNT_IMPORT_PANEL_ID = "account-import-panel"
 ACCOUNT_IMPORT_HX_TARGET = "#account-import-panel"
 ACCOUNT_IMPORT_HX_SWAP = "innerHTML"
@@ -71,6 +97,39 @@ def _get_current_household_or_redirect(request):
     return context.household, None
 
 
+def _household_data_etag(household) -> str:
+    # The date keeps fragments whose defaults follow the calendar (the bill-pay month) from going stale.
+    return quote_etag(f"{household.pk}:{household.data_version}:{timezone.localdate().isoformat()}")
+
+
+def household_data_conditional(view_func):
+    """Answer 304 Not Modified while the household's data version matches the client's copy.
+
+    The check runs right after the current household is resolved, before the
+    view's own queries and templates. Successful responses carry the ETag and
+    ``Cache-Control: private, no-cache`` so browsers revalidate every refresh.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        household, redirect_response = _get_current_household_or_redirect(request)
+        if redirect_response is not None or household is None:
+            return view_func(request, *args, **kwargs)
+        etag = _household_data_etag(household)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        # The current household comes from the session; full pages and fragments share URLs.
+        patch_vary_headers(response, ("Cookie", "HX-Request"))
+        return response
+
+    return wrapper
+
+
 def _get_account_or_404(household, pk) -> Account:
     return get_object_or_404(Account, pk=pk, household=household)
 
@@ -84,24 +143,50 @@ def _table_copy() -> dict[str, str]:
 
 def _accounts_table_component_context(request, household) -> dict:
     accounts = Account.objects.for_household(household)
-    rows = serialize_account_rows(accounts)
+    row_fragments = account_row_fragments(accounts)
+    rows = [fragment.row for fragment in row_fragments]
     copy = _table_copy()
     return {
         "rows": rows,
+        "row_fragments": row_fragments,
         "has_accounts": bool(rows),
+        "refresh_url": reverse("financial:accounts-table"),
         "add_account_url": reverse("financial:accounts-new"),
         "empty_state_title": copy["empty_state_title"],
         "empty_state_body": copy["empty_state_body"],
     }
 
 
+def _render_accounts_table_update(request, household, *, account_id, before_key, after) -> str:
+    """Out-of-band markup syncing #accounts-table with a change to one account.
+
+    Only the affected rows are rendered; the whole table is re-rendered when
+    the change moves a row or empties the table.
+    """
+
+    patches = diff_account_rows(household, account_id=account_id, before_key=before_key, after=after)
+    if patches is None:
+        return render_to_string(
+            "components/financial/accounts_table.html",
+            {
+                **_accounts_table_component_context(request, household),
+                "swap_oob": True,
+            },
+            request=request,
+        )
+    return render_to_string(
+        "components/financial/account_row_patches.html",
+        {"patches": patches},
+        request=request,
+    )
+
+
 def _render_preview_response(
     request,
     household,
     account: Account,
     *,
-    include_row_oob: bool = False,
-    include_table_oob: bool = False,
+    table_update_html: str = "",
     status: int = 200,
 ) -> HttpResponse:
     preview_html = render_to_string(
@@ -112,24 +197,7 @@ def _render_preview_response(
         },
         request=request,
     )
-    if include_row_oob:
-        row_html = render_to_string(
-            "components/financial/account_row.html",
-            {"row": AccountSummaryRow.from_account(account), "swap_oob": True},
-            request=request,
-        )
-        preview_html += row_html
-    if include_table_oob:
-        table_html = render_to_string(
-            "components/financial/accounts_table.html",
-            {
-                **_accounts_table_component_context(request, household),
-                "swap_oob": True,
-            },
-            request=request,
-        )
-        preview_html += table_html
-    return HttpResponse(preview_html, status=status)
+    return HttpResponse(preview_html + table_update_html, status=status)
 
 
 def _render_accounts_table_fragment(request) -> str:
@@ -141,12 +209,92 @@ def _render_accounts_table_fragment(request) -> str:
     )
 
 
-def _transactions_body_context(account: Account) -> dict:
-    transactions = Transaction.objects.for_account(account).ordered()
-    rows = serialize_transaction_rows(transactions)
+def _transactions_body_context(
+    account: Account,
+    *,
+    cursor: str | None = None,
+    filters: TransactionFilters | None = None,
+) -> dict:
+    filters = filters or TransactionFilters()
+    queryset = Transaction.objects.for_account(account)
+    archived = ArchivedTransaction.objects.for_account(account)
+    page = paginate_transactions(
+        filters.apply(queryset),
+        archived=filters.apply_to_archive(archived),
+        cursor=cursor,
+        # A running balance only adds up over the unfiltered ledger.
+        closing_balance=None if filters.is_active else account.ledger_balance,
+    )
+    body_url = reverse("financial:account-transactions-body", args=[account.id])
+    next_page_url = None
+    if page.next_cursor is not None:
+        next_page_url = f"{body_url}?{urlencode({**filters.to_query_params(), 'cursor': page.next_cursor})}"
+    context = {
+        "transaction_rows": page.rows,
+        "has_transactions": bool(page.rows),
+        "transactions_next_page_url": next_page_url,
+        "transactions_filter_url": body_url,
+        "transaction_filters": filters,
+    }
+    if cursor is None:
+        context["transaction_facets"] = transaction_facets(queryset, filters, archived=archived)
+    return context
+
+
+def _search_next_page_url(search_url: str, query: str, next_cursor: str | None) -> str | None:
+    if next_cursor is None:
+        return None
+    return f"{search_url}?{urlencode({'q': query, 'cursor': next_cursor})}"
+
+
+def _transactions_search_context(account: Account, query: str, *, cursor: str | None = None) -> dict:
+    page = search_transactions(
+        Transaction.objects.for_account(account),
+        query,
+        archived=ArchivedTransaction.objects.for_account(account),
+        cursor=cursor,
+    )
+    search_url = reverse("financial:account-transactions-search", args=[account.id])
+    return {
+        "transaction_rows": page.rows,
+        "has_transactions": bool(page.rows),
+        "transactions_next_page_url": _search_next_page_url(search_url, query, page.next_cursor),
+        "search_query": query,
+    }
+
+
+def _household_ledger_context(household, *, cursor: str | None = None) -> dict:
+    page = paginate_transactions(
+        Transaction.objects.for_household(household),
+        archived=ArchivedTransaction.objects.for_household(household),
+        cursor=cursor,
+        extra_fields=HOUSEHOLD_ROW_FIELDS,
+    )
+    next_page_url = None
+    if page.next_cursor is not None:
+        body_url = reverse("financial:transactions-body")
+        next_page_url = f"{body_url}?{urlencode({'cursor': page.next_cursor})}"
     return {
-        "transaction_rows": rows,
-        "has_transactions": bool(rows),
+        "transaction_rows": page.rows,
+        "has_transactions": bool(page.rows),
+        "transactions_next_page_url": next_page_url,
+    }
+
+
+def _household_search_context(household, query: str, *, cursor: str | None = None) -> dict:
+    page = search_transactions(
+        Transaction.objects.for_household(household),
+        query,
+        archived=ArchivedTransaction.objects.for_household(household),
+        cursor=cursor,
+        extra_fields=HOUSEHOLD_ROW_FIELDS,
+    )
+    search_url = reverse("financial:transactions-search")
+    return {
+        "transaction_rows": page.rows,
+        "has_transactions": bool(page.rows),
+        "transactions_next_page_url": _search_next_page_url(search_url, query, page.next_cursor),
+        "search_query": query,
     }
 
 
@@ -162,8 +310,14 @@ def _actual_payment_total_from_rows(rows) -> Decimal:
     return total_amount
 
 
-def _render_transactions_body(request, account: Account, *, status: int = 200) -> HttpResponse:
-    context = _transactions_body_context(account)
+def _render_transactions_body(
+    request,
+    account: Account,
+    *,
+    status: int = 200,
+    filters: TransactionFilters | None = None,
+) -> HttpResponse:
+    context = _transactions_body_context(account, filters=filters)
     return render(
         request,
         "financial/accounts/transactions/_body.html",
@@ -172,6 +326,20 @@ def _render_transactions_body(request, account: Account, *, status: int = 200) -
     )
 
 
+def _render_transactions_page(request, account: Account, cursor: str, filters: TransactionFilters) -> HttpResponse:
+    try:
+        context = _transactions_body_context(account, cursor=cursor, filters=filters)
+    except TransactionCursorError:
+        return HttpResponse("Invalid transactions cursor.", status=400)
+    return render(request, "financial/accounts/transactions/_rows.html", context)
+
+
+def _transactions_csv_response(queryset, filename: str, *, archived=None) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(iter_transaction_csv(queryset, archived=archived), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 def _render_transactions_missing(request, account_id) -> HttpResponse:
     return render(
         request,
@@ -188,6 +356,7 @@ def _bill_pay_context(request, household, *, month_param: str | None = None) ->
     total_amount = _actual_payment_total_from_rows(rows)
     return {
         "rows": rows,
+        "row_fragments": bill_pay_row_fragments(rows),
         "has_rows": bool(rows),
         "selected_month": month_to_query_value(selected_month),
         "table_body_id": BILL_PAY_TABLE_BODY_ID,
@@ -483,6 +652,9 @@ class AccountsIndexView(LoginRequiredMixin, UserAccountQuerysetMixin, ListView):
         table_context = _accounts_table_component_context(self.request, household)
         context.update(
             account_rows=table_context["rows"],
+            account_row_fragments=table_context["row_fragments"],
+            accounts_table_url=table_context["refresh_url"],
+            household_summary=household_summary(household),
             has_accounts=table_context["has_accounts"],
             add_account_url=table_context["add_account_url"],
             empty_state_title=table_context["empty_state_title"],
@@ -503,6 +675,16 @@ class AccountsIndexView(LoginRequiredMixin, UserAccountQuerysetMixin, ListView):
         return super().dispatch(request, *args, **kwargs)
 
 
+@login_required
+@require_http_methods(["GET"])
+@household_data_conditional
+def accounts_table(request):
+    _, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    return HttpResponse(_render_accounts_table_fragment(request))
+
+
 @login_required
 @require_http_methods(["GET"])
 def bill_pay_index(request):
@@ -519,6 +701,7 @@ def bill_pay_index(request):
 
 @login_required
 @require_http_methods(["GET"])
+@household_data_conditional
 def bill_pay_table_body(request):
     household, redirect_response = _get_current_household_or_redirect(request)
     if redirect_response is not None:
@@ -757,7 +940,12 @@ class AccountDetailView(LoginRequiredMixin, UserAccountQuerysetMixin, DetailView
             page_title=self.object.name,
             preview=build_account_preview(self.object),
             transactions_new_url=reverse("financial:account-transactions-new", args=[self.object.id]),
+            transactions_bulk_url=reverse("financial:account-transactions-bulk", args=[self.object.id]),
+            transactions_import_url=reverse("financial:account-transactions-import", args=[self.object.id]),
+            transactions_transfer_url=reverse("financial:account-transactions-transfer", args=[self.object.id]),
             transactions_body_url=reverse("financial:account-transactions-body", args=[self.object.id]),
+            transactions_search_url=reverse("financial:account-transactions-search", args=[self.object.id]),
+            transactions_export_url=reverse("financial:account-transactions-export", args=[self.object.id]),
             **transactions_context,
         )
         return context
@@ -818,10 +1006,19 @@ def account_edit(request, pk):
             },
         )
 
+    # Validation writes the posted values onto the instance, so take the rendered key first.
+    before_key = account_order_key(account)
     form = AccountForm(request.POST, instance=account, user=request.user)
     if form.is_valid():
         account = form.save()
-        return _render_preview_response(request, household, account, include_table_oob=True)
+        table_update_html = _render_accounts_table_update(
+            request,
+            household,
+            account_id=account.pk,
+            before_key=before_key,
+            after=account,
+        )
+        return _render_preview_response(request, household, account, table_update_html=table_update_html)
 
     return render(
         request,
@@ -878,14 +1075,15 @@ def account_delete(request, pk):
             status=404,
         )
 
+    account_id = account.pk
+    before_key = account_order_key(account)
     account.delete()
-    table_html = render_to_string(
-        "components/financial/accounts_table.html",
-        {
-            **_accounts_table_component_context(request, household),
-            "swap_oob": True,
-        },
-        request=request,
+    table_html = _render_accounts_table_update(
+        request,
+        household,
+        account_id=account_id,
+        before_key=before_key,
+        after=None,
     )
     preview_reset = render_to_string(
         "financial/accounts/_preview_empty.html",
@@ -896,6 +1094,7 @@ def account_delete(request, pk):
 
 @login_required
 @require_http_methods(["GET"])
+@household_data_conditional
 def account_transactions_body(request, pk):
     household, redirect_response = _get_current_household_or_redirect(request)
     if redirect_response is not None:
@@ -903,7 +1102,164 @@ def account_transactions_body(request, pk):
     account = _get_account_for_transactions(request, household, pk)
     if account is None:
         return _render_transactions_missing(request, pk)
-    return _render_transactions_body(request, account)
+    try:
+        filters = TransactionFilters.from_query_params(request.GET)
+    except TransactionFilterError as exc:
+        return HttpResponse(escape(str(exc)), status=400)
+    cursor = request.GET.get("cursor")
+    if cursor:
+        return _render_transactions_page(request, account, cursor, filters)
+    return _render_transactions_body(request, account, filters=filters)
+
+
+@login_required
+@require_http_methods(["GET"])
+def account_transactions_search(request, pk):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    account = _get_account_for_transactions(request, household, pk)
+    if account is None:
+        return _render_transactions_missing(request, pk)
+    query = normalize_search_query(request.GET.get("q"))
+    if not query:
+        return _render_transactions_body(request, account)
+    cursor = request.GET.get("cursor")
+    try:
+        context = _transactions_search_context(account, query, cursor=cursor)
+    except TransactionCursorError:
+        return HttpResponse("Invalid transactions cursor.", status=400)
+    template_name = "_rows.html" if cursor else "_body.html"
+    return render(request, f"financial/accounts/transactions/{template_name}", context)
+
+
+SPENDING_DEFAULT_MONTHS = 6
+
+
+def _spending_month_range(start_param: str | None, end_param: str | None) -> tuple:
+    end = parse_month_param(end_param)
+    if start_param:
+        start = parse_month_param(start_param)
+    else:
+        start_index = end.year * 12 + end.month - SPENDING_DEFAULT_MONTHS
+        start = date(start_index // 12, start_index % 12 + 1, 1)
+    if start > end:
+        raise ValueError("Start month must be on or before end month.")
+    return start, end
+
+
+@login_required
+@require_http_methods(["GET"])
+def spending_index(request):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    status = 200
+    spending_error = None
+    try:
+        start, end = _spending_month_range(request.GET.get("start"), request.GET.get("end"))
+    except ValueError as exc:
+        start, end = _spending_month_range(None, None)
+        spending_error = str(exc)
+        status = 400
+    report = category_spending(household, start=start, end=end)
+    context = {
+        "page_title": "Spending",
+        "report": report,
+        "has_rows": bool(report.rows),
+        "start_month": month_to_query_value(start),
+        "end_month": month_to_query_value(end),
+        "spending_error": spending_error,
+    }
+    return render(request, "financial/spending/index.html", context, status=status)
+
+
+@login_required
+@require_http_methods(["GET"])
+def transactions_index(request):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    context = _household_ledger_context(household)
+    context.update(
+        page_title="Household Ledger",
+        transactions_body_url=reverse("financial:transactions-body"),
+        transactions_search_url=reverse("financial:transactions-search"),
+        transactions_export_url=reverse("financial:transactions-export"),
+    )
+    return render(request, "financial/transactions/index.html", context)
+
+
+@login_required
+@require_http_methods(["GET"])
+@household_data_conditional
+def transactions_body(request):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    cursor = request.GET.get("cursor")
+    try:
+        context = _household_ledger_context(household, cursor=cursor)
+    except TransactionCursorError:
+        return HttpResponse("Invalid transactions cursor.", status=400)
+    template_name = "_rows.html" if cursor else "_body.html"
+    return render(request, f"financial/transactions/{template_name}", context)
+
+
+@login_required
+@require_http_methods(["GET"])
+def transactions_export(request):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    if household is None:
+        return HttpResponse(status=404)
+    filename = f"{slugify(household.name) or 'household'}-transactions.csv"
+    return _transactions_csv_response(
+        Transaction.objects.for_household(household),
+        filename,
+        archived=ArchivedTransaction.objects.for_household(household),
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+def transactions_search(request):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    query = normalize_search_query(request.GET.get("q"))
+    cursor = request.GET.get("cursor")
+    try:
+        if query:
+            context = _household_search_context(household, query, cursor=cursor)
+        else:
+            context = _household_ledger_context(household, cursor=cursor)
+    except TransactionCursorError:
+        return HttpResponse("Invalid transactions cursor.", status=400)
+    template_name = "_rows.html" if cursor else "_body.html"
+    return render(request, f"financial/transactions/{template_name}", context)
+
+
+@login_required
+@require_http_methods(["GET"])
+def account_transactions_export(request, pk):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    account = _get_account_for_transactions(request, household, pk)
+    if account is None:
+        raise Http404("Account not found.")
+    try:
+        filters = TransactionFilters.from_query_params(request.GET)
+    except TransactionFilterError as exc:
+        return HttpResponse(escape(str(exc)), status=400)
+    filename = f"{slugify(account.name) or 'account'}-transactions.csv"
+    return _transactions_csv_response(
+        filters.apply(Transaction.objects.for_account(account)),
+        filename,
+        archived=filters.apply_to_archive(ArchivedTransaction.objects.for_account(account)),
+    )
 
 
 @login_required
@@ -962,6 +1318,115 @@ def account_transactions_new(request, pk):
     )
 
 
+@login_required
+@require_http_methods(["GET", "POST"])
+def account_transactions_bulk(request, pk):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    account = _get_account_for_transactions(request, household, pk)
+    if account is None:
+        return _render_transactions_missing(request, pk)
+
+    context = {
+        "post_hx_url": reverse("financial:account-transactions-bulk", args=[account.id]),
+        "cancel_hx_url": reverse("financial:account-transactions-body", args=[account.id]),
+    }
+    if request.method == "GET":
+        context["formset"] = bulk_transaction_formset(account, request.user)
+        return render(request, "financial/accounts/transactions/_bulk_form.html", context)
+
+    formset = bulk_transaction_formset(account, request.user, data=request.POST)
+    if formset.is_valid():
+        rows = [form.cleaned_data for form in formset.forms if form.cleaned_data]
+        create_bulk_transactions(account, rows, user=request.user)
+        return _render_transactions_body(request, account)
+
+    context["formset"] = formset
+    return render(request, "financial/accounts/transactions/_bulk_form.html", context, status=422)
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def account_transactions_import(request, pk):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    account = _get_account_for_transactions(request, household, pk)
+    if account is None:
+        return _render_transactions_missing(request, pk)
+
+    context = {
+        "post_hx_url": reverse("financial:account-transactions-import", args=[account.id]),
+        "cancel_hx_url": reverse("financial:account-transactions-body", args=[account.id]),
+        "summary_message": "",
+        "import_errors": [],
+    }
+    if request.method == "GET":
+        context["form"] = TransactionImportForm()
+        return render(request, "financial/accounts/transactions/_import_form.html", context)
+
+    form = TransactionImportForm(request.POST, request.FILES)
+    if not form.is_valid():
+        context["form"] = form
+        return render(request, "financial/accounts/transactions/_import_form.html", context, status=422)
+
+    try:
+        result = import_transactions_from_csv(
+            uploaded_file=form.cleaned_data["import_file"],
+            account=account,
+            user=request.user,
+        )
+    except TransactionImportValidationError as exc:
+        context.update(form=form, import_errors=exc.errors)
+        return render(request, "financial/accounts/transactions/_import_form.html", context, status=422)
+
+    summary_message = f"Imported {result.imported_rows} of {result.total_rows} rows."
+    if result.duplicate_rows:
+        summary_message += f" Skipped {result.duplicate_rows} already imported."
+    context.update(form=TransactionImportForm(), summary_message=summary_message)
+    return render(request, "financial/accounts/transactions/_import_form.html", context)
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def account_transactions_transfer(request, pk):
+    household, redirect_response = _get_current_household_or_redirect(request)
+    if redirect_response is not None:
+        return redirect_response
+    account = _get_account_for_transactions(request, household, pk)
+    if account is None:
+        return _render_transactions_missing(request, pk)
+
+    context = {
+        "post_hx_url": reverse("financial:account-transactions-transfer", args=[account.id]),
+        "cancel_hx_url": reverse("financial:account-transactions-body", args=[account.id]),
+        "from_account": account,
+        "transfer_error": "",
+    }
+    if request.method == "GET":
+        context["form"] = TransferForm(initial={"posted_on": timezone.localdate()}, from_account=account)
+        return render(request, "financial/accounts/transactions/_transfer_form.html", context)
+
+    form = TransferForm(request.POST, from_account=account)
+    if form.is_valid():
+        try:
+            record_transfer(
+                from_account=account,
+                to_account=form.cleaned_data["to_account"],
+                amount=form.cleaned_data["amount"],
+                posted_on=form.cleaned_data["posted_on"],
+                description=form.cleaned_data["description"],
+            )
+        except TransferError as exc:
+            context["transfer_error"] = str(exc)
+        else:
+            return _render_transactions_body(request, account)
+
+    context["form"] = form
+    return render(request, "financial/accounts/transactions/_transfer_form.html", context, status=422)
+
+
 @login_required
 @require_http_methods(["GET", "POST"])
 def account_transactions_edit(request, pk, transaction_id):
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 03:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('households', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='household',
+            name='data_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text="Incremented on every write to this household's financial data; HTMX fragments use it as their ETag."),
+        ),
+    ]
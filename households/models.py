@@ -3,7 +3,7 @@ import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
 
 
 class Household(models.Model):
@@ -22,6 +22,11 @@ class Household(models.Model):
 	)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
+	data_version = models.PositiveBigIntegerField(
+		default=0,
+		editable=False,
+		help_text="Incremented on every write to this household's financial data; HTMX fragments use it as their ETag.",
+	)
 
 	class Meta:
 		ordering = ("name", "created_at")
@@ -29,6 +34,12 @@ class Household(models.Model):
 	def __str__(self):
 		return self.name
 
+	@classmethod
+	def bump_data_version(cls, household_ids) -> None:
+		ids = {pk for pk in household_ids if pk is not None}
+		if ids:
+			cls.objects.filter(pk__in=ids).update(data_version=F("data_version") + 1)
+
 
 class HouseholdMember(models.Model):
 	class Role(models.TextChoices):
@@ -8,6 +8,8 @@ from households.models import Household, HouseholdMember
 
 
 CURRENT_HOUSEHOLD_SESSION_KEY = "current_household_id"
+# Resolved once per request; views, decorators and the context processor share the result.
+_REQUEST_HOUSEHOLD_ATTR = "_current_household_context"
 
 
 @dataclass(frozen=True)
@@ -36,6 +38,7 @@ def get_user_households(user):
 
 
 def set_current_household(request, household: Household | None) -> None:
+    request.__dict__.pop(_REQUEST_HOUSEHOLD_ATTR, None)
     if household is None:
         request.session.pop(CURRENT_HOUSEHOLD_SESSION_KEY, None)
         return
@@ -43,6 +46,14 @@ def set_current_household(request, household: Household | None) -> None:
 
 
 def resolve_current_household(request) -> HouseholdContext:
+    context = getattr(request, _REQUEST_HOUSEHOLD_ATTR, None)
+    if context is None:
+        context = _resolve_current_household(request)
+        setattr(request, _REQUEST_HOUSEHOLD_ATTR, context)
+    return context
+
+
+def _resolve_current_household(request) -> HouseholdContext:
     if not request.user.is_authenticated:
         return HouseholdContext(household=None)
 
@@ -5,6 +5,7 @@ from django.http import HttpResponse
 from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 
+from financial.services.summary import household_summary
 from households.services.households import can_switch_to_household, resolve_current_household, set_current_household
 
 
@@ -32,8 +33,14 @@ class HouseholdHomeView(LoginRequiredMixin, TemplateView):
             return context.redirect
         if context.household is None:
             return redirect("household:no-household-access")
+        self.household = context.household
         return super().dispatch(request, *args, **kwargs)
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["household_summary"] = household_summary(self.household)
+        return context
+
 
 @login_required
 def no_household_access(request):